@@ -0,0 +1,224 @@
+import argparse
+import glob
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# Add the parent directory to sys.path so we can import the package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from deflection_tool.interface.input_parser import InputParser
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.solver import Solver
+from deflection_tool.core.loads import PointLoad, MomentLoad, DistributedLoad, TorsionLoad, AxialLoad
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+EXAMPLES_DIR = os.path.join(BENCH_DIR, '..', 'examples')
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+
+LOAD_COUNTS = (1, 10, 100, 1000, 10000)
+GRID_SIZES = (10**3, 10**4, 10**5, 10**6)
+# Synthetic cases above this loads * points product only run with --full
+WORK_BUDGET = 10**8
+
+PHASES = ('aggregate_loads', 'solve_bending', 'solve_torsion', 'solve_axial')
+
+
+def time_call(func, min_time=0.2, max_repeats=50):
+    """
+    Best-of-N wall time of func(), repeating until min_time has elapsed.
+    """
+    best = float('inf')
+    elapsed = 0.0
+    repeats = 0
+    while repeats < max_repeats and (elapsed < min_time or repeats < 3):
+        start = time.perf_counter()
+        func()
+        dt = time.perf_counter() - start
+        best = min(best, dt)
+        elapsed += dt
+        repeats += 1
+        if dt > min_time:
+            break
+    return best
+
+
+def peak_memory(func):
+    """
+    Peak traced allocation (bytes) during one call of func(). NumPy array buffers
+    are reported to tracemalloc, so this covers the solver's arrays.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def synthetic_beam(num_loads, seed=0):
+    """
+    Simply supported 1 m shaft with a reproducible mix of all concentrated load types
+    plus one distributed load.
+    """
+    rng = np.random.default_rng(seed)
+    beam = Beam(1.0, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}})
+    kinds = (PointLoad, PointLoad, MomentLoad, TorsionLoad, AxialLoad)
+    positions = rng.uniform(0, 1, num_loads)
+    magnitudes = rng.uniform(-1000, 1000, num_loads)
+    for i in range(num_loads - 1):
+        beam.add_load(kinds[i % len(kinds)](positions[i], magnitudes[i]))
+    beam.add_load(DistributedLoad(0.2, 0.8, magnitudes[-1]))
+    return beam
+
+
+def bench_solver(beam, num_points, min_time):
+    solver = Solver(beam, num_points=num_points)
+    result = {'num_points': num_points, 'num_loads': len(beam.loads)}
+
+    def full_solve():
+        # Forget the aggregated loads, or solve() would only re-integrate
+        solver.reset_distributions()
+        solver.solve()
+
+    def incremental_solve():
+        # One edited load per solve: the update_loads() path
+        load.magnitude = -load.magnitude
+        solver.solve()
+
+    result['solve_s'] = time_call(full_solve, min_time)
+    load = beam.loads[0]
+    magnitude = load.magnitude
+    solver.solve()
+    result['incremental_solve_s'] = time_call(incremental_solve, min_time)
+    load.magnitude = magnitude
+    for phase in PHASES:
+        result[f'{phase}_s'] = time_call(getattr(solver, phase), min_time)
+    result['solves_per_sec'] = 1.0 / result['solve_s']
+    result['points_per_sec'] = num_points / result['solve_s']
+    result['peak_bytes'] = peak_memory(Solver(beam, num_points=num_points).solve)
+    return result
+
+
+def run(full=False, min_time=0.2):
+    cases = {}
+
+    for path in sorted(glob.glob(os.path.join(EXAMPLES_DIR, '*.json'))):
+        name = f"example/{os.path.splitext(os.path.basename(path))[0]}"
+        parse_s = time_call(lambda: InputParser.parse_json(path), min_time)
+        result = bench_solver(InputParser.parse_json(path), 1000, min_time)
+        result['parse_json_s'] = parse_s
+        cases[name] = result
+        print(f"{name:40s} solve {result['solve_s'] * 1e3:9.3f} ms  "
+              f"incremental {result['incremental_solve_s'] * 1e3:9.3f} ms  parse {parse_s * 1e6:8.1f} us")
+
+    for num_loads in LOAD_COUNTS:
+        beam = synthetic_beam(num_loads)
+        for num_points in GRID_SIZES:
+            if not full and num_loads * num_points > WORK_BUDGET:
+                continue
+            name = f"synthetic/loads={num_loads}/points={num_points}"
+            result = bench_solver(beam, num_points, min_time)
+            cases[name] = result
+            print(f"{name:40s} solve {result['solve_s'] * 1e3:9.3f} ms  "
+                  f"incremental {result['incremental_solve_s'] * 1e3:9.3f} ms  "
+                  f"peak {result['peak_bytes'] / 2**20:8.1f} MiB")
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'full': full,
+        },
+        'cases': cases,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns the (case, metric, baseline, current) tuples where a timing or the peak
+    memory grew beyond threshold x baseline. Cases missing from either side are ignored.
+    """
+    regressions = []
+    for name, current in results['cases'].items():
+        reference = baseline.get('cases', {}).get(name)
+        if reference is None:
+            continue
+        for metric, value in current.items():
+            tracked = metric.endswith('_s') or metric == 'peak_bytes'
+            if tracked and metric in reference and value > threshold * reference[metric]:
+                regressions.append((name, metric, reference[metric], value))
+    return regressions
+
+
+# Metadata that must match for timings to be comparable with the baseline
+COMPARABLE_META = ('machine', 'processor', 'python', 'numpy', 'full')
+
+
+def meta_mismatch(results, baseline):
+    """
+    Returns the COMPARABLE_META keys whose values differ between results and baseline.
+    """
+    current, reference = results.get('meta', {}), baseline.get('meta', {})
+    return [key for key in COMPARABLE_META if current.get(key) != reference.get(key)]
+
+
+def save_baseline(results, path):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Baseline saved to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark InputParser and Solver")
+    parser.add_argument('--out', default='bench_results.json', help='Where to write the results JSON')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline results to compare against')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Store these results as the new baseline (done automatically on the first run)')
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help='Flag timings slower than threshold x baseline (default 1.5)')
+    parser.add_argument('--full', action='store_true',
+                        help=f'Also run synthetic cases above {WORK_BUDGET:.0e} loads x points')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum timed seconds per measurement')
+    args = parser.parse_args()
+
+    results = run(full=args.full, min_time=args.min_time)
+    with open(args.out, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.out}")
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        return
+
+    if not os.path.exists(args.baseline):
+        # Timings are machine-specific, so no baseline ships with the package: the
+        # first run on a machine records it and later runs are checked against it
+        print("No baseline found; this run is the baseline for the next ones.")
+        save_baseline(results, args.baseline)
+        return
+
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+    mismatch = meta_mismatch(results, baseline)
+    if mismatch:
+        print("Warning: baseline recorded with a different " + ', '.join(mismatch) +
+              "; rerun with --save-baseline on this setup for a meaningful comparison.")
+    regressions = compare(results, baseline, args.threshold)
+    for name, metric, before, after in regressions:
+        print(f"REGRESSION {name} {metric}: {before:.4g} -> {after:.4g} ({after / before:.2f}x)")
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions beyond {args.threshold}x baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,24 @@
+import numpy as np
+
 from .materials import Material
 from .profiles import Profile
+from .loads import LoadCollection
+
+# Section properties tabulated per segment for vectorized lookup
+SECTION_PROPERTIES = ('I', 'J', 'A', 'y_max')
 
 class Beam:
     def __init__(self, length, material, profile, supports=None):
+        """
+        Args:
+            length (float): Beam length [m].
+            material (Material, dict or str): Material or its name in the database.
+            profile (Profile, dict or list): One section for the whole length, or a
+                stepped shaft as a list of segments from x=0 onwards, each
+                {'end': x, 'type': ..., 'dimensions': {...}} or (end, Profile).
+                Ends increase strictly and the last one equals length.
+            supports (list): Support dicts for the fem engine.
+        """
         self.length = length
         
         # Load Material
@@ -11,19 +27,124 @@ class Beam:
         else:
             self.material = material  # Assume already a Material object
             
-        # Load Profile
-        if isinstance(profile, dict):
-             # Expects {'type': '...', 'dimensions': {...}}
-             self.profile = Profile(profile['type'], profile['dimensions'])
-        else:
-             self.profile = profile
+        # Load Profile (or the profiles of a stepped shaft)
+        self.profile = profile
 
         self.supports = supports if supports else []
         self.loads = []
 
+    @property
+    def profile(self):
+        """
+        Section of a uniform beam; the first segment's for a stepped one. Assigning
+        a profile (or a list of segments) replaces all segments.
+        """
+        return self._segments[0][2]
+
+    @profile.setter
+    def profile(self, profile):
+        if isinstance(profile, (list, tuple)):
+            self.segments = profile
+        else:
+            self.segments = [(self.length, profile)]
+
+    @property
+    def segments(self):
+        """
+        Tuple of (start, end, Profile) covering [0, length], one per section.
+        """
+        return self._segments
+
+    @segments.setter
+    def segments(self, segments):
+        parsed = []
+        for segment in segments:
+            if isinstance(segment, dict):
+                end = segment['end']
+                profile = segment.get('profile') or {'type': segment['type'],
+                                                     'dimensions': segment['dimensions']}
+            else:
+                end, profile = segment
+            if isinstance(profile, dict):
+                # Expects {'type': '...', 'dimensions': {...}}
+                profile = Profile(profile['type'], profile['dimensions'])
+            parsed.append((end, profile))
+        if not parsed:
+            raise ValueError("A beam needs at least one profile.")
+        ends = [end for end, _ in parsed]
+        # The steps: strictly increasing and strictly inside the span
+        for previous, end in zip([0.0] + ends, ends[:-1]):
+            if not previous < end < self.length:
+                raise ValueError(f"Segment ends must increase strictly from 0 to the beam length "
+                                 f"{self.length}, got {ends}.")
+        if not np.isclose(ends[-1], self.length, rtol=1e-12, atol=0):
+            raise ValueError(f"The last segment must end at the beam length {self.length}, got {ends[-1]}.")
+
+        starts = [0.0] + [end for end, _ in parsed[:-1]]
+        ends = [end for end, _ in parsed[:-1]] + [self.length]
+        self._segments = tuple((start, end, profile) for start, end, (_, profile)
+                               in zip(starts, ends, parsed))
+        # Lookup tables: the segment of x is the first whose end is >= x
+        self._segment_ends = np.array(ends[:-1], dtype=float)
+        self._section_table = {prop: np.array([getattr(profile, prop, 0.0) for _, _, profile in self._segments],
+                                              dtype=float)
+                               for prop in SECTION_PROPERTIES}
+
+    @property
+    def stepped(self):
+        """True if the section changes along the beam."""
+        return len(self._segments) > 1
+
+    @property
+    def steps(self):
+        """Positions where the section changes."""
+        return [end for _, end, _ in self._segments[:-1]]
+
+    def segment_index(self, x):
+        """
+        Segment of every position in x; a step belongs to the segment on its left.
+        Steps are compared in the precision of x, so a float32 grid node placed at
+        a step is matched exactly too.
+        """
+        x = np.asarray(x)
+        ends = self._segment_ends
+        if np.issubdtype(x.dtype, np.floating):
+            ends = ends.astype(x.dtype)
+        return np.searchsorted(ends, x, side='left')
+
+    def section_properties(self, x):
+        """
+        I, J, A and y_max at every position in x, by vectorized segment lookup.
+
+        Returns:
+            dict: SECTION_PROPERTIES -> arrays shaped like x.
+        """
+        index = self.segment_index(x)
+        return {prop: table[index] for prop, table in self._section_table.items()}
+
+    @property
+    def loads(self):
+        """
+        LoadCollection of the applied loads. Assigning any list replaces it with a
+        new collection.
+        """
+        return self._loads
+
+    @loads.setter
+    def loads(self, loads):
+        self._loads = loads if isinstance(loads, LoadCollection) else LoadCollection(loads)
+
     def add_load(self, load):
         self.loads.append(load)
 
+    def remove_load(self, load):
+        """Removes this load object (matched by identity)."""
+        for i, held in enumerate(self.loads):
+            if held is load:
+                del self.loads[i]
+                return
+        raise ValueError("Load is not applied to this beam.")
+
     @property
     def E(self):
         return self.material.E
@@ -0,0 +1,169 @@
+import numpy as np
+
+from .loads import bending_plane
+from .solver import Solver, _point_moment_shapes, _moment_load_shapes, _integrate_bending
+
+# Positions evaluated per block, bounding memory to CHUNK_POSITIONS x num_points
+CHUNK_POSITIONS = 256
+
+
+class MovingLoadEnvelope:
+    """
+    Deflection and slope envelopes of a load group travelling along the beam.
+
+    The group is a list of point and moment loads whose `position` is an offset
+    from the group's reference point; as the reference point moves, loads that fall
+    off the span are dropped. For a block of positions every load's moment diagram
+    is built on the grid at once, as a (positions, num_points) array, and integrated
+    along the grid axis in one pass, so a sweep costs a few array operations per
+    block rather than one solve per position. Loads already on the beam are added as
+    a stationary (dead) load. When any load acts in the x-z plane, both planes are
+    integrated and the envelopes are of the resultant sqrt(y^2 + z^2).
+
+    Uses the simply supported model of the numerical engine.
+    """
+    def __init__(self, beam, loads, num_points=1000, include_static=True):
+        """
+        Args:
+            beam (Beam): Beam; its own loads are the stationary part.
+            loads (list): PointLoad / MomentLoad objects; position = offset from the
+                          group reference point.
+            num_points (int): Grid size.
+            include_static (bool): Add the response to beam.loads to every position.
+        """
+        for load in loads:
+            if load.type not in ('point', 'moment'):
+                raise ValueError(f"Moving loads must be point or moment loads, got '{load.type}'.")
+        self.beam = beam
+        self.loads = loads
+        solver = Solver(beam, num_points=num_points)
+        self.x = solver.x
+        # Scalar, or EI(x) on the grid for a stepped shaft
+        self._EI = solver.section_stiffness()[0]
+        self._two_planes = any(bending_plane(load) for load in loads)
+        if include_static and beam.loads:
+            static = solver.solve()
+            if 'deflection_planes' in static:
+                self._two_planes = True
+                # (plane, 1, num_points), broadcast against (plane, positions, num_points)
+                self._static = (static['slope_planes'][:, None], static['deflection_planes'][:, None])
+            elif self._two_planes:
+                # Dead load in x-y only; the x-z plane carries none of it
+                self._static = tuple(np.stack([static[field], np.zeros_like(static[field])])[:, None]
+                                     for field in ('slope', 'deflection'))
+            else:
+                self._static = (static['slope'], static['deflection'])
+        else:
+            self._static = (0.0, 0.0)
+
+    def responses(self, positions):
+        """
+        Slope and deflection for each reference position.
+
+        Returns:
+            tuple: (slope, deflection), each (len(positions), num_points).
+        """
+        x = self.x
+        L = self.beam.length
+        positions = np.asarray(positions, dtype=float)
+        M = np.zeros((2 if self._two_planes else 1, positions.size, x.size))
+        for load in self.loads:
+            a = positions + load.position
+            on_span = (a >= 0) & (a <= L)
+            if load.type == 'point':
+                shapes = _point_moment_shapes(x, a, L)
+            else:
+                shapes = _moment_load_shapes(x, a, L)
+            M[bending_plane(load)] += (load.magnitude * on_span)[:, None] * shapes
+        slope, deflection = _integrate_bending(M, x, self._EI, L)
+        slope, deflection = slope + self._static[0], deflection + self._static[1]
+        if self._two_planes:
+            return np.hypot(*slope), np.hypot(*deflection)
+        return slope[0], deflection[0]
+
+    def evaluate(self, positions=None, num_positions=201):
+        """
+        Envelopes over the given reference positions (default: num_positions evenly
+        spaced positions that move the whole group across the span).
+
+        Returns:
+            dict: 'x', 'positions', 'deflection_max', 'deflection_min', 'slope_max',
+                  'slope_min' (per grid station), 'deflection_max_position' and
+                  'deflection_min_position' (the reference position producing each
+                  envelope value), and 'critical': the position, station and signed
+                  value of the largest |deflection| and |slope|.
+        """
+        if positions is None:
+            offsets = [load.position for load in self.loads] or [0.0]
+            positions = np.linspace(-max(offsets), self.beam.length - min(offsets), num_positions)
+        positions = np.asarray(positions, dtype=float)
+
+        n = self.x.size
+        v_max = np.full(n, -np.inf)
+        v_min = np.full(n, np.inf)
+        s_max = np.full(n, -np.inf)
+        s_min = np.full(n, np.inf)
+        v_max_at = np.zeros(n)
+        v_min_at = np.zeros(n)
+
+        for start in range(0, positions.size, CHUNK_POSITIONS):
+            block = positions[start:start + CHUNK_POSITIONS]
+            slope, deflection = self.responses(block)
+
+            i = np.argmax(deflection, axis=0)
+            value = deflection[i, np.arange(n)]
+            better = value > v_max
+            v_max[better] = value[better]
+            v_max_at[better] = block[i[better]]
+
+            i = np.argmin(deflection, axis=0)
+            value = deflection[i, np.arange(n)]
+            better = value < v_min
+            v_min[better] = value[better]
+            v_min_at[better] = block[i[better]]
+
+            np.maximum(s_max, slope.max(axis=0), out=s_max)
+            np.minimum(s_min, slope.min(axis=0), out=s_min)
+
+        # Worst station: whichever envelope reaches further from zero
+        j_max, j_min = np.argmax(v_max), np.argmin(v_min)
+        j, value, at = ((j_max, v_max, v_max_at) if abs(v_max[j_max]) >= abs(v_min[j_min])
+                        else (j_min, v_min, v_min_at))
+        deflection = {'position': float(at[j]), 'x': float(self.x[j]), 'value': float(value[j])}
+        j = np.argmax(np.maximum(np.abs(s_max), np.abs(s_min)))
+        value = s_max[j] if abs(s_max[j]) >= abs(s_min[j]) else s_min[j]
+        slope = {'x': float(self.x[j]), 'value': float(value)}
+
+        return {
+            'x': self.x,
+            'positions': positions,
+            'deflection_max': v_max,
+            'deflection_min': v_min,
+            'slope_max': s_max,
+            'slope_min': s_min,
+            'deflection_max_position': v_max_at,
+            'deflection_min_position': v_min_at,
+            'critical': {'deflection': deflection, 'slope': slope},
+        }
+
+    def influence_line(self, station, positions=None, num_positions=201, field='deflection'):
+        """
+        Response at one station as the group moves: the influence line of `field`
+        at x = station. For a single unit load with include_static=False this is the
+        classic influence line.
+
+        Returns:
+            tuple: (positions, values)
+        """
+        if positions is None:
+            positions = np.linspace(0, self.beam.length, num_positions)
+        if field not in ('deflection', 'slope'):
+            raise ValueError(f"Influence lines are available for 'deflection' and 'slope', not '{field}'.")
+        positions = np.asarray(positions, dtype=float)
+        j = int(np.argmin(np.abs(self.x - station)))
+        values = np.empty(positions.size)
+        for start in range(0, positions.size, CHUNK_POSITIONS):
+            block = positions[start:start + CHUNK_POSITIONS]
+            slope, deflection = self.responses(block)
+            values[start:start + block.size] = (deflection if field == 'deflection' else slope)[:, j]
+        return positions, values
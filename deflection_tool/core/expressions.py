@@ -0,0 +1,78 @@
+import ast
+from functools import lru_cache
+
+import numpy as np
+
+# Functions usable in parametric expressions, as bare names or as np.<name>
+FUNCTIONS = {
+    name: getattr(np, name) for name in (
+        'sin', 'cos', 'tan', 'arcsin', 'arccos', 'arctan', 'sinh', 'cosh', 'tanh',
+        'exp', 'log', 'log10', 'sqrt', 'abs', 'minimum', 'maximum', 'where', 'clip',
+        'heaviside', 'sign', 'floor', 'ceil'
+    )
+}
+CONSTANTS = {'pi': np.pi, 'e': np.e}
+VARIABLES = ('x', 'L')
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.Call, ast.Name, ast.Load,
+    ast.Constant, ast.Attribute,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv, ast.USub, ast.UAdd,
+    ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq,
+)
+
+
+def _validate(tree, source):
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Unsupported syntax '{type(node).__name__}' in expression: {source}")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"Only numeric constants are allowed in expression: {source}")
+        if isinstance(node, ast.Attribute):
+            if not (isinstance(node.value, ast.Name) and node.value.id == 'np' and node.attr in FUNCTIONS):
+                raise ValueError(f"Unsupported attribute '{node.attr}' in expression: {source}")
+        if isinstance(node, ast.Name) and node.id not in VARIABLES + ('np',) \
+                and node.id not in FUNCTIONS and node.id not in CONSTANTS:
+            raise ValueError(f"Unknown name '{node.id}' in expression: {source}")
+        if isinstance(node, ast.Call) and node.keywords:
+            raise ValueError(f"Keyword arguments are not allowed in expression: {source}")
+
+
+class _FloatConstants(ast.NodeTransformer):
+    """
+    Replaces every numeric literal by a name bound to it as np.float64, so powers
+    and products of literals overflow to inf like array arithmetic instead of
+    building arbitrarily large Python integers (9**9**9 would never finish).
+    """
+    def __init__(self):
+        self.values = {}
+
+    def visit_Constant(self, node):
+        name = f'_c{len(self.values)}'
+        self.values[name] = np.float64(node.value)
+        return ast.copy_location(ast.Name(id=name, ctx=ast.Load()), node)
+
+
+@lru_cache(maxsize=256)
+def compile_expression(source):
+    """
+    Parses and validates a q(x) expression once and returns a vectorized callable f(x, L).
+
+    Only arithmetic, comparisons, the variables x and L, the constants pi and e, and
+    the NumPy functions in FUNCTIONS (bare or as np.<name>) are accepted. Numeric
+    literals are evaluated as float64. Compiled callables are cached by source string.
+    """
+    tree = ast.parse(source.strip(), mode='eval')
+    _validate(tree, source)
+    literals = _FloatConstants()
+    tree = ast.fix_missing_locations(literals.visit(tree))
+    code = compile(tree, '<parametric load>', 'eval')
+
+    namespace = {'__builtins__': {}, 'np': np, **FUNCTIONS, **CONSTANTS, **literals.values}
+
+    def f(x, L):
+        values = eval(code, namespace, {'x': x, 'L': L})
+        # Constants and comparisons come back as scalars/bools: broadcast to the grid
+        return np.broadcast_to(np.asarray(values, dtype=float), np.shape(x))
+
+    return f
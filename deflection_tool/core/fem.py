@@ -0,0 +1,282 @@
+import numpy as np
+from scipy.linalg import solveh_banded, LinAlgError
+
+from .loads import bending_plane, clip_to_span
+
+# Degrees of freedom per node: [v, theta, phi, u]
+DOFS = 4
+V, THETA, PHI, U = range(DOFS)
+# Half-bandwidth: an element couples the 4 DOFs of two consecutive nodes
+BANDWIDTH = 2 * DOFS - 1
+
+# 2-point Gauss rule on [0, 1], exact for q(x) * N(x) with linear q
+_GAUSS_XI = np.array([0.5 - 0.5 / np.sqrt(3), 0.5 + 0.5 / np.sqrt(3)])
+_GAUSS_W = np.array([0.5, 0.5])
+
+
+class BandedBeamSolver:
+    """
+    Finite element model of the beam that honours Beam.supports.
+
+    Bending uses Euler-Bernoulli (Hermite cubic) elements, torsion and axial use
+    linear bar elements. DOFs are numbered node by node, so the stiffness matrix is
+    symmetric banded with half-bandwidth 7 and is solved with a banded Cholesky
+    factorization: cost grows linearly with the number of elements.
+
+    Supports (dicts with 'type' and 'position'):
+        simple / pin / roller: v = 0
+        fixed:                 v = theta = 0
+        spring:                'stiffness' on v and optional 'rotational_stiffness' on theta
+    Bearings do not restrain twist or axial motion, so phi and u are held at the
+    first fixed support, or at the first support if none is fixed. Without any
+    supports the beam is simply supported at 0 and L, as in the numerical engine.
+
+    Sign conventions match Solver: EI v'' = M, with a positive point load giving
+    M = P b x / L on a simply supported span. Loads in the x-z plane (see
+    bending_plane) are a second right-hand side of the same factorization.
+
+    Hermite elements are exact at the nodes for point and couple loads, so the mesh
+    only needs exact nodes at supports and loads plus at most max_elements uniform
+    elements; the output grid is filled from the element shape functions. Finer
+    meshes do not help: the stiffness matrix condition number grows like n^4, and
+    round-off dominates beyond a few thousand elements.
+    """
+    def __init__(self, beam, x, max_elements=200):
+        self.beam = beam
+        self.output_x = None
+        self.supports = beam.supports or [
+            {'type': 'simple', 'position': 0.0},
+            {'type': 'simple', 'position': beam.length},
+        ]
+        nodes = [s['position'] for s in self.supports] + beam.steps
+        for load in beam.loads:
+            nodes.append(load.position)
+            if hasattr(load, 'end_pos'):
+                nodes.append(load.end_pos)
+        nodes = np.clip(nodes, 0, beam.length)
+        if len(x) > max_elements + 1:
+            self.output_x = np.union1d(x, nodes)
+            x = np.linspace(0, beam.length, max_elements + 1)
+        self.x = mesh_with_nodes(x, nodes)
+
+    def solve(self):
+        """
+        Returns:
+            dict: 'deflection', 'slope', 'twist', 'elongation' and 'x' at the mesh nodes,
+                  plus the internal 'moment', 'shear', 'torque' and 'axial' distributions.
+                  With x-z loads, deflection and slope are the y-z resultant, the planes
+                  are in 'deflection_planes' / 'slope_planes' (2, n) and the x-z
+                  moment and shear in 'moment_z' / 'shear_z'.
+        """
+        x = self.x
+        n = x.size
+        h = np.diff(x)
+        EI, GJ, EA = self._element_stiffness(x)
+
+        ab = np.zeros((BANDWIDTH + 1, n * DOFS))
+        # One load column per bending plane; torsion and axial go in the first
+        F = np.zeros((n * DOFS, 2))
+        self._assemble_bending(ab, h, EI)
+        self._assemble_bar(ab, h, GJ, PHI)
+        self._assemble_bar(ab, h, EA, U)
+        self._assemble_loads(F, h)
+        if np.any(GJ == 0):
+            # No torsional stiffness (e.g. rectangular profile): keep the system regular
+            if np.any(F[PHI::DOFS]):
+                raise ValueError("Torsional stiffness is zero but torque is applied.")
+            ab[BANDWIDTH, PHI::DOFS] = 1.0
+        self._apply_supports(ab, F)
+
+        two_planes = any(bending_plane(load) for load in self.beam.loads)
+        try:
+            d = solveh_banded(ab, F if two_planes else F[:, 0])
+        except LinAlgError:
+            raise ValueError("Beam is not sufficiently supported (stiffness matrix is singular).")
+        d = d.reshape(d.shape[0], -1)
+
+        v, theta = d[V::DOFS], d[THETA::DOFS]
+        phi, u = d[PHI::DOFS, 0], d[U::DOFS, 0]
+        results = {
+            "deflection": v[:, 0],
+            "slope": theta[:, 0],
+            "twist": phi,
+            "elongation": u,
+            "x": x,
+            "moment": self._nodal_moment(v[:, 0], theta[:, 0], h, EI),
+            "shear": self._nodal_shear(v[:, 0], theta[:, 0], h, EI),
+            "torque": _nodal_bar_force(phi, h, GJ),
+            "axial": _nodal_bar_force(u, h, EA),
+        }
+        if two_planes:
+            results["deflection_z"] = v[:, 1]
+            results["slope_z"] = theta[:, 1]
+            results["moment_z"] = self._nodal_moment(v[:, 1], theta[:, 1], h, EI)
+            results["shear_z"] = self._nodal_shear(v[:, 1], theta[:, 1], h, EI)
+        if self.output_x is not None:
+            results = self._interpolate(results, self.output_x)
+        if two_planes:
+            results["deflection_planes"] = np.stack((results["deflection"], results.pop("deflection_z")))
+            results["slope_planes"] = np.stack((results["slope"], results.pop("slope_z")))
+            results["deflection"] = np.hypot(*results["deflection_planes"])
+            results["slope"] = np.hypot(*results["slope_planes"])
+        return results
+
+    def _element_stiffness(self, x):
+        # EI, GJ, EA: scalars, or per element from the segment holding its midpoint
+        beam = self.beam
+        if not beam.stepped:
+            return beam.E * beam.I, beam.G * beam.J, beam.E * beam.profile.A
+        sections = beam.section_properties((x[:-1] + x[1:]) / 2)
+        return beam.E * sections['I'], beam.G * sections['J'], beam.E * sections['A']
+
+    def _interpolate(self, results, xo):
+        # Hermite cubic for v and theta, linear for everything else
+        x = self.x
+        e = np.clip(np.searchsorted(x, xo, side='right') - 1, 0, x.size - 2)
+        h = x[e + 1] - x[e]
+        s = (xo - x[e]) / h
+        out = {"x": xo}
+        for suffix in ('', '_z'):
+            if 'deflection' + suffix not in results:
+                continue
+            v, t = results['deflection' + suffix], results['slope' + suffix]
+            v1, v2, t1, t2 = v[e], v[e + 1], t[e] * h, t[e + 1] * h
+            out['deflection' + suffix] = ((1 - 3 * s**2 + 2 * s**3) * v1 + (s - 2 * s**2 + s**3) * t1
+                                          + (3 * s**2 - 2 * s**3) * v2 + (-s**2 + s**3) * t2)
+            out['slope' + suffix] = ((-6 * s + 6 * s**2) * v1 + (1 - 4 * s + 3 * s**2) * t1
+                                     + (6 * s - 6 * s**2) * v2 + (-2 * s + 3 * s**2) * t2) / h
+        for field in ('twist', 'elongation', 'moment', 'shear', 'torque', 'axial', 'moment_z', 'shear_z'):
+            if field in results:
+                out[field] = np.interp(xo, x, results[field])
+        return out
+
+    def _assemble_bending(self, ab, h, EI):
+        # Standard Hermite beam element on DOFs [v1, t1, v2, t2]
+        c = EI / h**3
+        k = np.empty((h.size, 4, 4))
+        k[:, 0] = np.stack([12 * c, 6 * h * c, -12 * c, 6 * h * c], axis=1)
+        k[:, 1] = np.stack([6 * h * c, 4 * h**2 * c, -6 * h * c, 2 * h**2 * c], axis=1)
+        k[:, 2] = np.stack([-12 * c, -6 * h * c, 12 * c, -6 * h * c], axis=1)
+        k[:, 3] = np.stack([6 * h * c, 2 * h**2 * c, -6 * h * c, 4 * h**2 * c], axis=1)
+        base = np.arange(h.size)[:, None] * DOFS
+        dofs = base + np.array([V, THETA, DOFS + V, DOFS + THETA])
+        _add_upper(ab, dofs, k)
+
+    def _assemble_bar(self, ab, h, stiffness, dof):
+        c = stiffness / h
+        k = np.empty((h.size, 2, 2))
+        k[:, 0, 0] = k[:, 1, 1] = c
+        k[:, 0, 1] = k[:, 1, 0] = -c
+        base = np.arange(h.size)[:, None] * DOFS
+        _add_upper(ab, base + np.array([dof, DOFS + dof]), k)
+
+    def _node(self, position):
+        return int(np.argmin(np.abs(self.x - position)))
+
+    def _assemble_loads(self, F, h):
+        L = self.beam.length
+        x = self.x
+        # Distributed/parametric loads: Gauss quadrature of q(x) N(x) on each element
+        xg = x[:-1, None] + h[:, None] * _GAUSS_XI
+        q = np.zeros((2,) + xg.shape)
+        for load in self.beam.loads:
+            plane = bending_plane(load)
+            if load.type == 'point':
+                # Positive magnitude acts against positive v
+                F[self._node(load.position) * DOFS + V, plane] -= load.magnitude
+            elif load.type == 'moment':
+                F[self._node(load.position) * DOFS + THETA, plane] -= load.magnitude
+            elif load.type == 'torsion':
+                F[self._node(load.position) * DOFS + PHI, 0] += load.magnitude
+            elif load.type == 'axial':
+                F[self._node(load.position) * DOFS + U, 0] += load.magnitude
+            elif load.type == 'distributed':
+                c, d = clip_to_span(load.position, load.end_pos, L)
+                q[plane] += np.where((xg >= c) & (xg <= d), load.magnitude, 0.0)
+            elif load.type == 'parametric':
+                c, d = clip_to_span(load.position, load.end_pos, L)
+                inside = (xg >= c) & (xg <= d)
+                q[plane] += np.where(inside, load.function(xg, L), 0.0)
+
+        for plane in (0, 1):
+            if not np.any(q[plane]):
+                continue
+            s = _GAUSS_XI
+            N = np.stack([1 - 3 * s**2 + 2 * s**3, s - 2 * s**2 + s**3,
+                          3 * s**2 - 2 * s**3, -s**2 + s**3])                 # (4, 2)
+            scale = np.array([1, 0, 1, 0])[:, None] + np.array([0, 1, 0, 1])[:, None] * h  # (4, ne)
+            fe = -(q[plane] * _GAUSS_W) @ N.T * h[:, None] * scale.T          # (ne, 4)
+            base = np.arange(h.size)[:, None] * DOFS
+            np.add.at(F[:, plane], base + np.array([V, THETA, DOFS + V, DOFS + THETA]), fe)
+
+    def _apply_supports(self, ab, F):
+        constrained = []
+        for support in self.supports:
+            node = self._node(support['position']) * DOFS
+            kind = support.get('type', 'simple')
+            if kind in ('simple', 'pin', 'pinned', 'roller'):
+                constrained.append(node + V)
+            elif kind == 'fixed':
+                constrained += [node + V, node + THETA]
+            elif kind == 'spring':
+                ab[BANDWIDTH, node + V] += support.get('stiffness', 0.0)
+                ab[BANDWIDTH, node + THETA] += support.get('rotational_stiffness', 0.0)
+            else:
+                raise ValueError(f"Unknown support type: {kind}")
+
+        fixed = [s for s in self.supports if s.get('type') == 'fixed']
+        anchor = self._node((fixed or self.supports)[0]['position']) * DOFS
+        constrained += [anchor + PHI, anchor + U]
+
+        # Zero the constrained rows/columns in upper band storage and put 1 on the diagonal
+        for dof in constrained:
+            for k in range(1, BANDWIDTH + 1):
+                if dof - k >= 0:
+                    ab[BANDWIDTH - k, dof] = 0.0
+                if dof + k < ab.shape[1]:
+                    ab[BANDWIDTH - k, dof + k] = 0.0
+            ab[BANDWIDTH, dof] = 1.0
+            F[dof] = 0.0
+
+    def _nodal_shear(self, v, theta, h, EI):
+        # V = EI v''', constant on each element, reported at the element's left node
+        v1, v2, t1, t2 = v[:-1], v[1:], theta[:-1], theta[1:]
+        shear = EI * (12 * (v1 - v2) / h**3 + 6 * (t1 + t2) / h**2)
+        return np.append(shear, shear[-1])
+
+    def _nodal_moment(self, v, theta, h, EI):
+        # M = EI v'' from the Hermite shape functions at each element's ends
+        v1, v2, t1, t2 = v[:-1], v[1:], theta[:-1], theta[1:]
+        left = EI * (6 * (v2 - v1) / h**2 - (4 * t1 + 2 * t2) / h)
+        right = EI * (-6 * (v2 - v1) / h**2 + (2 * t1 + 4 * t2) / h)
+        return np.append(left, right[-1])
+
+
+def mesh_with_nodes(x, nodes):
+    """
+    Union of the grid x and the exact nodes, dropping grid points closer to a node
+    than a quarter of the mean grid spacing. Otherwise a node just off a grid point
+    (0.7 against 0.7000000000000001, or 0.700001) makes a sliver element whose
+    stiffness (~EI / h^3) swamps the rest of the matrix.
+    """
+    x = np.asarray(x, dtype=float)
+    nodes = np.unique(nodes)
+    if nodes.size and x.size > 1:
+        i = np.clip(np.searchsorted(nodes, x), 1, nodes.size) - 1
+        gap = np.minimum(np.abs(x - nodes[i]), np.abs(x - nodes[np.minimum(i + 1, nodes.size - 1)]))
+        x = x[gap > 0.25 * (x[-1] - x[0]) / (x.size - 1)]
+    return np.union1d(x, nodes)
+
+
+def _nodal_bar_force(w, h, stiffness):
+    # Constant force per element, reported at the element's left node
+    force = stiffness * np.diff(w) / h
+    return np.append(force, force[-1])
+
+
+def _add_upper(ab, dofs, k):
+    # Scatter element matrices (ne, m, m) on global DOFs (ne, m) into upper band storage
+    rows = np.broadcast_to(dofs[:, :, None], k.shape)
+    cols = np.broadcast_to(dofs[:, None, :], k.shape)
+    upper = rows <= cols
+    np.add.at(ab, (BANDWIDTH + rows[upper] - cols[upper], cols[upper]), k[upper])
@@ -0,0 +1,224 @@
+import json
+from collections import OrderedDict
+
+import numpy as np
+
+from .loads import bending_plane
+from .solver import (_point_moment_shapes, _moment_load_shapes, _step_shapes, _combine_planes,
+                     _integrate_bending, _integrate_torsion, _integrate_axial)
+
+# Number of geometries whose influence matrices are kept in memory
+MAX_CACHED_GEOMETRIES = 8
+
+_cache = OrderedDict()
+
+
+class InfluenceMatrices:
+    """
+    Unit-load responses for one geometry (length, profile, material, supports, grid).
+
+    Row i of each matrix is the response on the grid to a unit load at node x[i], so
+    for fixed geometry any set of loads is one matrix-vector product. Loads between
+    nodes are split linearly onto the two neighbouring nodes (exact when the load
+    sits on a node). Matrices are built per load type on first use.
+
+    On a stepped shaft EI, GJ and EA follow the segment of every node; the grid
+    should hold the step nodes of Solver so each jump falls between two nodes.
+
+    The length and stiffness are copied from the beam on construction, so the
+    (cached, shared) matrices do not change if that beam is edited later.
+    """
+    def __init__(self, beam, x):
+        self.length = beam.length
+        self.x = np.array(x, dtype=float)
+        if beam.stepped:
+            sections = beam.section_properties(self.x)
+            self._stiffness = (beam.E * sections['I'], beam.G * sections['J'], beam.E * sections['A'])
+        else:
+            self._stiffness = (beam.E * beam.I, beam.G * beam.J, beam.E * beam.profile.A)
+        self._matrices = {}
+
+    def matrices(self, load_type):
+        """
+        Returns the influence matrices for a load type as a dict of field -> (n, n).
+        """
+        if load_type not in self._matrices:
+            self._matrices[load_type] = self._build(load_type)
+        return self._matrices[load_type]
+
+    def _build(self, load_type):
+        x = self.x
+        L = self.length
+        EI, GJ, EA = self._stiffness
+        if load_type in ('point', 'moment'):
+            shapes = _point_moment_shapes(x, x, L) if load_type == 'point' else _moment_load_shapes(x, x, L)
+            slope, deflection = _integrate_bending(shapes, x, EI, L)
+            return {"deflection": deflection, "slope": slope}
+        elif load_type == 'torsion':
+            if not np.any(GJ):
+                raise ValueError("Torsional stiffness is zero; no torsion influence matrix.")
+            return {"twist": _integrate_torsion(_step_shapes(x, x), x, GJ)}
+        elif load_type == 'axial':
+            return {"elongation": _integrate_axial(_step_shapes(x, x), x, EA)}
+        raise ValueError(f"Load type '{load_type}' is not supported by influence matrices.")
+
+    def _interpolate(self, positions):
+        # Left node index and linear weight of the right node for each position
+        x = self.x
+        a = np.clip(np.asarray(positions, dtype=float), x[0], x[-1])
+        i = np.clip(np.searchsorted(x, a), 1, x.size - 1)
+        h = x[i] - x[i - 1]
+        t = np.divide(a - x[i - 1], h, out=np.ones_like(a), where=h > 0)
+        return i - 1, t
+
+    def evaluate_batch(self, load_cases):
+        """
+        Evaluates N load cases with one matrix product per load type, bending plane
+        and field. The bending matrices serve both planes; x-z loads accumulate into
+        their own plane and are combined as in Solver.solve_batch.
+
+        With few loads only the matrix rows next to each load are gathered, so the
+        cost is O(loads * n); with many loads the loads are first spread onto all
+        nodes and the full (N, n) @ (n, n) product is used.
+
+        Args:
+            load_cases (list): One list of point, moment, torsion or axial loads per case.
+
+        Returns:
+            dict: 'deflection', 'slope', 'twist', 'elongation' as (N, n) arrays, plus 'x'.
+                  With x-z loads in any case, also 'deflection_planes' and
+                  'slope_planes' as (2, N, n).
+        """
+        n_cases = len(load_cases)
+        n = self.x.size
+        # Bending fields per plane, (plane, case, n); twist and elongation per case
+        results = {field: np.zeros((2, n_cases, n)) for field in ('deflection', 'slope')}
+        results.update({field: np.zeros((n_cases, n)) for field in ('twist', 'elongation')})
+        two_planes = np.zeros(n_cases, dtype=bool)
+
+        groups = {}
+        for case_idx, loads in enumerate(load_cases):
+            for load in loads:
+                plane = bending_plane(load) if load.type in ('point', 'moment') else 0
+                two_planes[case_idx] |= plane == 1
+                groups.setdefault((load.type, plane), []).append((case_idx, load.position, load.magnitude))
+
+        for (load_type, plane), entries in groups.items():
+            case_idx, a, P = (np.asarray(v) for v in zip(*entries))
+            P = P.astype(float)
+            left, t = self._interpolate(a)
+            rows = np.concatenate((left, left + 1))
+            coeffs = np.concatenate(((1 - t) * P, t * P))
+            cases = np.concatenate((case_idx, case_idx))
+
+            if rows.size < n:
+                # Compact: (N, 2K) weights against the 2K gathered rows
+                weights = np.zeros((n_cases, rows.size))
+                weights[cases, np.arange(rows.size)] = coeffs
+                for field, matrix in self.matrices(load_type).items():
+                    target = results[field][plane] if field in ('deflection', 'slope') else results[field]
+                    target += weights @ matrix[rows]
+            else:
+                weights = np.zeros((n_cases, n))
+                np.add.at(weights, (cases, rows), coeffs)
+                for field, matrix in self.matrices(load_type).items():
+                    target = results[field][plane] if field in ('deflection', 'slope') else results[field]
+                    target += weights @ matrix
+
+        if two_planes.any():
+            results.update(_combine_planes(results['slope'], results['deflection'], two_planes))
+        else:
+            results['deflection'], results['slope'] = results['deflection'][0], results['slope'][0]
+        results["x"] = self.x
+        return results
+
+    def evaluate(self, loads):
+        """
+        Evaluates a single set of loads. Same fields as Solver.solve().
+        """
+        results = self.evaluate_batch([loads])
+        single = {}
+        for field, value in results.items():
+            if field == 'x':
+                single[field] = value
+            elif field.endswith('_planes'):
+                single[field] = value[:, 0]
+            else:
+                single[field] = value[0]
+        return single
+
+    def compile(self, loads):
+        """
+        Fixes the load positions and pre-gathers their unit responses, for design
+        loops where only the magnitudes change. See CompiledLoads.
+        """
+        if any(load.type in ('point', 'moment') and bending_plane(load) for load in loads):
+            raise ValueError("Compiled loads act in the x-y plane only; evaluate x-z loads with evaluate().")
+        n = self.x.size
+        responses = {field: np.zeros((len(loads), n))
+                     for field in ('deflection', 'slope', 'twist', 'elongation')}
+        for k, load in enumerate(loads):
+            left, t = self._interpolate([load.position])
+            for field, matrix in self.matrices(load.type).items():
+                responses[field][k] = (1 - t[0]) * matrix[left[0]] + t[0] * matrix[left[0] + 1]
+        return CompiledLoads(self.x, responses, [load.magnitude for load in loads])
+
+
+class CompiledLoads:
+    """
+    Unit responses of a fixed list of loads: each field is a (num_loads, n) matrix,
+    so evaluating new magnitudes is a single vector-matrix product per field.
+    """
+    def __init__(self, x, responses, magnitudes):
+        self.x = x
+        self.responses = responses
+        self.magnitudes = np.asarray(magnitudes, dtype=float)
+
+    def evaluate(self, magnitudes=None):
+        """
+        Args:
+            magnitudes (array_like): (num_loads,) or (N, num_loads) magnitudes, in the
+                                     order the loads were compiled. Defaults to the
+                                     compiled loads' own magnitudes.
+        """
+        m = self.magnitudes if magnitudes is None else np.asarray(magnitudes, dtype=float)
+        results = {field: m @ matrix for field, matrix in self.responses.items()}
+        results["x"] = self.x
+        return results
+
+
+def geometry_key(beam, x):
+    """
+    Hashable key for everything the influence matrices depend on, loads excluded.
+    """
+    sections = tuple((start, end, profile.type, json.dumps(profile.dimensions, sort_keys=True))
+                     for start, end, profile in beam.segments)
+    return (
+        beam.length,
+        beam.E, beam.G,
+        sections,
+        json.dumps(beam.supports, sort_keys=True, default=str),
+        np.asarray(x, dtype=float).tobytes(),
+    )
+
+
+def influence_for(solver):
+    """
+    Returns the cached InfluenceMatrices for the solver's beam and grid, building
+    them on first use. The least recently used geometry is evicted when the cache
+    holds more than MAX_CACHED_GEOMETRIES entries.
+    """
+    key = geometry_key(solver.beam, solver.x)
+    if key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+
+    influence = InfluenceMatrices(solver.beam, solver.x)
+    _cache[key] = influence
+    while len(_cache) > MAX_CACHED_GEOMETRIES:
+        _cache.popitem(last=False)
+    return influence
+
+
+def clear_cache():
+    _cache.clear()
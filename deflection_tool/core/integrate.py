@@ -0,0 +1,22 @@
+import numpy as np
+
+
+def cumulative_trapezoid(y, x, axis=-1, initial=0):
+    """
+    Cumulative trapezoidal integral of y over the 1-D grid x along `axis`, with the
+    value `initial` prepended, as scipy.integrate.cumulative_trapezoid(..., initial=0).
+
+    Plain NumPy, so the solvers do not pull in scipy.integrate (most of the CLI's
+    import time) for one cumulative sum. The sum accumulates in double precision
+    whatever the dtype of y, so a float32 integral carries float32 rounding per
+    value rather than an error growing with the grid size.
+    """
+    y = np.moveaxis(np.asarray(y), axis, -1)
+    x = np.asarray(x)
+    dtype = np.result_type(y, x)
+    out = np.empty(y.shape, dtype=dtype if np.issubdtype(dtype, np.inexact) else float)
+    out[..., 0] = initial
+    np.cumsum((y[..., 1:] + y[..., :-1]) * (np.diff(x) / 2), axis=-1, dtype=np.float64, out=out[..., 1:])
+    if initial:
+        out[..., 1:] += initial
+    return np.moveaxis(out, -1, axis)
@@ -1,4 +1,12 @@
+import copy
+import itertools
+import weakref
+from collections import deque
+from collections.abc import MutableSequence
+
 import numpy as np
+from .integrate import cumulative_trapezoid as cumtrapz
+from .expressions import compile_expression
 
 class Load:
     def __init__(self, position, magnitude=0, load_type="point"):
@@ -6,6 +14,35 @@ class Load:
         self.magnitude = magnitude
         self.type = load_type
 
+    def __setattr__(self, name, value):
+        # Edits of public attributes are reported to every LoadCollection holding
+        # the load, together with a snapshot of the load before the edit
+        collections = self.__dict__.get('_collections')
+        if collections and not name.startswith('_') and name in self.__dict__ \
+                and not _same(self.__dict__[name], value):
+            snapshot = self.snapshot()
+            for collection in list(collections):
+                collection._record('modify', self, snapshot)
+            object.__setattr__(self, name, value)
+            for collection in list(collections):
+                collection._replane(snapshot, self)
+            return
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop('_collections', None)
+        return state
+
+    def snapshot(self):
+        """
+        Detached copy of the load as it is now; later edits of either are not
+        reported for the copy.
+        """
+        clone = copy.copy(self)
+        clone.__dict__['_collections'] = None
+        return clone
+
     def apply(self, x, L):
         """
         Calculate the contribution of this load to the moment/force distribution at position x.
@@ -52,3 +89,190 @@ class ParametricLoad(Load):
         super().__init__(start_pos, 0, "parametric")
         self.end_pos = end_pos
         self.function_string = function_string
+        # Parse and validate up front so a bad expression fails at construction
+        self.function = compile_expression(function_string)
+        self._cache_key = None
+        self._cache_x = None
+        self._cache_value = None
+
+    def apply(self, x, L):
+        """
+        Shear V(x) and moment M(x) of q(x) on [start, end] for a simply supported span.
+
+        q is integrated on the grid points inside the span plus the exact end points:
+        Vq = int(q), S = int(Vq) = int(q(s) (x - s) ds). Beyond the end the load acts
+        as its resultant, so S grows linearly. Ra = S(L) / L gives M(L) = 0 exactly:
+            V(x) = Ra - Vq(x),  M(x) = Ra x - S(x)
+        Results are cached for the last grid, so repeated solves with unchanged
+        load and grid are free.
+        """
+        key = (self.function_string, self.position, self.end_pos, L)
+        if key == self._cache_key and (x is self._cache_x or np.array_equal(x, self._cache_x)):
+            return self._cache_value
+        # Compiled expressions are cached by source, so an edited string costs one parse
+        self.function = compile_expression(self.function_string)
+
+        c, d = clip_to_span(self.position, self.end_pos, L)
+        if d <= c:
+            return np.zeros_like(x), np.zeros_like(x)
+        inside = (x > c) & (x < d)
+        xl = np.concatenate(([c], x[inside], [d]))
+        Vl = cumtrapz(self.function(xl, L), xl, initial=0)
+        Sl = cumtrapz(Vl, xl, initial=0)
+        W, S_d = Vl[-1], Sl[-1]
+
+        Vq = np.where(x >= d, W, 0.0)
+        S = np.where(x >= d, S_d + W * (x - d), 0.0)
+        Vq[inside] = Vl[1:-1]
+        S[inside] = Sl[1:-1]
+
+        Ra = (S_d + W * (L - d)) / L
+        value = (Ra - Vq, Ra * x - S)
+
+        self._cache_key, self._cache_x, self._cache_value = key, x, value
+        return value
+
+
+def clip_to_span(start, end, L):
+    """
+    Extent [start, end] of a distributed load clipped to the beam [0, L], for
+    scalars or arrays. Every engine reads load extents through here, so the part
+    of a load hanging past either end is dropped the same way everywhere.
+    """
+    return np.clip(start, 0.0, L), np.clip(end, 0.0, L)
+
+
+def bending_plane(load):
+    """
+    0 if the load bends the beam in the x-y plane (v deflection), 1 for x-z.
+
+    Point loads follow their direction ('y' or 'z') and couples their axis (a couple
+    about z bends in x-y). Loads without either, like distributed loads, act in y.
+    """
+    if load.type == 'moment':
+        return 1 if getattr(load, 'axis', 'z') == 'y' else 0
+    return 1 if getattr(load, 'direction', 'y') == 'z' else 0
+
+
+class LoadCollection(MutableSequence):
+    """
+    List of loads that records its changes: every load added, removed or edited
+    (an attribute of a held load reassigned) bumps `version` and logs the load with
+    a snapshot of its state before the change. Solver uses the log to update its
+    distributions for the loads that changed since its last solve only.
+
+    The log keeps the last MAX_LOG changes; a reader further behind gets None from
+    changes_since() and must rebuild from the whole collection.
+
+    `xz_count` is the number of held loads (repeats included) bending in the x-z
+    plane, kept up to date on every change so it is read without a scan.
+    """
+    MAX_LOG = 4096
+
+    def __init__(self, loads=()):
+        self._items = []
+        self._counts = {}
+        self.xz_count = 0
+        self._log = deque(maxlen=self.MAX_LOG)
+        self.version = 0
+        self.extend(loads)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            removed = self._items[index]
+            value = list(value)
+            self._items[index] = value
+            for load in removed:
+                self._release(load)
+            for load in value:
+                self._watch(load)
+            return
+        removed = self._items[index]
+        self._items[index] = value
+        self._release(removed)
+        self._watch(value)
+
+    def __delitem__(self, index):
+        removed = self._items[index]
+        del self._items[index]
+        for load in (removed if isinstance(index, slice) else [removed]):
+            self._release(load)
+
+    def insert(self, index, load):
+        self._items.insert(index, load)
+        self._watch(load)
+
+    def __repr__(self):
+        return f"LoadCollection({self._items!r})"
+
+    def __reduce__(self):
+        # Copies and pickles start with a fresh log
+        return (type(self), (self._items,))
+
+    def count_of(self, load):
+        """Times this very load object is held (identity, not equality)."""
+        return self._counts.get(id(load), 0)
+
+    def changes_since(self, version):
+        """
+        Changes after `version`, oldest first, as (op, load, snapshot) tuples with op
+        'add', 'remove' or 'modify' and snapshot the load's state before the change.
+        None if the log no longer reaches back to `version`.
+        """
+        if version == self.version:
+            return []
+        if not self._log or self._log[0][0] > version + 1 or version > self.version:
+            return None
+        # Walk back from the newest entry, so the cost follows the changes, not the log size
+        changes = [entry[1:] for entry in itertools.takewhile(lambda entry: entry[0] > version,
+                                                              reversed(self._log))]
+        changes.reverse()
+        return changes
+
+    def _watch(self, load):
+        self._counts[id(load)] = self._counts.get(id(load), 0) + 1
+        self.xz_count += bending_plane(load)
+        if isinstance(load, Load):
+            if load.__dict__.get('_collections') is None:
+                load.__dict__['_collections'] = weakref.WeakSet()
+            load._collections.add(self)
+        self._record('add', load, _snapshot(load))
+
+    def _release(self, load):
+        self._record('remove', load, _snapshot(load))
+        self.xz_count -= bending_plane(load)
+        count = self._counts[id(load)] - 1
+        if count:
+            self._counts[id(load)] = count
+            return
+        del self._counts[id(load)]
+        if isinstance(load, Load) and load.__dict__.get('_collections'):
+            load._collections.discard(self)
+
+    def _replane(self, before, load):
+        # An edit may move every occurrence of the load to the other bending plane
+        self.xz_count += self.count_of(load) * (bending_plane(load) - bending_plane(before))
+
+    def _record(self, op, load, snapshot):
+        self.version += 1
+        self._log.append((self.version, op, load, snapshot))
+
+
+def _snapshot(load):
+    return load.snapshot() if isinstance(load, Load) else copy.copy(load)
+
+
+def _same(old, new):
+    if old is new:
+        return True
+    try:
+        return bool(old == new)
+    except (TypeError, ValueError):
+        # e.g. arrays, whose == has no single truth value
+        return False
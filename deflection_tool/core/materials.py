@@ -1,6 +1,124 @@
 import json
 import os
 
+import numpy as np
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'materials.json')
+
+# Properties exposed as vectorized arrays by the registry
+ARRAY_PROPERTIES = ('E', 'G', 'rho', 'nu', 'yield_strength')
+
+_registry = None
+
+
+class MaterialRegistry:
+    """
+    In-memory index of a materials database, read from disk once.
+
+    Materials are indexed by name and by 'type' (e.g. 'steel'), and every numeric
+    property in ARRAY_PROPERTIES is held as a NumPy array in name order, so batch
+    sweeps can pull E, G and rho for many materials without building Material objects.
+    """
+    def __init__(self, db):
+        self._db = db
+        self.names = list(db)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.by_type = {}
+        for i, name in enumerate(self.names):
+            self.by_type.setdefault(db[name].get('type'), []).append(i)
+
+        self.arrays = {}
+        for prop in ARRAY_PROPERTIES:
+            self.arrays[prop] = np.array([self._property(db[name], prop) for name in self.names], dtype=float)
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, 'r') as f:
+            return cls(json.load(f))
+
+    @staticmethod
+    def _property(props, prop):
+        # Same defaults as Material: G from E and nu, yield_strength unbounded
+        if prop in props:
+            return props[prop]
+        if prop == 'G':
+            return props['E'] / (2 * (1 + props['nu']))
+        if prop == 'yield_strength':
+            return float('inf')
+        return float('nan')
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __len__(self):
+        return len(self.names)
+
+    def properties(self, name):
+        """
+        Returns a copy of the stored properties of a material, with its name.
+        """
+        if name not in self.index:
+            raise ValueError(f"Material '{name}' not found in database. Available: {self.names}")
+        props = dict(self._db[name])
+        props['name'] = name
+        return props
+
+    def select(self, type=None, where=None, sort_by=None, descending=False):
+        """
+        Vectorized query over the database.
+
+        Args:
+            type (str): Keep only materials of this 'type' (e.g. 'steel').
+            where (dict): Property -> (min, max) bounds, inclusive; None leaves a side open.
+            sort_by (str or callable): Property name, or a function of the arrays dict
+                                       returning one key per material (e.g. lambda p: p['E'] / p['rho']).
+            descending (bool): Sort largest first.
+
+        Returns:
+            list: Matching material names.
+
+        Example:
+            registry().select('steel', {'yield_strength': (500e6, None)},
+                               sort_by=lambda p: p['E'] / p['rho'], descending=True)
+        """
+        mask = np.ones(len(self.names), dtype=bool)
+        if type is not None:
+            mask[:] = False
+            mask[self.by_type.get(type, [])] = True
+        for prop, (lo, hi) in (where or {}).items():
+            values = self.arrays[prop]
+            if lo is not None:
+                mask &= values >= lo
+            if hi is not None:
+                mask &= values <= hi
+
+        idx = np.nonzero(mask)[0]
+        if sort_by is not None:
+            keys = self.arrays[sort_by] if isinstance(sort_by, str) else np.asarray(sort_by(self.arrays))
+            order = np.argsort(keys[idx], kind='stable')
+            idx = idx[order[::-1] if descending else order]
+        return [self.names[i] for i in idx]
+
+    def property_arrays(self, names=None):
+        """
+        Returns property arrays for the given materials (all by default), in that order.
+        """
+        if names is None:
+            return dict(self.arrays)
+        idx = [self.index[name] for name in names]
+        return {prop: values[idx] for prop, values in self.arrays.items()}
+
+
+def registry(reload=False):
+    """
+    Returns the module-level registry for data/materials.json, loading it on first use.
+    """
+    global _registry
+    if _registry is None or reload:
+        _registry = MaterialRegistry.from_file(DEFAULT_DB_PATH)
+    return _registry
+
+
 class Material:
     def __init__(self, name_or_dict):
         """
@@ -22,18 +140,8 @@ class Material:
         self._validate()
 
     def _load_from_db(self, name):
-        # Locate the materials.json file relative to this file
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        db_path = os.path.join(current_dir, '..', 'data', 'materials.json')
-        
-        with open(db_path, 'r') as f:
-            db = json.load(f)
-            
-        if name not in db:
-            raise ValueError(f"Material '{name}' not found in database. Available: {list(db.keys())}")
-            
-        self.properties = db[name]
-        self.properties['name'] = name
+        # The registry reads materials.json once per process; we get our own copy
+        self.properties = registry().properties(name)
 
     def _validate(self):
         required = ['E', 'rho', 'nu'] # Young's Modulus, Density, Poisson's Ratio
@@ -0,0 +1,102 @@
+import json
+import time
+import tracemalloc
+from contextlib import nullcontext
+
+# Shared no-op context for disabled profiling
+NULL_PHASE = nullcontext()
+
+
+class ProfileStats:
+    """
+    Per-phase wall time, call counts and (optionally) allocation sizes.
+
+    Pass an instance as `profiler=` to Solver or InputParser to record into it;
+    without one, the instrumented code takes the uninstrumented path. Stats from
+    many runs can be merged, or dumped with to_dict()/to_json() and summed later.
+
+    With track_memory=True each phase also records the peak bytes allocated while it
+    ran (tracemalloc, which also sees NumPy buffers). This slows the run down, so it
+    is off by default.
+    """
+    def __init__(self, track_memory=False):
+        self.track_memory = track_memory
+        self.phases = {}
+        self._stack = []
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def record(self, name, seconds, calls=1, peak_bytes=0):
+        entry = self.phases.get(name)
+        if entry is None:
+            entry = self.phases[name] = {'calls': 0, 'total_s': 0.0, 'max_s': 0.0, 'peak_bytes': 0}
+        entry['calls'] += calls
+        entry['total_s'] += seconds
+        entry['max_s'] = max(entry['max_s'], seconds / calls if calls else seconds)
+        entry['peak_bytes'] = max(entry['peak_bytes'], peak_bytes)
+
+    def merge(self, other):
+        """
+        Adds another ProfileStats (or its to_dict() output) into this one.
+        """
+        phases = other.phases if isinstance(other, ProfileStats) else other
+        for name, entry in phases.items():
+            self.record(name, entry['total_s'], entry['calls'], entry.get('peak_bytes', 0))
+            self.phases[name]['max_s'] = max(self.phases[name]['max_s'], entry['max_s'])
+        return self
+
+    def to_dict(self):
+        return {name: dict(entry) for name, entry in self.phases.items()}
+
+    def to_json(self):
+        return json.dumps(self.to_dict())
+
+    def report(self):
+        """
+        Human-readable table, slowest phases first.
+        """
+        lines = [f"{'phase':32s} {'calls':>8s} {'total ms':>10s} {'mean us':>10s} {'peak KiB':>10s}"]
+        for name, e in sorted(self.phases.items(), key=lambda item: -item[1]['total_s']):
+            mean_us = e['total_s'] / e['calls'] * 1e6 if e['calls'] else 0.0
+            lines.append(f"{name:32s} {e['calls']:8d} {e['total_s'] * 1e3:10.3f} "
+                         f"{mean_us:10.1f} {e['peak_bytes'] / 1024:10.1f}")
+        return '\n'.join(lines)
+
+
+class _Phase:
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self):
+        if self.stats.track_memory:
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start()
+            current, peak = tracemalloc.get_traced_memory()
+            # Hand the enclosing phase its peak so far before resetting it
+            stack = self.stats._stack
+            if stack:
+                stack[-1]._child_peak = max(stack[-1]._child_peak, peak)
+            stack.append(self)
+            self._base = current
+            self._child_peak = 0
+            tracemalloc.reset_peak()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self._start
+        peak = 0
+        if self.stats.track_memory:
+            absolute_peak = max(tracemalloc.get_traced_memory()[1], self._child_peak)
+            peak = max(absolute_peak - self._base, 0)
+            stack = self.stats._stack
+            stack.pop()
+            if stack:
+                stack[-1]._child_peak = max(stack[-1]._child_peak, absolute_peak)
+            if self._started_tracing:
+                tracemalloc.stop()
+        self.stats.record(self.name, elapsed, peak_bytes=peak)
+        return False
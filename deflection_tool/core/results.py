@@ -0,0 +1,72 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+FIELDS = ('deflection', 'slope', 'twist', 'elongation')
+
+# Load types feeding each deformation mode
+BENDING_LOADS = ('point', 'distributed', 'moment', 'parametric')
+TORSION_LOADS = ('torsion',)
+AXIAL_LOADS = ('axial',)
+
+
+class LazyResults(Mapping):
+    """
+    Solver results computed per field on first access.
+
+    Behaves like the dict returned by Solver.solve(), but only the deformation
+    modes actually read are aggregated and integrated: reading 'twist' alone never
+    touches the bending loads or allocates the deflection profile. Deflection and
+    slope come from the same integration and are computed together.
+    """
+    def __init__(self, solver):
+        self._solver = solver
+        self._values = {'x': solver.x}
+
+    def __getitem__(self, field):
+        if field not in self._values:
+            if field not in FIELDS:
+                raise KeyError(field)
+            self._compute(field)
+        return self._values[field]
+
+    def __iter__(self):
+        return iter(FIELDS + ('x',))
+
+    def __len__(self):
+        return len(FIELDS) + 1
+
+    def _compute(self, field):
+        solver = self._solver
+        if field in ('deflection', 'slope'):
+            solver.aggregate_loads(BENDING_LOADS)
+            solver.solve_bending()
+            self._values['deflection'] = solver.deflection
+            self._values['slope'] = solver.slope
+        elif field == 'twist':
+            solver.aggregate_loads(TORSION_LOADS)
+            solver.solve_torsion()
+            self._values['twist'] = solver.twist
+        else:
+            solver.aggregate_loads(AXIAL_LOADS)
+            solver.solve_axial()
+            self._values['elongation'] = solver.elongation
+
+    def computed(self):
+        """Fields evaluated so far."""
+        return [field for field in FIELDS if field in self._values]
+
+
+def extremum(values, x):
+    """
+    Largest absolute value of a profile, its location and its sign, from one argmax
+    and one argmin pass and without allocating |values|.
+
+    Returns:
+        dict: {'max': |value|, 'x': location, 'value': signed value}
+    """
+    i_max = int(np.argmax(values))
+    i_min = int(np.argmin(values))
+    i = i_max if abs(values[i_max]) >= abs(values[i_min]) else i_min
+    value = float(values[i])
+    return {'max': abs(value), 'x': float(x[i]), 'value': value}
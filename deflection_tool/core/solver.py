@@ -1,179 +1,760 @@
 import numpy as np
-from scipy.integrate import cumulative_trapezoid as cumtrapz
+from .integrate import cumulative_trapezoid as cumtrapz
+from .analytic import AnalyticSolver
+from .loads import bending_plane, clip_to_span
+from .profiling import NULL_PHASE
+from .results import LazyResults, extremum, BENDING_LOADS, TORSION_LOADS, AXIAL_LOADS
 
 class Solver:
-    def __init__(self, beam, num_points=1000):
+    def __init__(self, beam, num_points=1000, engine='numerical', grid='uniform',
+                 tol=1e-6, seed_points=33, max_points=100000, profiler=None,
+                 workspace=False, dtype=np.float64):
+        """
+        Args:
+            beam (Beam): Beam to solve.
+            num_points (int): Size of the uniform grid.
+            engine (str): 'numerical' (grid integration), 'analytic' (closed form) or
+                          'fem' (banded finite elements honouring beam.supports).
+            grid (str): 'uniform', or 'adaptive' to place exact nodes at every load
+                        position/span end and refine until max deflection meets tol.
+            tol (float): Relative error target on max deflection (adaptive grid).
+            seed_points (int): Uniform points seeding the adaptive grid.
+            max_points (int): Upper bound on adaptive grid size.
+            profiler (ProfileStats): Records per-phase and per-load-type timings.
+                                     None (default) adds no instrumentation.
+            workspace (bool): Integrate in place into buffers allocated once per grid.
+                              The returned arrays are then reused (overwritten) by the
+                              next solve(); copy them if they must be kept.
+            dtype: np.float64 (default) or np.float32 to halve memory on large grids,
+                   at ~1e-6 relative accuracy.
+        """
+        if engine not in ('numerical', 'analytic', 'fem'):
+            raise ValueError(f"Unknown solver engine: {engine}")
+        if grid not in ('uniform', 'adaptive'):
+            raise ValueError(f"Unknown grid mode: {grid}")
         self.beam = beam
-        self.x = np.linspace(0, beam.length, num_points)
+        self.engine = engine
+        self.grid = grid
+        self.tol = tol
+        self.max_points = max_points
+        self.profiler = profiler
+        self.workspace = workspace
+        self.dtype = np.dtype(dtype)
+
+        if grid == 'adaptive':
+            x = np.union1d(np.linspace(0, beam.length, seed_points), self._load_nodes())
+        else:
+            x = np.linspace(0, beam.length, num_points)
+            if beam.stepped:
+                x = np.union1d(x, self._step_nodes())
+        self._set_grid(x)
+
+    def _set_grid(self, x):
+        self.x = np.asarray(x, dtype=self.dtype)
+
+        # Scratch buffer and half interval widths, reused by every in-place operation
+        self._work = np.empty_like(self.x)
+        self._half_dx = np.diff(self.x) / 2
         
-        # State arrays
+        # State arrays (bending in x-y; the _z arrays hold the x-z plane)
         self.moment_distribution = np.zeros_like(self.x)
         self.shear_distribution = np.zeros_like(self.x)
+        self.moment_distribution_z = np.zeros_like(self.x)
+        self.shear_distribution_z = np.zeros_like(self.x)
         self.torque_distribution = np.zeros_like(self.x)
         self.axial_distribution = np.zeros_like(self.x)
+        # (loads, version, length) the distributions were last aggregated for
+        self._tracked = None
+        # ((segments, E, G), (EI, GJ, EA)) for this grid, see section_stiffness
+        self._stiffness = None
         
         # Results
         self.deflection = np.zeros_like(self.x) # v(x)
         self.slope = np.zeros_like(self.x)      # theta(x)
         self.twist = np.zeros_like(self.x)      # phi(x)
         self.elongation = np.zeros_like(self.x) # u(x)
+        # (2, n) y and z planes when loads act in both, else None
+        self.deflection_planes = None
+        self.slope_planes = None
         
     def solve(self):
         """
         Solves for all deformation modes: Bending, Torsion, and Axial.
+
+        With loads in both bending planes, 'deflection' and 'slope' are the resultant
+        sqrt(y^2 + z^2) and 'deflection_planes' / 'slope_planes' hold each plane as
+        (2, num_points) arrays (row 0: y, row 1: z).
         """
-        self.reset_distributions()
-        L = self.beam.length
-        
-        # Aggregate Loads
-        for load in self.beam.loads:
-            if load.type == 'point':
-                # Bending Moment
-                P = load.magnitude
-                a = load.position
-                mask1 = self.x <= a
-                mask2 = self.x > a
-                M1 = P * (L - a) * self.x[mask1] / L
-                M2 = P * a * (L - self.x[mask2]) / L
-                self.moment_distribution[mask1] += M1
-                self.moment_distribution[mask2] += M2
-                
-            elif load.type == 'distributed':
-                # Supported-Supported Distributed Load q
-                # Reactions: Ra = qL/2, Rb = qL/2
-                # M(x) = qL/2 * x - qx^2 / 2
-                # This is for a load covering the WHOLE beam.
-                # TODO: Implement partial distributed loads if needed.
-                q = load.magnitude
-                # Assuming full span for simplicity or strictly defined start/end
-                # M(x) = (q*L*x)/2 - (q*x^2)/2
-                self.moment_distribution += (q * L * self.x / 2) - (q * self.x**2 / 2)
-
-            elif load.type == 'moment':
-                # Bending Moment Load
-                M0 = load.magnitude
-                a = load.position
-                Ra = -M0 / L
-                mask1 = self.x <= a
-                mask2 = self.x > a
-                self.moment_distribution[mask1] += Ra * self.x[mask1]
-                self.moment_distribution[mask2] += Ra * self.x[mask2] + M0
-
-            elif load.type == 'torsion':
-                # Torque T applied at position a.
-                # Fixed at x=0 (e.g. motor), Free at x=L
-                # Internal Torque T(x) = T for 0 <= x < a, 0 for x > a
-                # This depends on boundary conditions.
-                # Assuming Fixed-Free (Shaft driven at 0)
-                T = load.magnitude
-                a = load.position
-                mask = self.x <= a
-                self.torque_distribution[mask] += T
-
-            elif load.type == 'axial':
-                # Axial Force P applied at position a.
-                # Fixed at x=0.
-                # Internal Force P(x) = P for 0 <= x < a
-                P = load.magnitude
-                a = load.position
-                mask = self.x <= a
-                self.axial_distribution[mask] += P
-                
-            elif load.type == 'parametric':
-                # Evaluate parametric function string for distributed load
-                # For safety, we should restrict evaluation context, but here we assume trusted input.
-                # q(x) = eval(func)
-                try:
-                    # Make 'x' and 'L' available in local scope
-                    context = {"x": self.x, "L": L, "np": np}
-                    # We assume the user provides a string that returns an array of size x
-                    # Ideally, this calculates q(x)
-                    # For a simple distributed load, M(x) requires integration.
-                    # This is complex to do analytically from a string.
-                    # We will calculate q(x) array, then integrate numerically to get Shear V, then Moment M.
-                    # V(x) = integral(q)
-                    # M(x) = integral(V)
-                    
-                    # NOTE: This overrides the simplified algebraic formulas above.
-                    # It's a numerical approach.
-                    q_x = eval(load.function_string, {"__builtins__": None}, context)
-                    
-                    # If scalar, broadcast
-                    if np.isscalar(q_x):
-                        q_x = np.full_like(self.x, q_x)
-                        
-                    # Integrate q to get V (Shear)
-                    # Boundary Condition: Simple Supports?? 
-                    # Numerical integration for statically indeterminate or simple beams requires reactions.
-                    # For now, let's assume Parametric applies to a Cantilever (Fixed-Free) or perform double integration with BCs.
-                    # Let's stick to Cantilever logic for Parametric for now as it's easier numerically without solving system of eq.
-                    # Or... calculate total load, find reactions.
-                    
-                    # Taking simple approach: Calculate Force F = int(q), Center of Load.
-                    # Then solve reactions.
-                    pass 
-                except Exception as e:
-                    print(f"Error evaluating parametric load: {e}")
-
-        # Solve for Deformations
-        self.solve_bending()
-        self.solve_torsion()
-        self.solve_axial()
+        with self._phase('solve'):
+            if self.engine == 'analytic':
+                return self.solve_analytic()
+            if self.engine == 'fem':
+                return self.solve_fem()
+
+            if self.grid == 'adaptive':
+                with self._phase('refine_grid'):
+                    self._refine_grid()
+            else:
+                self.update_loads()
+
+            # Solve for Deformations
+            self.solve_bending()
+            self.solve_torsion()
+            self.solve_axial()
         
-        return {
+        return self._results()
+
+    def _results(self):
+        results = {
             "deflection": self.deflection,
             "slope": self.slope,
             "twist": self.twist,
             "elongation": self.elongation,
             "x": self.x
         }
+        if self.deflection_planes is not None:
+            results["deflection_planes"] = self.deflection_planes
+            results["slope_planes"] = self.slope_planes
+        return results
+
+    def two_planes(self):
+        """True if any bending load acts in the x-z plane (a counter, not a scan)."""
+        return self.beam.loads.xz_count > 0
+
+    def _phase(self, name):
+        # Timing context for a solver phase; a shared no-op when profiling is off
+        return NULL_PHASE if self.profiler is None else self.profiler.phase(name)
+
+    def aggregate_loads(self, load_types=None):
+        """
+        Builds the internal moment, torque and axial force distributions on the grid.
+
+        Args:
+            load_types (tuple): Only rebuild the distributions fed by these load types
+                                (e.g. results.TORSION_LOADS). Default: all.
+        """
+        with self._phase('aggregate_loads'):
+            L = self.beam.length
+            if load_types is None:
+                self.reset_distributions()
+                loads = self.beam.loads
+            else:
+                if set(load_types) & set(BENDING_LOADS):
+                    self.moment_distribution.fill(0)
+                    self.shear_distribution.fill(0)
+                    self.moment_distribution_z.fill(0)
+                    self.shear_distribution_z.fill(0)
+                if set(load_types) & set(TORSION_LOADS):
+                    self.torque_distribution.fill(0)
+                if set(load_types) & set(AXIAL_LOADS):
+                    self.axial_distribution.fill(0)
+                loads = [load for load in self.beam.loads if load.type in load_types]
+                self._tracked = None
+
+            # Aggregate Loads
+            if self.profiler is None:
+                for load in loads:
+                    self._apply_load(load, L)
+            else:
+                for load in loads:
+                    with self.profiler.phase(f'load.{load.type}'):
+                        self._apply_load(load, L)
+            if load_types is None:
+                self._tracked = (loads, loads.version, L)
+
+    def update_loads(self):
+        """
+        Brings the distributions up to date with beam.loads, touching only the loads
+        added, removed or edited since they were last aggregated.
+
+        Every contribution is linear in the load, so a changed load is updated by
+        applying its previous state (the snapshot logged by the LoadCollection) with
+        a negative sign and its current state with a positive one: the work grows
+        with the number of changed loads, not with the total. The whole set is
+        rebuilt with aggregate_loads() on a new grid or beam, when beam.loads was
+        replaced, when its change log no longer reaches back, or when more than half
+        of the loads changed.
+
+        Returns:
+            int: Number of loads re-applied (all of them on a rebuild).
+        """
+        loads = self.beam.loads
+        L = self.beam.length
+        changes = None
+        if self._tracked is not None and self._tracked[0] is loads and self._tracked[2] == L:
+            changes = loads.changes_since(self._tracked[1])
+        if changes == []:
+            return 0
+
+        before, current, added = {}, {}, {}
+        for op, load, snapshot in changes or ():
+            key = id(load)
+            before.setdefault(key, snapshot)
+            current[key] = load
+            added[key] = added.get(key, 0) + (op == 'add') - (op == 'remove')
+        if changes is None or len(current) > len(loads) // 2:
+            self.aggregate_loads()
+            return len(loads)
+
+        with self._phase('update_loads'):
+            for key, load in current.items():
+                count = loads.count_of(load)
+                previous = count - added[key]
+                if previous:
+                    self._apply_load(before[key], L, -previous)
+                if count:
+                    self._apply_load(load, L, count)
+            self._tracked = (loads, loads.version, L)
+        return len(current)
+
+    def _apply_load(self, load, L, scale=1):
+        """
+        Adds one load's contribution, times scale, to the distributions.
+        """
+        # The grid is sorted, so "x <= a" is the slice [:k]: loads accumulate into
+        # views with out= ufuncs, without boolean masks or fancy-indexed copies
+        x, w = self.x, self._work
+
+        def split(a):
+            # In the grid precision, so a float32 node at the load position counts
+            # as x <= a, as it does on a float64 grid
+            return np.searchsorted(x, x.dtype.type(a), side='right')
+
+        if bending_plane(load):
+            M, V = self.moment_distribution_z, self.shear_distribution_z
+        else:
+            M, V = self.moment_distribution, self.shear_distribution
+        if load.type == 'point':
+            # Bending Moment
+            # M = P(L-a)x/L for x <= a, P a (L-x)/L beyond
+            P = load.magnitude * scale
+            a = load.position
+            k = split(a)
+            np.multiply(x[:k], P * (L - a) / L, out=w[:k])
+            np.add(M[:k], w[:k], out=M[:k])
+            np.multiply(x[k:], -P * a / L, out=w[k:])
+            np.add(w[k:], P * a, out=w[k:])
+            np.add(M[k:], w[k:], out=M[k:])
+            # Shear V = dM/dx
+            V[:k] += P * (L - a) / L
+            V[k:] -= P * a / L
+            
+        elif load.type == 'distributed':
+            # Supported-Supported Distributed Load q on [c, d]
+            # Reaction: Ra = q(d-c)(L - (c+d)/2)/L
+            # M(x) = Ra*x - q/2 * (<x-c>^2 - <x-d>^2)
+            # For a full-span load this reduces to qL/2 * x - qx^2 / 2
+            q = load.magnitude * scale
+            c, d = clip_to_span(load.position, load.end_pos, L)
+            Ra = q * (d - c) * (L - (c + d) / 2) / L
+            np.multiply(x, Ra, out=w)
+            np.add(M, w, out=M)
+            V += Ra
+            for edge, sign in ((c, -1), (d, 1)):
+                # V gains sign * q <x - edge>, M gains sign * q/2 <x - edge>^2
+                k = split(edge)
+                np.subtract(x[k:], edge, out=w[k:])
+                np.multiply(w[k:], sign * q, out=w[k:])
+                np.add(V[k:], w[k:], out=V[k:])
+                np.subtract(x[k:], edge, out=w[k:])
+                np.square(w[k:], out=w[k:])
+                np.multiply(w[k:], sign * q / 2, out=w[k:])
+                np.add(M[k:], w[k:], out=M[k:])
+
+        elif load.type == 'moment':
+            # Bending Moment Load
+            # M = Ra x, plus M0 beyond a
+            M0 = load.magnitude * scale
+            a = load.position
+            Ra = -M0 / L
+            k = split(a)
+            np.multiply(x, Ra, out=w)
+            np.add(M, w, out=M)
+            M[k:] += M0
+            V += Ra
+
+        elif load.type == 'torsion':
+            # Torque T applied at position a.
+            # Fixed at x=0 (e.g. motor), Free at x=L
+            # Internal Torque T(x) = T for 0 <= x < a, 0 for x > a
+            # This depends on boundary conditions.
+            # Assuming Fixed-Free (Shaft driven at 0)
+            k = split(load.position)
+            self.torque_distribution[:k] += load.magnitude * scale
+
+        elif load.type == 'axial':
+            # Axial Force P applied at position a.
+            # Fixed at x=0.
+            # Internal Force P(x) = P for 0 <= x < a
+            k = split(load.position)
+            self.axial_distribution[:k] += load.magnitude * scale
+            
+        elif load.type == 'parametric':
+            # q(x) from a compiled expression, integrated with simply supported reactions
+            Vq, Mq = load.apply(self.x, L)
+            if scale != 1:
+                Vq, Mq = Vq * scale, Mq * scale
+            np.add(V, Vq, out=V)
+            np.add(M, Mq, out=M)
+
+    def _load_nodes(self):
+        """
+        Positions where M(x) has a kink or a jump: every load position and every
+        start/end of a distributed or parametric load. Couples get a second node just
+        to the right of a, so the jump is captured across a zero-width interval.
+        """
+        L = self.beam.length
+        nodes = [0.0, L]
+        for load in self.beam.loads:
+            nodes.append(load.position)
+            if hasattr(load, 'end_pos'):
+                nodes.append(load.end_pos)
+            if load.type == 'moment' and load.position < L:
+                nodes.append(np.nextafter(load.position, L))
+        nodes.extend(self._step_nodes())
+        return np.clip(nodes, 0, L)
+
+    def _step_nodes(self):
+        """
+        A node at every section step and one just to its right, so each side of the
+        step has its own EI and the jump in M/EI falls in a zero-width interval.
+        """
+        # In the solver precision, so the pair stays distinct on a float32 grid
+        L = self.dtype.type(self.beam.length)
+        steps = [self.dtype.type(step) for step in self.beam.steps]
+        return [node for step in steps for node in (step, np.nextafter(step, L))]
+
+    def section_stiffness(self):
+        """
+        EI, GJ and EA on the grid: scalars for a uniform beam, arrays from a
+        vectorized segment lookup for a stepped one. The arrays are built once per
+        grid and geometry and reused by every later solve.
+
+        Returns:
+            tuple: (EI, GJ, EA)
+        """
+        beam = self.beam
+        key = (beam.segments, beam.E, beam.G)
+        if self._stiffness is not None and self._stiffness[0][0] is key[0] and self._stiffness[0][1:] == key[1:]:
+            return self._stiffness[1]
+        if beam.stepped:
+            sections = beam.section_properties(self.x)
+            stiffness = tuple((modulus * sections[prop]).astype(self.dtype)
+                              for modulus, prop in ((beam.E, 'I'), (beam.G, 'J'), (beam.E, 'A')))
+        else:
+            # Fallback if A is missing (e.g. simple Rect profile might compute it differently)
+            A = getattr(beam.profile, 'A', 1.0)
+            stiffness = (beam.E * beam.I, beam.G * beam.J, beam.E * A)
+        self._stiffness = (key, stiffness)
+        return stiffness
+
+    def _refine_grid(self):
+        """
+        Adaptive grid: bisect the intervals with the largest estimated trapezoid error
+        on v(x) until the total estimate is below tol * max|v|, or max_points is hit.
+
+        Between exact load nodes M(x) is smooth, so the local error of the double
+        integration is ~ h^2/12 * (|dM| + L*|change of M'|) / EI per interval.
+        """
+        L = self.beam.length
+        while True:
+            self.aggregate_loads()
+            self.solve_bending()
+            # Stiffest-case estimate on a stepped shaft: the error scales with 1/EI
+            EI = np.min(self.section_stiffness()[0])
+
+            h = np.diff(self.x)
+            err = 0
+            for M in (self.moment_distribution, self.moment_distribution_z):
+                dM = np.diff(M)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    dMdx = np.where(h > 0, dM / h, 0)
+                kink = np.abs(np.diff(dMdx))
+                curvature = np.maximum(np.append(kink, 0), np.insert(kink, 0, 0))
+                err = err + h**2 / 12 * (np.abs(dM) + L * curvature * h) / EI
+
+            target = self.tol * max(np.max(np.abs(self.deflection)), np.finfo(float).tiny)
+            if err.sum() <= target or self.x.size >= self.max_points:
+                break
+
+            # Split every interval above its share of the error budget
+            split = err > target / err.size
+            budget = self.max_points - self.x.size
+            if np.count_nonzero(split) > budget:
+                split[np.argsort(err)[:-budget]] = False
+            midpoints = (self.x[:-1][split] + self.x[1:][split]) / 2
+            self._set_grid(np.sort(np.concatenate((self.x, midpoints))))
+
+    def solve_lazy(self):
+        """
+        Returns a LazyResults mapping: each field is aggregated and integrated only
+        when first read. Engines other than the uniform-grid numerical one need the
+        whole solution at once and are solved eagerly.
+        """
+        if self.engine != 'numerical' or self.grid != 'uniform':
+            self.solve()
+        return LazyResults(self)
+
+    def summary(self):
+        """
+        Extrema only: for each of deflection, slope, twist and elongation, the largest
+        absolute value, where it occurs and its sign.
+
+        The analytic engine finds them from the zeros of the slope and of M without
+        building any profile. The other engines, and every engine when loads act in
+        both bending planes (deflection and slope are then the y-z resultant), solve
+        and reduce each field with an argmax/argmin pass. That solve allocates new
+        profiles unless workspace=True; the batch, sweep and daemon modes build
+        their summary-only solvers with it (see batch.summary_solver).
+
+        Returns:
+            dict: field -> {'max': |value|, 'x': location, 'value': signed value}
+        """
+        with self._phase('summary'):
+            if self.engine == 'analytic' and not self.two_planes():
+                return AnalyticSolver(self.beam).extrema()
+            results = self.solve()
+            return {field: extremum(results[field], results['x'])
+                    for field in ('deflection', 'slope', 'twist', 'elongation')}
+
+    def solve_analytic(self, x=None):
+        """
+        Evaluates the closed-form superposition solution, on the solver grid by default
+        or at any query points given in x. See AnalyticSolver. Loads in both bending
+        planes are evaluated per plane and combined as in solve().
+        """
+        with self._phase('solve_analytic'):
+            if self.two_planes():
+                y, z = (AnalyticSolver(self.beam, plane=plane).evaluate(self.x if x is None else x)
+                        for plane in (0, 1))
+                results = dict(y)
+                results['deflection_planes'] = np.stack((y['deflection'], z['deflection']))
+                results['slope_planes'] = np.stack((y['slope'], z['slope']))
+                results['deflection'] = np.hypot(*results['deflection_planes'])
+                results['slope'] = np.hypot(*results['slope_planes'])
+            else:
+                results = AnalyticSolver(self.beam).evaluate(self.x if x is None else x)
+        if x is None:
+            self.deflection = results['deflection']
+            self.slope = results['slope']
+            self.twist = results['twist']
+            self.elongation = results['elongation']
+            self.deflection_planes = results.get('deflection_planes')
+            self.slope_planes = results.get('slope_planes')
+        return results
+
+    def solve_fem(self):
+        """
+        Solves the support-aware finite element model (see BandedBeamSolver). The grid
+        gains exact nodes at supports and loads, and the internal moment, torque and
+        axial distributions are recovered from the element solution.
+        """
+        # Imported here: SciPy's linear algebra is only needed by this engine
+        from .fem import BandedBeamSolver
+        with self._phase('solve_fem'):
+            results = BandedBeamSolver(self.beam, self.x).solve()
+        self._set_grid(results['x'])
+        self.moment_distribution = results.pop('moment')
+        self.shear_distribution = results.pop('shear')
+        if 'moment_z' in results:
+            self.moment_distribution_z = results.pop('moment_z')
+            self.shear_distribution_z = results.pop('shear_z')
+        self.deflection_planes = results.get('deflection_planes')
+        self.slope_planes = results.get('slope_planes')
+        self.torque_distribution = results.pop('torque')
+        self.axial_distribution = results.pop('axial')
+        self.deflection = results['deflection']
+        self.slope = results['slope']
+        self.twist = results['twist']
+        self.elongation = results['elongation']
+        return results
 
     def reset_distributions(self):
         self.moment_distribution.fill(0)
         self.shear_distribution.fill(0)
+        self.moment_distribution_z.fill(0)
+        self.shear_distribution_z.fill(0)
         self.torque_distribution.fill(0)
         self.axial_distribution.fill(0)
+        self._tracked = None
 
     def solve_bending(self):
-        EI = self.beam.E * self.beam.I
-        # Slope theta = int(M/EI)
-        theta_0 = cumtrapz(self.moment_distribution / EI, self.x, initial=0)
-        # Deflection y = int(theta)
-        y_0 = cumtrapz(theta_0, self.x, initial=0)
-        
-        # BCs for Supported-Supported: y(0)=0, y(L)=0
-        C1 = -y_0[-1] / self.beam.length
-        self.slope = theta_0 + C1
-        self.deflection = y_0 + C1 * self.x
+        """
+        Integrates both bending planes. With x-z loads present, deflection and slope
+        become the resultant and the planes are kept in deflection_planes and
+        slope_planes.
+        """
+        with self._phase('solve_bending'):
+            EI = self.section_stiffness()[0]
+            if self.workspace:
+                self._integrate_bending_inplace(EI)
+            else:
+                self.slope, self.deflection = _integrate_bending(self.moment_distribution, self.x, EI, self.beam.length)
+            if not self.two_planes():
+                self.deflection_planes = self.slope_planes = None
+                return
+            slope_z, deflection_z = _integrate_bending(self.moment_distribution_z, self.x, EI, self.beam.length)
+            self.deflection_planes = np.stack((self.deflection, deflection_z))
+            self.slope_planes = np.stack((self.slope, slope_z))
+            if self.workspace:
+                np.hypot(self.deflection, deflection_z, out=self.deflection)
+                np.hypot(self.slope, slope_z, out=self.slope)
+            else:
+                self.deflection = np.hypot(self.deflection, deflection_z)
+                self.slope = np.hypot(self.slope, slope_z)
 
     def solve_torsion(self):
-        # Phi' = T / GJ
-        GJ = self.beam.G * self.beam.J
-        if GJ == 0:
-            if np.any(self.torque_distribution):
-                print("Warning: Torsional stiffness is zero but torque is applied. Infinite twist predicted.")
-                phi_prime = np.full_like(self.x, np.inf)
+        with self._phase('solve_torsion'):
+            # Phi' = T / GJ
+            GJ = self.section_stiffness()[1]
+            if self.workspace and np.all(GJ != 0):
+                self._cumtrapz_inplace(self.torque_distribution, 1 / GJ, self.twist)
             else:
-                phi_prime = np.zeros_like(self.x)
-        else:
-            phi_prime = self.torque_distribution / GJ
-        # Twist phi = int(phi')
-        # BC: Fixed at x=0 => phi(0) = 0
-        self.twist = cumtrapz(phi_prime, self.x, initial=0)
+                self.twist = _integrate_torsion(self.torque_distribution, self.x, GJ)
 
     def solve_axial(self):
         # u' = P / EA
-        # We need Area A.
-        # Assuming Beam object has access to A via profile or material?
-        # Profile usually has A.
-        try:
-            A = self.beam.profile.A
-        except AttributeError:
-            # Fallback if A is missing (e.g. simple Rect profile might compute it differently)
-            A = 1.0 # Placeholder
-            
-        EA = self.beam.E * A
-        u_prime = self.axial_distribution / EA
-        # Elongation u = int(u')
-        # BC: Fixed at x=0 => u(0) = 0
-        self.elongation = cumtrapz(u_prime, self.x, initial=0)
+        EA = self.section_stiffness()[2]
+        with self._phase('solve_axial'):
+            if self.workspace:
+                self._cumtrapz_inplace(self.axial_distribution, 1 / EA, self.elongation)
+            else:
+                self.elongation = _integrate_axial(self.axial_distribution, self.x, EA)
+
+    def _cumtrapz_inplace(self, y, scale, out):
+        """
+        out = cumtrapz(scale * y, x, initial=0), written into out using only the
+        workspace buffer. scale is a scalar or, on a stepped shaft, an array on the grid.
+        """
+        w = self._work
+        if np.ndim(scale):
+            # Varying scale goes inside the integral; out holds the scaled integrand
+            np.multiply(y, scale, out=out)
+            y, scale = out, 1
+        np.add(y[1:], y[:-1], out=w[1:])
+        np.multiply(w[1:], self._half_dx, out=w[1:])
+        out[0] = 0
+        # Accumulate in double precision even for float32 buffers
+        np.cumsum(w[1:], dtype=np.float64, out=out[1:])
+        if scale != 1:
+            np.multiply(out, scale, out=out)
+
+    def _integrate_bending_inplace(self, EI):
+        # Same as _integrate_bending, into the preallocated slope/deflection buffers
+        self._cumtrapz_inplace(self.moment_distribution, 1 / EI, self.slope)
+        self._cumtrapz_inplace(self.slope, 1, self.deflection)
+        C1 = -self.deflection[-1] / self.beam.length
+        np.add(self.slope, C1, out=self.slope)
+        np.multiply(self.x, C1, out=self._work)
+        np.add(self.deflection, self._work, out=self.deflection)
+
+    def solve_batch(self, load_cases):
+        """
+        Solves several load cases that share this solver's beam geometry and grid.
+
+        Every load of every case is turned into a unit shape on the grid, scaled and
+        summed into its case row with one matrix product per load type and bending
+        plane, and the integrations run along the last axis for all cases at once.
+
+        Args:
+            load_cases (list): One list of Load objects per case. ``beam.loads`` is ignored.
+
+        Returns:
+            dict: 'deflection', 'slope', 'twist' and 'elongation' as (N, num_points)
+                  arrays, the internal 'moment', 'shear', 'torque' and 'axial'
+                  distributions in the same layout, plus the shared grid 'x'. When
+                  any case has x-z loads, 'moment_z' and 'shear_z' hold that plane,
+                  'deflection_planes' / 'slope_planes' are (2, N, num_points) and the
+                  rows of the cases with x-z loads are the resultant, as in solve().
+        """
+        n_cases = len(load_cases)
+        L = self.beam.length
+        x = self.x
+
+        # Bending distributions per plane: (plane, case, num_points)
+        moment = np.zeros((2, n_cases, x.size))
+        shear = np.zeros((2, n_cases, x.size))
+        torque = np.zeros((n_cases, x.size))
+        axial = np.zeros((n_cases, x.size))
+        two_planes = np.zeros(n_cases, dtype=bool)
+
+        # Group every load by type and plane, remembering the case it belongs to
+        groups = {}
+        for case_idx, loads in enumerate(load_cases):
+            for load in loads:
+                plane = bending_plane(load)
+                two_planes[case_idx] |= plane == 1
+                if load.type == 'parametric':
+                    # Shape depends on the expression, not on a magnitude; apply() caches it
+                    V, M = load.apply(x, L)
+                    shear[plane, case_idx] += V
+                    moment[plane, case_idx] += M
+                    continue
+                end = getattr(load, 'end_pos', load.position)
+                groups.setdefault((load.type, plane), []).append((case_idx, load.position, end, load.magnitude))
+
+        for (load_type, plane), entries in groups.items():
+            case_idx, a, end, P = (np.asarray(v, dtype=float) for v in zip(*entries))
+            case_idx = case_idx.astype(int)
+
+            if load_type == 'point':
+                targets = ((moment[plane], _point_moment_shapes(x, a, L)),
+                           (shear[plane], _point_shear_shapes(x, a, L)))
+            elif load_type == 'distributed':
+                targets = ((moment[plane], _distributed_moment_shapes(x, a, end, L)),
+                           (shear[plane], _distributed_shear_shapes(x, a, end, L)))
+            elif load_type == 'moment':
+                targets = ((moment[plane], _moment_load_shapes(x, a, L)),
+                           (shear[plane], np.full((a.size, x.size), -1 / L)))
+            elif load_type == 'torsion':
+                targets = ((torque, _step_shapes(x, a)),)
+            elif load_type == 'axial':
+                targets = ((axial, _step_shapes(x, a)),)
+            else:
+                continue
+
+            # Scatter matrix: row = case, column = load, value = magnitude
+            weights = np.zeros((n_cases, a.size))
+            weights[case_idx, np.arange(a.size)] = P
+            for target, shapes in targets:
+                target += weights @ shapes
+
+        EI, GJ, EA = self.section_stiffness()
+        results = {
+            "twist": _integrate_torsion(torque, x, GJ),
+            "elongation": _integrate_axial(axial, x, EA),
+            "moment": moment[0],
+            "shear": shear[0],
+            "torque": torque,
+            "axial": axial,
+            "x": x
+        }
+        if two_planes.any():
+            slope, deflection = _integrate_bending(moment, x, EI, L)
+            results.update(_combine_planes(slope, deflection, two_planes))
+            results["moment_z"] = moment[1]
+            results["shear_z"] = shear[1]
+        else:
+            results["slope"], results["deflection"] = _integrate_bending(moment[0], x, EI, L)
+        return results
+
+    def solve_planes(self):
+        """
+        Bending in the two transverse planes of a shaft, solved together.
+
+        The loads are one solve_batch case: the y and z moment distributions are
+        built per plane (see bending_plane) and integrated as one stacked problem,
+        so the cost barely depends on how many loads each plane carries. Torsion
+        and axial loads are plane-independent.
+
+        Returns:
+            dict: 'deflection' and 'slope' as the resultant sqrt(y^2 + z^2),
+                  'deflection_planes' and 'slope_planes' as (2, num_points) arrays
+                  (row 0: y, row 1: z), 'twist', 'elongation' and 'x'.
+        """
+        with self._phase('solve_planes'):
+            results = self.solve_batch([self.beam.loads])
+        if 'deflection_planes' in results:
+            deflection, slope = results['deflection_planes'][:, 0], results['slope_planes'][:, 0]
+        else:
+            zeros = np.zeros_like(self.x)
+            deflection = np.stack((results['deflection'][0], zeros))
+            slope = np.stack((results['slope'][0], zeros))
+        return {
+            "deflection": np.hypot(*deflection),
+            "slope": np.hypot(*slope),
+            "deflection_planes": deflection,
+            "slope_planes": slope,
+            "twist": results['twist'][0],
+            "elongation": results['elongation'][0],
+            "x": self.x
+        }
+
+
+def _combine_planes(slope, deflection, two_planes):
+    """
+    Batch results from per-plane (2, N, num_points) slope and deflection: the rows of
+    the cases flagged in two_planes become the y-z resultant, the others keep their
+    signed x-y values, as solve() returns them case by case.
+    """
+    flagged = two_planes[:, None]
+    return {
+        "deflection": np.where(flagged, np.hypot(*deflection), deflection[0]),
+        "slope": np.where(flagged, np.hypot(*slope), slope[0]),
+        "deflection_planes": deflection,
+        "slope_planes": slope,
+    }
+
+
+# --- Unit load shapes: one row per load, evaluated on the grid x ---
+
+def _point_moment_shapes(x, a, L):
+    # M(x) for a unit point load at a on a simply supported span:
+    # (L - a) x / L - <x - a>
+    a = a[:, None]
+    return (L - a) * x / L - np.maximum(x - a, 0)
+
+def _distributed_moment_shapes(x, c, d, L):
+    # Unit q on [c, d]: M(x) = Ra x - (<x - c>^2 - <x - d>^2) / 2
+    c, d = clip_to_span(c[:, None], d[:, None], L)
+    Ra = (d - c) * (L - (c + d) / 2) / L
+    return Ra * x - (np.maximum(x - c, 0)**2 - np.maximum(x - d, 0)**2) / 2
+
+def _point_shear_shapes(x, a, L):
+    # V(x) = dM/dx for a unit point load: (L - a) / L, dropping by 1 beyond a
+    a = a[:, None]
+    return (L - a) / L - (x > a)
+
+def _distributed_shear_shapes(x, c, d, L):
+    # Unit q on [c, d]: V(x) = Ra - (<x - c> - <x - d>)
+    c, d = clip_to_span(c[:, None], d[:, None], L)
+    Ra = (d - c) * (L - (c + d) / 2) / L
+    return Ra - (np.maximum(x - c, 0) - np.maximum(x - d, 0))
+
+def _moment_load_shapes(x, a, L):
+    # Unit couple at a: M(x) = -x / L + <x - a>^0
+    a = a[:, None]
+    return -x / L + (x > a)
+
+def _step_shapes(x, a):
+    # Internal torque/axial force for a unit load at a, fixed at x=0
+    return (x <= a[:, None]).astype(float)
+
+
+# --- Integrations along the last axis, shared by single and batched solves ---
+
+def _integrate_bending(M, x, EI, L):
+    # Slope theta = int(M/EI)
+    theta_0 = cumtrapz(M / EI, x, axis=-1, initial=0)
+    # Deflection y = int(theta)
+    y_0 = cumtrapz(theta_0, x, axis=-1, initial=0)
+
+    # BCs for Supported-Supported: y(0)=0, y(L)=0
+    C1 = -y_0[..., -1:] / L
+    return theta_0 + C1, y_0 + C1 * x
+
+def _integrate_torsion(T, x, GJ):
+    if np.ndim(GJ) and np.any(GJ == 0):
+        # Stepped shaft with segments lacking torsional stiffness
+        free = GJ == 0
+        if np.any(T * free):
+            print("Warning: Torsional stiffness is zero but torque is applied. Infinite twist predicted.")
+        with np.errstate(divide='ignore', invalid='ignore'):
+            phi_prime = np.where(free, np.where(T != 0, np.inf, 0.0), T / np.where(free, 1, GJ))
+    elif np.ndim(GJ) == 0 and GJ == 0:
+        if np.any(T):
+            print("Warning: Torsional stiffness is zero but torque is applied. Infinite twist predicted.")
+            phi_prime = np.full_like(T, np.inf)
+        else:
+            phi_prime = np.zeros_like(T)
+    else:
+        phi_prime = T / GJ
+    # Twist phi = int(phi')
+    # BC: Fixed at x=0 => phi(0) = 0
+    return cumtrapz(phi_prime, x, axis=-1, initial=0)
+
+def _integrate_axial(P, x, EA):
+    u_prime = P / EA
+    # Elongation u = int(u')
+    # BC: Fixed at x=0 => u(0) = 0
+    return cumtrapz(u_prime, x, axis=-1, initial=0)
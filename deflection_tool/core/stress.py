@@ -0,0 +1,147 @@
+import numpy as np
+
+# Peak transverse shear stress = factor * V / A, at the neutral axis
+PEAK_SHEAR_FACTOR = {'circular': 4 / 3, 'rectangular': 3 / 2}
+
+STRESS_FIELDS = ('bending', 'axial', 'torsion', 'transverse_shear', 'von_mises', 'safety_factor')
+
+
+class StressAnalysis:
+    """
+    Stresses and safety factor along the beam from its internal force distributions.
+
+    Works on arrays of any leading shape, so one call covers a single solve
+    (num_points,) or a batch of load cases (N, num_points) from Solver.solve_batch.
+
+    Two points of the section are checked at every station:
+        outer fiber:  sigma = |M| y_max / I + |N| / A,   tau = |T| r / J
+        neutral axis: sigma = |N| / A,                  tau = |T| r / J + k |V| / A
+    with k the peak shear factor of the section (4/3 round, 3/2 rectangular). The von
+    Mises stress is the larger of sqrt(sigma^2 + 3 tau^2) at the two points and the
+    safety factor is yield_strength / von Mises (inf where unstressed).
+
+    On a stepped shaft the section properties follow the segment of every station.
+    """
+    def __init__(self, beam):
+        self.beam = beam
+        profile = beam.profile
+        self.shear_factor = PEAK_SHEAR_FACTOR.get(profile.type, profile.shear_correction)
+
+    def evaluate(self, moment, torque=0.0, axial=0.0, shear=0.0, x=None):
+        """
+        Args:
+            moment, torque, axial, shear (array_like): Internal bending moment,
+                torque, axial force and transverse shear, broadcastable together.
+            x (array_like): Stations along the last axis; required for a stepped shaft.
+
+        Returns:
+            dict: STRESS_FIELDS as arrays of the broadcast shape [Pa, and - for the
+                  safety factor].
+        """
+        M, T, N, V = np.broadcast_arrays(*(np.abs(np.asarray(f, dtype=float))
+                                           for f in (moment, torque, axial, shear)))
+        y_max, I, J, A, shear_factor = self._sections(x)
+
+        bending = M * (y_max / I)
+        axial_stress = N / A
+        transverse = V * (shear_factor / A)
+        if np.all(J):
+            torsion = T * (y_max / J)
+        elif np.any(T * (J == 0)):
+            raise ValueError("Torsional stiffness is zero but torque is applied; torsional stress is undefined.")
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                torsion = np.where(J == 0, 0.0, T * (y_max / np.where(J == 0, 1, J)))
+
+        sigma = bending + axial_stress
+        outer = np.sqrt(sigma**2 + 3 * torsion**2)
+        neutral = np.sqrt(axial_stress**2 + 3 * (torsion + transverse)**2)
+        von_mises = np.maximum(outer, neutral)
+
+        yield_strength = self.beam.material.yield_strength
+        with np.errstate(divide='ignore'):
+            safety = np.where(von_mises > 0, yield_strength / von_mises, np.inf)
+
+        return {
+            'bending': bending,
+            'axial': axial_stress,
+            'torsion': torsion,
+            'transverse_shear': transverse,
+            'von_mises': von_mises,
+            'safety_factor': safety,
+        }
+
+    def _sections(self, x):
+        # y_max, I, J, A and peak shear factor: scalars, or per station when stepped
+        beam = self.beam
+        if not beam.stepped:
+            profile = beam.profile
+            return profile.y_max, profile.I, profile.J, profile.A, self.shear_factor
+        if x is None:
+            raise ValueError("Stresses on a stepped shaft need the stations x.")
+        sections = beam.section_properties(x)
+        factors = np.array([PEAK_SHEAR_FACTOR.get(profile.type, profile.shear_correction)
+                            for _, _, profile in beam.segments])
+        return (sections['y_max'], sections['I'], sections['J'], sections['A'],
+                factors[beam.segment_index(x)])
+
+    def from_solver(self, solver):
+        """
+        Stresses on the solver's grid. The internal force distributions are built if
+        the engine does not (the analytic engine), and solved where the grid or the
+        distributions come out of the solve (adaptive grid, fem engine). Moment and
+        shear are the resultants of the x-y and x-z planes, sqrt(My^2 + Mz^2) on a
+        round shaft.
+
+        Returns:
+            dict: STRESS_FIELDS plus the grid 'x'.
+        """
+        if solver.engine == 'fem' or (solver.engine == 'numerical' and solver.grid == 'adaptive'):
+            solver.solve()
+        else:
+            solver.aggregate_loads()
+        moment = np.hypot(solver.moment_distribution, solver.moment_distribution_z)
+        shear = np.hypot(solver.shear_distribution, solver.shear_distribution_z)
+        out = self.evaluate(moment, solver.torque_distribution, solver.axial_distribution, shear, solver.x)
+        out['x'] = solver.x
+        return out
+
+    def from_batch(self, results):
+        """
+        Stresses for every case of a Solver.solve_batch result, as (N, num_points).
+        Moment and shear are the resultants of both planes when the batch has x-z loads.
+        """
+        moment = np.hypot(results['moment'], results.get('moment_z', 0.0))
+        shear = np.hypot(results['shear'], results.get('shear_z', 0.0))
+        out = self.evaluate(moment, results['torque'], results['axial'], shear, results['x'])
+        out['x'] = results['x']
+        return out
+
+
+def critical_sections(stresses, count=3):
+    """
+    The `count` most stressed sections: local peaks of the von Mises stress along
+    the grid, highest first, so a single peak is not reported several times over
+    its neighbouring stations.
+
+    Args:
+        stresses (dict): StressAnalysis output, (num_points,) or (N, num_points).
+
+    Returns:
+        dict: 'index', 'x', 'von_mises' and 'safety_factor', each (count,) or
+              (N, count). Cases with fewer peaks are padded with index -1 and nan.
+    """
+    vm = np.asarray(stresses['von_mises'])
+    x = np.asarray(stresses['x'])
+    padded = np.pad(vm, [(0, 0)] * (vm.ndim - 1) + [(1, 1)], constant_values=-np.inf)
+    center = padded[..., 1:-1]
+    peak = (center >= padded[..., :-2]) & (center > padded[..., 2:]) & (center > 0)
+
+    ranked = np.argsort(np.where(peak, -vm, np.inf), axis=-1, kind='stable')[..., :count]
+    valid = np.take_along_axis(peak, ranked, axis=-1)
+    index = np.where(valid, ranked, -1)
+    out = {'index': index, 'x': np.where(valid, x[ranked], np.nan)}
+    for field in ('von_mises', 'safety_factor'):
+        values = np.take_along_axis(np.asarray(stresses[field]), ranked, axis=-1)
+        out[field] = np.where(valid, values, np.nan)
+    return out
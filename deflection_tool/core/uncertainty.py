@@ -0,0 +1,296 @@
+import numpy as np
+
+from .integrate import cumulative_trapezoid as cumtrapz
+from .profiles import Profile
+from .solver import (bending_plane, _point_moment_shapes, _distributed_moment_shapes,
+                     _moment_load_shapes, _step_shapes, _integrate_bending, _integrate_torsion,
+                     _integrate_axial)
+
+# Samples evaluated per block, bounding memory to a few CHUNK_SAMPLES x num_points arrays
+CHUNK_SAMPLES = 512
+
+DISTRIBUTIONS = ('normal', 'lognormal', 'uniform', 'triangular')
+
+UNCERTAIN_FIELDS = ('deflection', 'slope', 'twist', 'elongation')
+
+# Load attributes that may be sampled
+LOAD_FIELDS = ('magnitude', 'position', 'end_pos')
+
+
+class MonteCarloAnalysis:
+    """
+    Monte Carlo propagation of tolerances and property scatter to the deformations.
+
+    Inputs are addressed by path and given a distribution:
+        'material.E', 'material.G', 'material.nu'     material properties
+        'profile.<dimension>'                          e.g. 'profile.diameter'
+        'loads.<i>.magnitude' / '.position' / '.end_pos'   beam.loads[i]
+    as dicts such as {'dist': 'normal', 'std': 0.02e-3}, {'dist': 'uniform',
+    'tolerance': 0.05e-3}, {'dist': 'lognormal', 'cov': 0.1} or {'dist': 'triangular',
+    'low': ..., 'high': ...}. Missing means (normal, lognormal) and modes (triangular)
+    default to the nominal value on the beam; 'cov' is the std relative to the mean.
+    Unless G is sampled itself, it follows E and nu at the nominal G / (E / (1 + nu)).
+
+    Every sample is solved at once: the sampled section properties come from Profile
+    evaluated on arrays, the moment, torque and axial force of all samples are
+    (samples, num_points) arrays built from the unit load shapes of Solver.solve_batch,
+    and the integrations run along the grid axis. Samples are processed in blocks of
+    chunk_size, so memory does not grow with the sample count.
+
+    Uses the simply supported model of the numerical engine; point loads and couples
+    in the x-z plane are solved as a second plane and combined as in solve_planes.
+    """
+    def __init__(self, beam, distributions, num_points=1000):
+        """
+        Args:
+            beam (Beam): Nominal beam.
+            distributions (dict): Path -> distribution spec (see class docstring).
+            num_points (int): Grid size.
+        """
+        if beam.stepped:
+            raise ValueError("Uncertainty analysis samples a single profile; stepped shafts are not supported.")
+        self.beam = beam
+        self.distributions = dict(distributions)
+        self.x = np.linspace(0, beam.length, num_points)
+        self.nominal = {}
+        for path, spec in self.distributions.items():
+            self.nominal[path] = self._nominal(path)
+            if spec.get('dist', 'normal') not in DISTRIBUTIONS:
+                raise ValueError(f"Unknown distribution '{spec.get('dist')}' for '{path}', "
+                                 f"expected one of {DISTRIBUTIONS}.")
+        self._prepare_loads()
+
+    def _nominal(self, path):
+        parts = path.split('.')
+        if parts[0] == 'material' and len(parts) == 2:
+            if parts[1] not in ('E', 'G', 'nu'):
+                raise ValueError(f"Only E, G and nu can be sampled, not '{path}'.")
+            return self.beam.material.properties[parts[1]]
+        if parts[0] == 'profile' and len(parts) == 2:
+            if parts[1] not in self.beam.profile.dimensions:
+                raise ValueError(f"Profile has no dimension '{parts[1]}' ('{path}').")
+            return self.beam.profile.dimensions[parts[1]]
+        if parts[0] == 'loads' and len(parts) == 3:
+            load = self.beam.loads[int(parts[1])]
+            if parts[2] not in LOAD_FIELDS or not hasattr(load, parts[2]) or load.type == 'parametric':
+                raise ValueError(f"Load {parts[1]} ({load.type}) has no sampled field '{parts[2]}'.")
+            return getattr(load, parts[2])
+        raise ValueError(f"Unknown uncertain input '{path}'.")
+
+    def _prepare_loads(self):
+        # Loads with nothing sampled are summed once into the base distributions;
+        # loads with a sampled magnitude only keep their unit shape for a matrix
+        # product per block; loads with a sampled position are rebuilt per block
+        x, L = self.x, self.beam.length
+        self._base = {'moment': np.zeros((2, x.size)), 'torque': np.zeros(x.size),
+                      'axial': np.zeros(x.size)}
+        scaled = {}
+        self._moving = []
+        for i, load in enumerate(self.beam.loads):
+            sampled = {field for field in LOAD_FIELDS if f'loads.{i}.{field}' in self.distributions}
+            if load.type == 'parametric':
+                self._base['moment'][bending_plane(load)] += load.apply(x, L)[1]
+            elif sampled - {'magnitude'}:
+                self._moving.append(i)
+            else:
+                target, shape = _unit_shape(load, x, L, np.array([load.position]),
+                                            np.array([getattr(load, 'end_pos', load.position)]))
+                if shape is None:
+                    continue
+                if 'magnitude' in sampled:
+                    scaled.setdefault(target, []).append((i, shape[0]))
+                elif isinstance(target, tuple):
+                    self._base['moment'][target[1]] += load.magnitude * shape[0]
+                else:
+                    self._base[target] += load.magnitude * shape[0]
+        # target -> (load indices, (k, num_points) unit shapes)
+        self._scaled = {target: ([i for i, _ in entries], np.array([s for _, s in entries]))
+                        for target, entries in scaled.items()}
+        self._two_planes = any(bending_plane(load) for load in self.beam.loads)
+
+    def sample(self, num_samples, seed=None):
+        """
+        Draws every uncertain input.
+
+        Returns:
+            dict: path -> (num_samples,) array.
+        """
+        rng = np.random.default_rng(seed)
+        L = self.beam.length
+        samples = {}
+        for path, spec in self.distributions.items():
+            values = _draw(rng, spec, self.nominal[path], num_samples, path)
+            if path.endswith(('.position', '.end_pos')):
+                # Loads stay on the span
+                np.clip(values, 0, L, out=values)
+            samples[path] = values
+        return samples
+
+    def responses(self, samples):
+        """
+        Deformations of every sample in `samples` (as returned by sample(), or any
+        dict of equally long arrays), solved together.
+
+        Returns:
+            dict: UNCERTAIN_FIELDS as (samples, num_points) arrays; 'deflection' and
+                  'slope' are the resultant of both bending planes.
+        """
+        x, L = self.x, self.beam.length
+        n = len(next(iter(samples.values()))) if samples else 1
+
+        def value(path, nominal):
+            return samples[path][:, None] if path in samples else nominal
+
+        E = value('material.E', self.beam.material.E)
+        if 'material.G' in samples:
+            G = samples['material.G'][:, None]
+        else:
+            # Shear modulus scales with E / (1 + nu) from its nominal value
+            nu0 = self.beam.material.properties['nu']
+            G = self.beam.material.G * (E / self.beam.material.E) * (1 + nu0) / (1 + value('material.nu', nu0))
+        profile = self.beam.profile
+        dimensions = {name: value(f'profile.{name}', nominal)
+                      for name, nominal in profile.dimensions.items()}
+        section = Profile(profile.type, dimensions) if any(
+            path.startswith('profile.') for path in samples) else profile
+
+        moment = np.broadcast_to(self._base['moment'][:, None, :], (2, n, x.size)).copy()
+        torque = np.broadcast_to(self._base['torque'], (n, x.size)).copy()
+        axial = np.broadcast_to(self._base['axial'], (n, x.size)).copy()
+        targets = {'torque': torque, 'axial': axial}
+
+        for target, (indices, shapes) in self._scaled.items():
+            magnitudes = np.column_stack([value(f'loads.{i}.magnitude', self.beam.loads[i].magnitude)
+                                          * np.ones((n, 1)) for i in indices])
+            out = moment[target[1]] if isinstance(target, tuple) else targets[target]
+            out += magnitudes @ shapes
+        for i in self._moving:
+            load = self.beam.loads[i]
+            a = value(f'loads.{i}.position', load.position) * np.ones((n, 1))
+            end = value(f'loads.{i}.end_pos', getattr(load, 'end_pos', load.position)) * np.ones((n, 1))
+            target, shape = _unit_shape(load, x, L, a[:, 0], end[:, 0])
+            if shape is None:
+                continue
+            out = moment[target[1]] if isinstance(target, tuple) else targets[target]
+            out += value(f'loads.{i}.magnitude', load.magnitude) * shape
+
+        EI = E * section.I
+        slope, deflection = _integrate_bending(moment[0], x, EI, L)
+        if self._two_planes:
+            slope_z, deflection_z = _integrate_bending(moment[1], x, EI, L)
+            slope, deflection = np.hypot(slope, slope_z), np.hypot(deflection, deflection_z)
+
+        GJ = G * section.J
+        if np.all(GJ):
+            twist = cumtrapz(torque / GJ, x, axis=-1, initial=0)
+        else:
+            twist = _integrate_torsion(torque, x, 0)
+        A = getattr(section, 'A', 1.0)
+        elongation = _integrate_axial(axial, x, E * A)
+
+        return {'deflection': deflection, 'slope': slope, 'twist': twist, 'elongation': elongation}
+
+    def evaluate(self, num_samples=10000, seed=None, limits=None,
+                 percentiles=(5, 50, 95, 99), chunk_size=CHUNK_SAMPLES):
+        """
+        Draws num_samples samples and reduces their responses block by block.
+
+        Args:
+            limits (dict): Field -> allowable peak |value| (e.g. {'deflection': 0.5e-3}),
+                           reported as a probability of exceedance.
+            percentiles (tuple): Percentiles of the peak values to report.
+
+        Returns:
+            dict: 'x', 'num_samples', 'inputs' (the drawn samples), and per field in
+                  UNCERTAIN_FIELDS: 'peak' (num_samples,) largest |value| of each
+                  sample, 'percentiles' {p: value} of the peaks, 'mean' and 'std'
+                  profiles along the grid, plus 'exceedance' {field: {'limit',
+                  'probability', 'stderr'}} for the given limits.
+        """
+        limits = limits or {}
+        for field in limits:
+            if field not in UNCERTAIN_FIELDS:
+                raise ValueError(f"Unknown limit field '{field}', expected one of {UNCERTAIN_FIELDS}.")
+        inputs = self.sample(num_samples, seed)
+        peak = {field: np.empty(num_samples) for field in UNCERTAIN_FIELDS}
+        mean = {field: np.zeros(self.x.size) for field in UNCERTAIN_FIELDS}
+        m2 = {field: np.zeros(self.x.size) for field in UNCERTAIN_FIELDS}
+
+        done = 0
+        for start in range(0, num_samples, chunk_size):
+            block = {path: values[start:start + chunk_size] for path, values in inputs.items()}
+            count = min(chunk_size, num_samples - start)
+            results = self.responses(block) if block else self._repeat(self.responses({}), count)
+            for field in UNCERTAIN_FIELDS:
+                values = results[field]
+                peak[field][start:start + count] = np.max(np.abs(values), axis=-1)
+                # Chan et al. pairwise update of the running mean and squared deviations
+                block_mean = values.mean(axis=0)
+                delta = block_mean - mean[field]
+                total = done + count
+                mean[field] += delta * count / total
+                m2[field] += ((values - block_mean)**2).sum(axis=0) + delta**2 * done * count / total
+            done += count
+
+        out = {'x': self.x, 'num_samples': num_samples, 'inputs': inputs, 'exceedance': {}}
+        for field in UNCERTAIN_FIELDS:
+            out[field] = {
+                'peak': peak[field],
+                'percentiles': dict(zip(percentiles, np.percentile(peak[field], percentiles).tolist())),
+                'mean': mean[field],
+                'std': np.sqrt(m2[field] / max(num_samples - 1, 1)),
+            }
+        for field, limit in limits.items():
+            p = float(np.mean(peak[field] > limit))
+            out['exceedance'][field] = {'limit': limit, 'probability': p,
+                                        'stderr': float(np.sqrt(p * (1 - p) / num_samples))}
+        return out
+
+    @staticmethod
+    def _repeat(results, count):
+        # Nothing sampled: every sample is the nominal solution
+        return {field: np.broadcast_to(values, (count, values.shape[-1])) for field, values in results.items()}
+
+
+def _unit_shape(load, x, L, a, end):
+    """
+    Unit response of a load at positions a (and ends `end`), one row per position:
+    (('moment', plane), shapes), ('torque', shapes) or ('axial', shapes); shapes is
+    None for load types without a unit shape.
+    """
+    if load.type == 'point':
+        return ('moment', bending_plane(load)), _point_moment_shapes(x, a, L)
+    if load.type == 'distributed':
+        return ('moment', bending_plane(load)), _distributed_moment_shapes(x, a, end, L)
+    if load.type == 'moment':
+        return ('moment', bending_plane(load)), _moment_load_shapes(x, a, L)
+    if load.type == 'torsion':
+        return 'torque', _step_shapes(x, a)
+    if load.type == 'axial':
+        return 'axial', _step_shapes(x, a)
+    return None, None
+
+
+def _draw(rng, spec, nominal, size, path):
+    dist = spec.get('dist', 'normal')
+    if dist == 'normal':
+        mean = spec.get('mean', nominal)
+        std = spec['std'] if 'std' in spec else spec['cov'] * abs(mean)
+        return rng.normal(mean, std, size)
+    if dist == 'lognormal':
+        # Parameterized by the mean and coefficient of variation of the value itself;
+        # negative means (e.g. downward loads) keep their sign
+        mean = spec.get('mean', nominal)
+        if mean == 0:
+            raise ValueError(f"Lognormal '{path}' needs a non-zero mean.")
+        cov = spec['cov'] if 'cov' in spec else spec['std'] / abs(mean)
+        sigma2 = np.log1p(cov**2)
+        return np.sign(mean) * rng.lognormal(np.log(abs(mean)) - sigma2 / 2, np.sqrt(sigma2), size)
+    if dist == 'uniform':
+        if 'tolerance' in spec:
+            low, high = nominal - spec['tolerance'], nominal + spec['tolerance']
+        else:
+            low, high = spec['low'], spec['high']
+        return rng.uniform(low, high, size)
+    # triangular
+    return rng.triangular(spec['low'], spec.get('mode', nominal), spec['high'], size)
@@ -0,0 +1,99 @@
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .input_parser import InputParser
+from ..core.solver import Solver
+from ..core.results import extremum
+
+
+def summarize(solver, results=None):
+    """
+    Solves and reduces to the maxima reported per record, as plain floats.
+    Pass the results of solver.solve() if they are already available.
+    """
+    if results is None:
+        summary = solver.summary()
+    else:
+        summary = {field: extremum(results[field], results['x'])
+                   for field in ('deflection', 'slope', 'twist', 'elongation')}
+    return {
+        'max_deflection': float(summary['deflection']['max']),
+        'max_deflection_x': float(summary['deflection']['x']),
+        'max_slope': float(summary['slope']['max']),
+        'max_twist': float(summary['twist']['max']),
+        'max_elongation': float(summary['elongation']['max']),
+    }
+
+
+def summary_solver(beam, solver_options=None):
+    """
+    Solver for a run reported through summarize() only. It integrates into its
+    workspace buffers (allocated with the grid) unless solver_options say
+    otherwise, so the default numerical engine allocates no new profiles for
+    the summary.
+    """
+    return Solver(beam, **{'workspace': True, **(solver_options or {})})
+
+
+def solve_record(record_no, line, solver_options=None):
+    """
+    Parses and solves one JSONL record. Any failure is returned in the output
+    record instead of raised, so one bad config never stops the batch.
+    """
+    out = {'record': record_no}
+    try:
+        config = json.loads(line)
+        if isinstance(config, dict) and 'id' in config:
+            out['id'] = config['id']
+        beam = InputParser.parse_dict(config)
+        out.update(summarize(summary_solver(beam, solver_options)))
+    except Exception as e:
+        out['error'] = f"{type(e).__name__}: {e}"
+    return out
+
+
+def iter_records(stream):
+    """
+    Yields (record_no, line) for every non-blank line of a JSONL stream.
+    record_no is the 1-based line number in the input.
+    """
+    for record_no, line in enumerate(stream, start=1):
+        if line.strip():
+            yield record_no, line
+
+
+def run_batch(in_stream, out_stream, solver_options=None, workers=1, window=64):
+    """
+    Streams JSONL configs from in_stream and writes one JSON result line per record
+    to out_stream, in input order.
+
+    With workers > 1 records are solved on a process pool, but at most `window`
+    records are in flight at any time, so memory stays bounded for any input size.
+
+    Returns:
+        tuple: (records processed, records with errors)
+    """
+    processed = failed = 0
+
+    def emit(result):
+        nonlocal processed, failed
+        processed += 1
+        failed += 'error' in result
+        out_stream.write(json.dumps(result) + '\n')
+        out_stream.flush()
+
+    if workers == 1:
+        for record_no, line in iter_records(in_stream):
+            emit(solve_record(record_no, line, solver_options))
+        return processed, failed
+
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for record_no, line in iter_records(in_stream):
+            pending.append(pool.submit(solve_record, record_no, line, solver_options))
+            if len(pending) >= window:
+                emit(pending.popleft().result())
+        while pending:
+            emit(pending.popleft().result())
+    return processed, failed
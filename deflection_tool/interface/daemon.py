@@ -0,0 +1,145 @@
+import json
+import os
+import socket
+
+# Kept free of NumPy and of the solver modules at import time: the client side only
+# needs json and socket, so a request costs the interpreter start and a round trip.
+
+# Warm solvers kept per grid (uniform numerical engine only)
+MAX_CACHED_SOLVERS = 16
+
+
+def default_socket_path():
+    """
+    Per-user socket in $XDG_RUNTIME_DIR, or in $TMPDIR (/tmp) without one.
+    """
+    directory = os.environ.get('XDG_RUNTIME_DIR') or os.environ.get('TMPDIR') or '/tmp'
+    return os.path.join(directory, f'deflection_tool-{os.getuid()}.sock')
+
+
+# --- Client ---
+
+def request(payload, socket_path=None, timeout=None):
+    """
+    Sends one request to a running daemon and returns its decoded response.
+
+    Args:
+        payload (dict): {'config': path or config dict, plus optional 'engine', 'grid',
+                        'tol', 'num_points' and 'modes'}, or {'command': 'ping'} /
+                        {'command': 'shutdown'}.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path or default_socket_path())
+        sock.sendall(json.dumps(payload).encode() + b'\n')
+        with sock.makefile('rb') as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("Daemon closed the connection without answering.")
+    return json.loads(line)
+
+
+# --- Server ---
+
+def serve(socket_path=None):
+    """
+    Answers solve requests on a Unix socket until a 'shutdown' command arrives.
+
+    Each connection sends newline-delimited JSON requests and receives one JSON line
+    per request: {'ok': True, 'lines': [...report...], 'summary': {...}} or
+    {'ok': False, 'error': '...'}. The interpreter, NumPy, the material registry,
+    compiled load expressions and one solver per grid stay loaded between requests,
+    so a request costs only the parse and the solve.
+    """
+    import socketserver
+    import threading
+    from collections import OrderedDict
+
+    from .input_parser import InputParser
+    from .report import beam_lines, result_lines
+    from ..core.materials import registry
+    from ..core.solver import Solver
+
+    socket_path = socket_path or default_socket_path()
+    registry()
+    solvers = OrderedDict()
+
+    def solver_for(beam, options):
+        engine = options.get('engine', 'numerical')
+        grid = options.get('grid', 'uniform')
+        num_points = options.get('num_points', 1000)
+        if engine != 'numerical' or grid != 'uniform':
+            # These engines rebuild their grid on every solve
+            return Solver(beam, num_points=num_points, engine=engine, grid=grid,
+                          tol=options.get('tol', 1e-6))
+        # The grid depends on the length and the steps of a stepped shaft; the
+        # section stiffness is rebuilt by the solver for every new beam
+        key = (beam.length, num_points, tuple(beam.steps))
+        solver = solvers.pop(key, None)
+        if solver is None:
+            solver = Solver(beam, num_points=num_points, workspace=True)
+            if len(solvers) >= MAX_CACHED_SOLVERS:
+                solvers.popitem(last=False)
+        solvers[key] = solver
+        solver.beam = beam
+        return solver
+
+    def handle(req):
+        command = req.get('command', 'solve')
+        if command == 'ping':
+            return {'ok': True, 'pid': os.getpid()}
+        if command != 'solve':
+            raise ValueError(f"Unknown command: {command}")
+        config = req['config']
+        if isinstance(config, str):
+            beam = InputParser.parse_json(config)
+        else:
+            beam = InputParser.parse_dict(config)
+        solver = solver_for(beam, req)
+        summary = solver.summary()
+        lines = beam_lines(beam) + result_lines(beam, solver, summary, req.get('modes', 0))
+        return {
+            'ok': True,
+            'lines': lines,
+            'summary': {field: {key: float(value) for key, value in stats.items()}
+                        for field, stats in summary.items()},
+        }
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                try:
+                    req = json.loads(raw)
+                    if req.get('command') == 'shutdown':
+                        self._reply({'ok': True})
+                        threading.Thread(target=self.server.shutdown).start()
+                        return
+                    response = handle(req)
+                except Exception as e:
+                    response = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+                self._reply(response)
+
+        def _reply(self, response):
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+            self.wfile.flush()
+
+    if os.path.exists(socket_path):
+        # Refuse to take over a live daemon, clean up after a dead one
+        try:
+            request({'command': 'ping'}, socket_path, timeout=1)
+        except OSError:
+            os.remove(socket_path)
+        else:
+            raise RuntimeError(f"A daemon is already listening on {socket_path}")
+
+    old_umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(socket_path, Handler)
+    finally:
+        os.umask(old_umask)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
@@ -1,13 +1,26 @@
 import json
 from ..core.beam import Beam
+from ..core.profiling import NULL_PHASE
 from ..core.loads import PointLoad, DistributedLoad, MomentLoad, TorsionLoad, AxialLoad, ParametricLoad
 
 class InputParser:
     @staticmethod
-    def parse_json(file_path):
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            
+    def parse_json(file_path, profiler=None):
+        with NULL_PHASE if profiler is None else profiler.phase('parse.read_json'):
+            with open(file_path, 'r') as f:
+                data = json.load(f)
+        return InputParser.parse_dict(data, profiler)
+
+    @staticmethod
+    def parse_dict(data, profiler=None):
+        """
+        Builds a Beam from an already-loaded configuration dictionary.
+        """
+        with NULL_PHASE if profiler is None else profiler.phase('parse.build_beam'):
+            return InputParser._build_beam(data)
+
+    @staticmethod
+    def _build_beam(data):
         # Parse Geometry & Material
         length = data.get('geometry', {}).get('length', 1.0)
         material = data.get('material')
@@ -24,8 +37,13 @@ class InputParser:
             }
         else:
             start_profile = profile
+        if 'segments' in geo:
+            # Stepped shaft: [{'end': x, 'cross_section': ..., 'dimensions': {...}}, ...]
+            start_profile = [{'end': seg.get('end', length),
+                              'type': seg.get('cross_section', seg.get('type')),
+                              'dimensions': seg.get('dimensions', {})} for seg in geo['segments']]
 
-        beam = Beam(length, material, start_profile)
+        beam = Beam(length, material, start_profile, data.get('supports'))
         
         # Parse Loads
         for load_data in data.get('loads', []):
@@ -46,7 +64,8 @@ class InputParser:
             elif l_type == 'moment_load':
                 beam.add_load(MomentLoad(
                     position=load_data['position'],
-                    magnitude=load_data['magnitude']
+                    magnitude=load_data['magnitude'],
+                    axis=load_data.get('axis', 'z')
                 ))
             elif l_type == 'torsion_load':
                 beam.add_load(TorsionLoad(
@@ -0,0 +1,79 @@
+import numpy as np
+
+from ..core.solver import bending_plane
+
+
+def beam_lines(beam):
+    """
+    Material and section properties, as printed before a solve.
+    """
+    lines = [
+        f"Material: {beam.material.name} (E={beam.material.E/1e9:.1f} GPa, G={beam.material.G/1e9:.1f} GPa)",
+        f"Profile: {beam.profile.type}",
+        f"  I = {beam.profile.I:.2e} m^4",
+    ]
+    if hasattr(beam.profile, 'J'):
+        lines.append(f"  J = {beam.profile.J:.2e} m^4")
+    if hasattr(beam.profile, 'A'):
+        lines.append(f"  A = {beam.profile.A:.2e} m^2")
+    if beam.stepped:
+        lines[1] = f"Profile: stepped, {len(beam.segments)} segments (first shown)"
+        for start, end, profile in beam.segments:
+            lines.append(f"  {start:.3f}-{end:.3f} m: {profile.type}, I = {profile.I:.2e} m^4")
+    return lines
+
+
+def result_lines(beam, solver, summary, modes=0):
+    """
+    The 'Results:' block of the CLI for a solved beam.
+
+    Args:
+        beam (Beam): The solved beam.
+        solver (Solver): Solver used, holding the bending planes of the solve.
+        summary (dict): solver.summary() output (deflection and slope are the
+                        y-z resultant when loads act in both planes).
+        modes (int): Also list the lowest `modes` critical speeds.
+    """
+    lines = ["", "Results:"]
+
+    # Bending
+    max_defl = summary['deflection']['max']
+    loc_defl = summary['deflection']['x']
+    max_slope = summary['slope']['max']
+    two_planes = any(bending_plane(load) for load in beam.loads)
+    if two_planes:
+        # v from the y-plane loads only; the summary holds the y-z resultant
+        v = np.abs(solver.deflection_planes[0])
+        max_defl, loc_defl = v.max(), solver.x[np.argmax(v)]
+    lines.append(f"  Max Bending Deflection (v): {max_defl*1000:.4f} mm at x={loc_defl:.3f} m")
+
+    if two_planes:
+        resultant = summary['deflection']
+        lines.append(f"  Max Resultant Deflection (y-z): {resultant['max']*1000:.4f} mm "
+                     f"at x={resultant['x']:.3f} m")
+
+    # Slope
+    lines.append(f"  Max Slope (theta): {np.degrees(max_slope):.4f} deg")
+
+    # Torsion
+    if summary['twist']['max']:
+        lines.append(f"  Max Twist (phi): {np.degrees(summary['twist']['max']):.4f} deg")
+    else:
+        lines.append("  Max Twist (phi): 0.0000 deg (No Torsion Load)")
+
+    # Axial
+    if summary['elongation']['max']:
+        lines.append(f"  Max Axial Displacement (u): {summary['elongation']['max']*1000:.4f} mm")
+    else:
+        lines.append("  Max Axial Displacement (u): 0.0000 mm (No Axial Load)")
+
+    if modes > 0:
+        # Imported here: SciPy's sparse eigensolver is only needed for this
+        from ..core.modal import ModalAnalysis
+        speeds = ModalAnalysis(beam).critical_speeds(modes)
+        lines += ["", "Critical Speeds:"]
+        lines.append("  Bending (rpm): " + ", ".join(f"{n:.0f}" for n in speeds['bending_rpm']))
+        if speeds['torsional_rpm'].size:
+            lines.append("  Torsional (rpm): " + ", ".join(f"{n:.0f}" for n in speeds['torsional_rpm']))
+
+    return lines
@@ -0,0 +1,225 @@
+import json
+import os
+
+import numpy as np
+
+# Profiles kept per run, each as one (runs, num_points) array file
+STORE_FIELDS = ('x', 'deflection', 'slope', 'twist', 'elongation')
+
+META_FILE = 'meta.json'
+INDEX_FILE = 'index.jsonl'
+
+
+class ResultsStore:
+    """
+    Directory of memory-mapped result profiles for many runs.
+
+    Every field in STORE_FIELDS is one raw binary file holding a C-ordered
+    (runs, num_points) array, grown in chunks of chunk_runs rows as runs are
+    appended. index.jsonl holds one line per run with its row, run_id, input
+    parameters and scalar results; it is written after the profiles, so a run is
+    only visible once its data is on disk and an interrupted writer loses at most
+    the run in progress.
+
+    Reading maps the files instead of loading them: store.run(i) and
+    store.station('deflection', j) are views, so any run or any station across all
+    runs is sliced without reading the rest of the sweep.
+
+        with ResultsStore.create('sweep.store', num_points=1000) as store:
+            store.append(solver.solve(), params={'diameter': 0.03})
+        store = ResultsStore('sweep.store')
+        store.field('deflection')[:, 500]   # mid-span deflection of every run
+    """
+    def __init__(self, path, mode='r'):
+        """
+        Args:
+            path (str): Store directory.
+            mode (str): 'r' to read, 'a' to append to an existing store.
+        """
+        if mode not in ('r', 'a'):
+            raise ValueError(f"Unknown store mode: {mode}")
+        self.path = path
+        self.mode = mode
+        with open(os.path.join(path, META_FILE), 'r') as f:
+            meta = json.load(f)
+        self.num_points = meta['num_points']
+        self.dtype = np.dtype(meta['dtype'])
+        self.chunk_runs = meta['chunk_runs']
+        self.index = []
+        index_path = os.path.join(path, INDEX_FILE)
+        if os.path.exists(index_path):
+            self.index = _read_index(index_path)
+        self.rows = sum(entry.get('row') is not None for entry in self.index)
+        self._by_run_id = {entry['run_id']: entry for entry in self.index if 'run_id' in entry}
+        self._maps = {}
+        self._index_file = None
+        if mode == 'a':
+            _truncate_partial_line(index_path)
+            self._index_file = open(index_path, 'a')
+
+    @classmethod
+    def create(cls, path, num_points, dtype=np.float64, chunk_runs=1024):
+        """
+        Creates an empty store (replacing any store already at path) and opens it
+        for appending.
+        """
+        os.makedirs(path, exist_ok=True)
+        for name in STORE_FIELDS:
+            open(_field_path(path, name), 'wb').close()
+        open(os.path.join(path, INDEX_FILE), 'w').close()
+        with open(os.path.join(path, META_FILE), 'w') as f:
+            json.dump({'num_points': int(num_points), 'dtype': np.dtype(dtype).str,
+                       'chunk_runs': int(chunk_runs), 'fields': list(STORE_FIELDS)}, f)
+        return cls(path, mode='a')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def __len__(self):
+        return len(self.index)
+
+    # --- Writing ---
+
+    def append(self, results=None, params=None, run_id=None, **scalars):
+        """
+        Adds one run.
+
+        Args:
+            results (dict): Solver results holding every field in STORE_FIELDS, or
+                            None for a run without profiles (e.g. a failed point).
+            params (dict): Input parameters of the run, stored in the index.
+            run_id: Optional caller id (e.g. the sweep run_id) for lookup with run().
+            **scalars: Other JSON-serializable values for the index (summary, error).
+
+        Returns:
+            int: Row of the profiles, or None if results was None.
+        """
+        if self.mode != 'a':
+            raise ValueError("Store is open read-only.")
+        row = None
+        if results is not None:
+            # Every field is checked before any is written, so a rejected run leaves no partial row
+            for name in STORE_FIELDS:
+                shape = np.shape(results[name])
+                if shape != (self.num_points,):
+                    raise ValueError(f"Store holds {self.num_points} points per run, "
+                                     f"got {shape} for '{name}' (use a uniform grid).")
+            row = self.rows
+            self._reserve(row + 1)
+            for name in STORE_FIELDS:
+                self._maps[name][row] = results[name]
+            self.rows += 1
+
+        entry = {'row': row}
+        if run_id is not None:
+            entry['run_id'] = run_id
+        if params:
+            entry['params'] = params
+        entry.update(scalars)
+        if row is not None:
+            for name in STORE_FIELDS:
+                self._maps[name].flush()
+        self._index_file.write(json.dumps(entry) + '\n')
+        self._index_file.flush()
+        self.index.append(entry)
+        if run_id is not None:
+            self._by_run_id[run_id] = entry
+        return row
+
+    def _reserve(self, rows):
+        # Grows every field file to a whole number of chunks holding at least rows
+        capacity = self._capacity()
+        if rows <= capacity and self._maps:
+            return
+        if rows > capacity:
+            capacity = -(-rows // self.chunk_runs) * self.chunk_runs
+            for name in STORE_FIELDS:
+                self._maps.pop(name, None)
+                with open(_field_path(self.path, name), 'r+b') as f:
+                    f.truncate(capacity * self.num_points * self.dtype.itemsize)
+        for name in STORE_FIELDS:
+            self._maps[name] = np.memmap(_field_path(self.path, name), dtype=self.dtype, mode='r+',
+                                         shape=(capacity, self.num_points))
+
+    def _capacity(self):
+        size = os.path.getsize(_field_path(self.path, STORE_FIELDS[0]))
+        return size // (self.num_points * self.dtype.itemsize)
+
+    def close(self):
+        for values in self._maps.values():
+            if values.mode == 'r+':
+                values.flush()
+        self._maps = {}
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+
+    # --- Reading ---
+
+    def field(self, name):
+        """
+        (runs, num_points) memory map of one field, over the runs written.
+        """
+        if name not in STORE_FIELDS:
+            raise KeyError(name)
+        if self.rows == 0:
+            return np.empty((0, self.num_points), dtype=self.dtype)
+        if self.mode == 'a':
+            self._reserve(self.rows)
+            return self._maps[name][:self.rows]
+        values = self._maps.get(name)
+        if values is None or values.shape[0] != self.rows:
+            values = self._maps[name] = np.memmap(_field_path(self.path, name), dtype=self.dtype,
+                                                  mode='r', shape=(self.rows, self.num_points))
+        return values
+
+    def row(self, row):
+        """Every field of one stored row, as views into the maps."""
+        return {name: self.field(name)[row] for name in STORE_FIELDS}
+
+    def run(self, run_id):
+        """
+        Profiles and index entry of the run appended with this run_id.
+        """
+        entry = self._by_run_id[run_id]
+        if entry.get('row') is None:
+            raise KeyError(f"Run {run_id} has no stored profiles ({entry.get('error', 'no results')}).")
+        out = self.row(entry['row'])
+        out['entry'] = entry
+        return out
+
+    def station(self, name, index):
+        """
+        Values of one field at grid index `index` for every stored run: a strided
+        view, one element per run.
+        """
+        return self.field(name)[:, index]
+
+    def done(self):
+        """run_ids already in the store."""
+        return set(self._by_run_id)
+
+
+def _field_path(path, name):
+    return os.path.join(path, f'{name}.bin')
+
+
+def _truncate_partial_line(path):
+    with open(path, 'rb+') as f:
+        data = f.read()
+        if data and not data.endswith(b'\n'):
+            f.truncate(data.rfind(b'\n') + 1)
+
+
+def _read_index(path):
+    # Drops a trailing partial line left by an interrupted writer
+    entries = []
+    with open(path, 'r') as f:
+        for line in f:
+            if line.endswith('\n'):
+                entries.append(json.loads(line))
+    return entries
@@ -0,0 +1,301 @@
+import copy
+import csv
+import glob
+import itertools
+import json
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+from .batch import summarize, summary_solver
+from .input_parser import InputParser
+from .store import ResultsStore, STORE_FIELDS
+from ..core.solver import Solver
+
+RESULT_FIELDS = [
+    'run_id', 'max_deflection', 'max_deflection_x', 'max_slope', 'max_twist',
+    'max_elongation', 'error'
+]
+
+# Extra columns with critical_speeds=True
+CRITICAL_SPEED_FIELDS = ['bending_critical_rpm', 'torsional_critical_rpm']
+
+# Rows per Parquet part file
+PARQUET_CHUNK = 1000
+
+# Set in each worker by _init_worker
+_base_config = None
+_solver_options = None
+_critical_speeds = False
+_keep_profiles = False
+
+
+def parse_values(spec):
+    """
+    Parses a sweep value specification.
+
+    'start:stop:num' -> num evenly spaced floats (inclusive), 'a,b,c' -> list.
+    Each list item is read as JSON when possible (numbers), else kept as a string.
+    """
+    parts = spec.split(':')
+    if len(parts) == 3:
+        start, stop, num = float(parts[0]), float(parts[1]), int(parts[2])
+        return [float(v) for v in np.linspace(start, stop, num)]
+
+    values = []
+    for item in spec.split(','):
+        try:
+            values.append(json.loads(item))
+        except json.JSONDecodeError:
+            values.append(item)
+    return values
+
+
+def get_path(config, path):
+    """
+    Value at a dotted config path, e.g. 'geometry.dimensions.diameter' or
+    'loads.0.position'. Raises ValueError naming the first key that is not found.
+    """
+    node = config
+    for depth, key in enumerate(path.split('.')):
+        try:
+            node = node[int(key)] if isinstance(node, list) else node[key]
+        except (KeyError, IndexError, ValueError, TypeError):
+            resolved = '.'.join(path.split('.')[:depth]) or 'the configuration'
+            raise ValueError(f"Invalid parameter path '{path}': no key '{key}' in {resolved}.") from None
+    return node
+
+
+def set_path(config, path, value):
+    """
+    Sets an existing dotted config path (see get_path). Paths are never created,
+    so a mistyped key fails instead of adding a field nothing reads.
+    """
+    get_path(config, path)
+    *parents, last = path.split('.')
+    node = get_path(config, '.'.join(parents)) if parents else config
+    if isinstance(node, list):
+        node[int(last)] = value
+    else:
+        node[last] = value
+
+
+def iter_points(parameters):
+    """
+    Yields (run_id, {path: value}) over the Cartesian product of the parameters.
+    run_id is the position in the product, so it is stable across resumed runs.
+    """
+    paths = list(parameters)
+    for run_id, combo in enumerate(itertools.product(*(parameters[p] for p in paths))):
+        yield run_id, dict(zip(paths, combo))
+
+
+def _init_worker(base_config, solver_options, critical_speeds=False, keep_profiles=False):
+    global _base_config, _solver_options, _critical_speeds, _keep_profiles
+    _base_config = base_config
+    _solver_options = solver_options
+    _critical_speeds = critical_speeds
+    _keep_profiles = keep_profiles
+
+
+def _run_point(task):
+    run_id, overrides = task
+    row = {'run_id': run_id, **overrides}
+    try:
+        config = copy.deepcopy(_base_config)
+        for path, value in overrides.items():
+            set_path(config, path, value)
+        beam = InputParser.parse_dict(config)
+        if _keep_profiles:
+            solver = Solver(beam, **_solver_options)
+            results = solver.solve()
+            row.update(summarize(solver, results))
+            row['profiles'] = store_profiles(results, beam.length, _solver_options.get('num_points', 1000))
+        else:
+            row.update(summarize(summary_solver(beam, _solver_options)))
+        if _critical_speeds:
+            from ..core.modal import ModalAnalysis
+            speeds = ModalAnalysis(beam).critical_speeds(1)
+            row['bending_critical_rpm'] = float(speeds['bending_rpm'][0])
+            row['torsional_critical_rpm'] = float(speeds['torsional_rpm'][0]) if speeds['torsional_rpm'].size else None
+        row['error'] = ''
+    except Exception as e:
+        # Keep going: a bad point is recorded, not fatal to the sweep
+        row['error'] = f"{type(e).__name__}: {e}"
+    return row
+
+
+def store_profiles(results, length, num_points):
+    """
+    The STORE_FIELDS of a solve on the fixed grid linspace(0, length, num_points)
+    of a ResultsStore. Grids of another size (the step nodes of a stepped shaft,
+    the fem or adaptive grids) are linearly interpolated onto it.
+    """
+    x = np.asarray(results['x'])
+    if x.size == num_points:
+        return {name: results[name] for name in STORE_FIELDS}
+    grid = np.linspace(0, length, num_points)
+    profiles = {name: np.interp(grid, x, results[name]) for name in STORE_FIELDS if name != 'x'}
+    profiles['x'] = grid
+    return profiles
+
+
+class CsvSink:
+    """
+    Appends one CSV row per finished point, flushing after each so an interrupted
+    sweep loses at most the row being written.
+    """
+    def __init__(self, path, columns, resume):
+        self.path = path
+        self.columns = columns
+        self.done = set()
+        if resume and os.path.exists(path):
+            self._truncate_partial_line()
+            with open(path, newline='') as f:
+                self.done = {int(row['run_id']) for row in csv.DictReader(f) if row.get('run_id')}
+            self.file = open(path, 'a', newline='')
+            self.writer = csv.DictWriter(self.file, fieldnames=columns)
+        else:
+            self.file = open(path, 'w', newline='')
+            self.writer = csv.DictWriter(self.file, fieldnames=columns)
+            self.writer.writeheader()
+
+    def _truncate_partial_line(self):
+        with open(self.path, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b'\n'):
+                f.truncate(data.rfind(b'\n') + 1)
+
+    def write(self, row):
+        self.writer.writerow(row)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetSink:
+    """
+    Writes a Parquet dataset directory, one complete part file per PARQUET_CHUNK rows,
+    so every part on disk is readable even if the sweep is interrupted.
+    Requires pyarrow.
+    """
+    def __init__(self, path, columns, resume):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet output requires pyarrow (pip install pyarrow).")
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.columns = columns
+        self.rows = []
+        self.done = set()
+
+        os.makedirs(path, exist_ok=True)
+        parts = sorted(glob.glob(os.path.join(path, 'part-*.parquet')))
+        if resume:
+            for part in parts:
+                self.done.update(self.pq.read_table(part, columns=['run_id']).column('run_id').to_pylist())
+        else:
+            for part in parts:
+                os.remove(part)
+        self.part = len(parts) if resume else 0
+
+    def write(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= PARQUET_CHUNK:
+            self._flush()
+
+    def _flush(self):
+        if not self.rows:
+            return
+        table = self.pa.Table.from_pylist([{c: r.get(c) for c in self.columns} for r in self.rows])
+        self.pq.write_table(table, os.path.join(self.path, f'part-{self.part:05d}.parquet'))
+        self.part += 1
+        self.rows = []
+
+    def close(self):
+        self._flush()
+
+
+class StoreSink:
+    """
+    Writes every point's full profiles to a memory-mapped ResultsStore, with the
+    parameters and summary columns in its index. Profiles come on the store's
+    fixed grid (see store_profiles); a point whose profiles the store still
+    rejects is recorded as an error row without profiles.
+    """
+    def __init__(self, path, columns, resume, num_points):
+        self.columns = columns
+        if resume and os.path.exists(path):
+            self.store = ResultsStore(path, mode='a')
+        else:
+            self.store = ResultsStore.create(path, num_points)
+        self.done = self.store.done()
+
+    def write(self, row):
+        row = dict(row)
+        profiles = row.pop('profiles', None)
+        run_id = row.pop('run_id')
+        params = {c: row.pop(c) for c in self.columns if c in row and c not in RESULT_FIELDS
+                  and c not in CRITICAL_SPEED_FIELDS}
+        try:
+            self.store.append(profiles, params=params, run_id=run_id, **row)
+        except ValueError as e:
+            row['error'] = f"{type(e).__name__}: {e}"
+            self.store.append(None, params=params, run_id=run_id, **row)
+
+    def close(self):
+        self.store.close()
+
+
+def run_sweep(base_config, parameters, output, workers=None, resume=False,
+              solver_options=None, chunksize=4, critical_speeds=False):
+    """
+    Solves every point of the Cartesian product of parameters on a process pool and
+    streams one result row per point to output as soon as it finishes.
+
+    Args:
+        base_config (dict): Configuration in the JSON input format.
+        parameters (dict): Dotted config path -> list of values.
+        output (str): '.csv' file, '.parquet' dataset directory, or '.store'
+                      directory keeping every point's profiles (see ResultsStore).
+        workers (int): Pool size, defaults to all cores.
+        resume (bool): Skip run_ids already present in output.
+        solver_options (dict): Keyword arguments for Solver (engine, grid, ...).
+        critical_speeds (bool): Also report the first bending and torsional critical
+                                speeds of every point (see ModalAnalysis).
+
+    Returns:
+        int: Number of points solved in this call.
+
+    Raises:
+        ValueError: A parameter path does not exist in base_config.
+    """
+    for path in parameters:
+        get_path(base_config, path)
+
+    columns = RESULT_FIELDS[:1] + list(parameters) + RESULT_FIELDS[1:]
+    if critical_speeds:
+        columns[-1:-1] = CRITICAL_SPEED_FIELDS
+    keep_profiles = output.endswith('.store')
+    if keep_profiles:
+        sink = StoreSink(output, columns, resume, (solver_options or {}).get('num_points', 1000))
+    else:
+        sink_cls = ParquetSink if output.endswith('.parquet') else CsvSink
+        sink = sink_cls(output, columns, resume)
+
+    tasks = (task for task in iter_points(parameters) if task[0] not in sink.done)
+    solved = 0
+    try:
+        with Pool(workers, initializer=_init_worker,
+                  initargs=(base_config, solver_options or {}, critical_speeds, keep_profiles)) as pool:
+            for row in pool.imap_unordered(_run_point, tasks, chunksize):
+                sink.write(row)
+                solved += 1
+    finally:
+        sink.close()
+    return solved
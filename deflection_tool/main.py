@@ -1,66 +1,271 @@
 import argparse
+import json
+import math
 import sys
 import os
-import numpy as np
 
-# Add the parent directory to sys.path so we can import the package
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Run as a script: add the parent directory to sys.path so we can import the package
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from deflection_tool.interface.input_parser import InputParser
-from deflection_tool.core.solver import Solver
+# NumPy and the solver are imported inside each command, so the thin daemon client
+# and --help start without them
 
-def main():
-    parser = argparse.ArgumentParser(description="Mechanical Deflection Analysis Tool")
+def sweep_main(argv):
+    from deflection_tool.interface.sweep import run_sweep, parse_values, get_path
+
+    parser = argparse.ArgumentParser(prog="main.py sweep",
+                                     description="Parallel design-space sweep over a JSON configuration")
+    parser.add_argument('config', help='Path to the base JSON configuration file')
+    parser.add_argument('--param', action='append', default=[], metavar='PATH=VALUES',
+                        help="Config field and values, e.g. geometry.dimensions.diameter=0.02:0.04:11 "
+                             "or material=AISI4140,AISI1040. Repeat for a Cartesian product.")
+    parser.add_argument('--out', required=True, help='Output .csv file, .parquet dataset directory or .store profile store')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    parser.add_argument('--resume', action='store_true', help='Skip points already present in --out')
+    parser.add_argument('--engine', choices=['numerical', 'analytic', 'fem'], default='numerical')
+    parser.add_argument('--grid', choices=['uniform', 'adaptive'], default='uniform')
+    parser.add_argument('--num-points', type=int, default=1000)
+    parser.add_argument('--critical-speeds', action='store_true',
+                        help='Also report the first bending and torsional critical speeds')
+    args = parser.parse_args(argv)
+
+    parameters = {}
+    for item in args.param:
+        path, _, spec = item.partition('=')
+        if not spec:
+            parser.error(f"Invalid --param '{item}', expected PATH=VALUES")
+        parameters[path] = parse_values(spec)
+
+    with open(args.config, 'r') as f:
+        base_config = json.load(f)
+    for path in parameters:
+        try:
+            get_path(base_config, path)
+        except ValueError as e:
+            parser.error(str(e))
+
+    total = math.prod(len(v) for v in parameters.values())
+    print(f"Sweeping {total} points over {list(parameters)} -> {args.out}")
+    solved = run_sweep(base_config, parameters, args.out, workers=args.workers, resume=args.resume,
+                       solver_options={'engine': args.engine, 'grid': args.grid,
+                                       'num_points': args.num_points},
+                       critical_speeds=args.critical_speeds)
+    print(f"Sweep complete: {solved} points solved, {total - solved} skipped.")
+
+def batch_main(argv):
+    from deflection_tool.interface.batch import run_batch
+
+    parser = argparse.ArgumentParser(prog="main.py batch",
+                                     description="Solve newline-delimited JSON configs, one result line per record")
+    parser.add_argument('input', nargs='?', default='-', help='JSONL file, or - for stdin (default)')
+    parser.add_argument('--out', default='-', help='Output JSONL file, or - for stdout (default)')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes (default: 1)')
+    parser.add_argument('--window', type=int, default=64, help='Max records in flight with --workers > 1')
+    parser.add_argument('--engine', choices=['numerical', 'analytic', 'fem'], default='numerical')
+    parser.add_argument('--grid', choices=['uniform', 'adaptive'], default='uniform')
+    parser.add_argument('--num-points', type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    in_stream = sys.stdin if args.input == '-' else open(args.input, 'r')
+    out_stream = sys.stdout if args.out == '-' else open(args.out, 'w')
+    try:
+        processed, failed = run_batch(in_stream, out_stream,
+                                      solver_options={'engine': args.engine, 'grid': args.grid,
+                                                      'num_points': args.num_points},
+                                      workers=args.workers, window=args.window)
+    finally:
+        if in_stream is not sys.stdin:
+            in_stream.close()
+        if out_stream is not sys.stdout:
+            out_stream.close()
+    print(f"Batch complete: {processed} records, {failed} errors.", file=sys.stderr)
+
+def serve_main(argv):
+    from deflection_tool.interface.daemon import serve, default_socket_path
+
+    parser = argparse.ArgumentParser(prog="main.py serve",
+                                     description="Keep a warm solver running behind a local Unix socket")
+    parser.add_argument('--socket', default=default_socket_path(), help='Socket path (default: %(default)s)')
+    args = parser.parse_args(argv)
+    print(f"Listening on {args.socket} (stop with 'main.py client --shutdown')", file=sys.stderr)
+    serve(args.socket)
+
+def client_main(argv):
+    from deflection_tool.interface.daemon import request, default_socket_path
+
+    parser = argparse.ArgumentParser(prog="main.py client",
+                                     description="Solve a configuration on a running 'main.py serve' daemon")
+    parser.add_argument('config', nargs='?', help='Path to the JSON configuration file')
+    parser.add_argument('--socket', default=default_socket_path(), help='Socket path (default: %(default)s)')
+    parser.add_argument('--engine', choices=['numerical', 'analytic', 'fem'], default='numerical')
+    parser.add_argument('--grid', choices=['uniform', 'adaptive'], default='uniform')
+    parser.add_argument('--tol', type=float, default=1e-6)
+    parser.add_argument('--modes', type=int, default=0, metavar='K')
+    parser.add_argument('--json', action='store_true', help='Print the raw JSON summary instead of the report')
+    parser.add_argument('--shutdown', action='store_true', help='Stop the daemon')
+    args = parser.parse_args(argv)
+
+    if args.shutdown:
+        payload = {'command': 'shutdown'}
+    elif args.config:
+        payload = {'config': os.path.abspath(args.config), 'engine': args.engine, 'grid': args.grid,
+                   'tol': args.tol, 'modes': args.modes}
+    else:
+        parser.error("a config file or --shutdown is required")
+
+    try:
+        response = request(payload, args.socket)
+    except OSError as e:
+        print(f"Error: no daemon on {args.socket} ({e}); start one with 'main.py serve'", file=sys.stderr)
+        sys.exit(1)
+    if not response.get('ok'):
+        print(f"Error: {response.get('error')}")
+        sys.exit(1)
+    if args.json:
+        print(json.dumps(response.get('summary', response)))
+    else:
+        for line in response.get('lines', []):
+            print(line)
+
+def uncertainty_main(argv):
+    from deflection_tool.interface.input_parser import InputParser
+    from deflection_tool.core.uncertainty import MonteCarloAnalysis
+
+    parser = argparse.ArgumentParser(prog="main.py uncertainty",
+                                     description="Monte Carlo tolerance and uncertainty analysis")
+    parser.add_argument('config', help="Path to the JSON configuration file; its optional 'uncertainty' "
+                                       "object maps input paths to distributions")
+    parser.add_argument('--dist', action='append', default=[], metavar='PATH=JSON',
+                        help='Distribution of one input, e.g. profile.diameter=\'{"dist": "uniform", '
+                             '"tolerance": 5e-5}\' or material.E=\'{"cov": 0.03}\'. Repeatable.')
+    parser.add_argument('--limit', action='append', default=[], metavar='FIELD=VALUE',
+                        help='Allowable peak, e.g. deflection=0.5e-3; prints the probability of exceeding it')
+    parser.add_argument('--samples', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--num-points', type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    try:
+        with open(args.config, 'r') as f:
+            config = json.load(f)
+        distributions = dict(config.get('uncertainty', {}))
+        for item in args.dist:
+            path, _, spec = item.partition('=')
+            if not spec:
+                parser.error(f"Invalid --dist '{item}', expected PATH=JSON")
+            try:
+                distributions[path] = json.loads(spec)
+            except json.JSONDecodeError as e:
+                parser.error(f"Invalid --dist '{item}': {e}")
+        limits = {}
+        for item in args.limit:
+            field, _, value = item.partition('=')
+            if not value:
+                parser.error(f"Invalid --limit '{item}', expected FIELD=VALUE")
+            limits[field] = float(value)
+
+        beam = InputParser.parse_dict(config)
+        analysis = MonteCarloAnalysis(beam, distributions, num_points=args.num_points)
+        print(f"Sampling {args.samples} cases over {list(distributions)}...")
+        results = analysis.evaluate(args.samples, seed=args.seed, limits=limits)
+
+        units = {'deflection': (1000, 'mm'), 'slope': (1, 'rad'), 'twist': (1, 'rad'), 'elongation': (1000, 'mm')}
+        for field, (scale, unit) in units.items():
+            percentiles = ', '.join(f"P{p:g} {value*scale:.4g}" for p, value in results[field]['percentiles'].items())
+            print(f"  Max {field.capitalize()} [{unit}]: {percentiles}")
+        for field, exceedance in results['exceedance'].items():
+            print(f"  P({field} > {exceedance['limit']:g}) = {exceedance['probability']:.4f} "
+                  f"(+/- {exceedance['stderr']:.4f})")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    commands = {'sweep': sweep_main, 'batch': batch_main, 'serve': serve_main, 'client': client_main,
+                'uncertainty': uncertainty_main}
+    if argv and argv[0] in commands:
+        return commands[argv[0]](argv[1:])
+
+    parser = argparse.ArgumentParser(description="Mechanical Deflection Analysis Tool",
+                                     epilog="Use 'main.py sweep --help' for design-space sweeps, "
+                                            "'main.py batch --help' for JSONL streams, "
+                                            "'main.py uncertainty --help' for Monte Carlo tolerances and "
+                                            "'main.py serve' / 'main.py client' for a warm solver daemon.")
     parser.add_argument('config', help='Path to the JSON configuration file')
-    args = parser.parse_args()
+    parser.add_argument('--engine', choices=['numerical', 'analytic', 'fem'], default='numerical',
+                        help='numerical: grid integration; analytic: closed-form superposition; '
+                             'fem: banded finite elements honouring the supports list')
+    parser.add_argument('--grid', choices=['uniform', 'adaptive'], default='uniform',
+                        help='adaptive: exact nodes at loads, refined until --tol is met')
+    parser.add_argument('--tol', type=float, default=1e-6,
+                        help='Relative tolerance on max deflection for the adaptive grid')
+    parser.add_argument('--modes', type=int, default=0, metavar='K',
+                        help='Also print the lowest K bending and torsional critical speeds')
+    parser.add_argument('--stress', action='store_true',
+                        help='Also print von Mises stress and safety factor at the critical sections')
+    parser.add_argument('--envelope', type=float, default=None, metavar='P',
+                        help='Also run a point load of magnitude P across the span and print the '
+                             'worst-case deflection and where the load was')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings and allocation peaks after the results')
+    parser.add_argument('--profile-out', default=None,
+                        help='Append the profile as one JSON line to this file (implies --profile)')
+    args = parser.parse_args(argv)
+
+    from deflection_tool.interface.input_parser import InputParser
+    from deflection_tool.interface.report import beam_lines, result_lines
+    from deflection_tool.core.solver import Solver
+    from deflection_tool.core.profiling import ProfileStats
 
     try:
         # 1. Parse Input
         print(f"Loading configuration from {args.config}...")
         # Updated to use static method per new InputParser implementation
-        beam = InputParser.parse_json(args.config)
+        profiler = ProfileStats(track_memory=True) if (args.profile or args.profile_out) else None
+        beam = InputParser.parse_json(args.config, profiler=profiler)
         
-        print(f"Material: {beam.material.name} (E={beam.material.E/1e9:.1f} GPa, G={beam.material.G/1e9:.1f} GPa)")
-        print(f"Profile: {beam.profile.type}")
-        print(f"  I = {beam.profile.I:.2e} m^4")
-        if hasattr(beam.profile, 'J'):
-            print(f"  J = {beam.profile.J:.2e} m^4")
-        if hasattr(beam.profile, 'A'):
-            print(f"  A = {beam.profile.A:.2e} m^2")
+        for line in beam_lines(beam):
+            print(line)
         
         # 2. Solve
         print("Solving for generalized deformations...")
-        solver = Solver(beam)
-        results = solver.solve()
+        solver = Solver(beam, engine=args.engine, grid=args.grid, tol=args.tol, profiler=profiler)
+        summary = solver.summary()
         
         # 3. Output Results
-        print("\nResults:")
-        
-        # Bending
-        max_defl = np.max(np.abs(results['deflection']))
-        loc_defl = solver.x[np.argmax(np.abs(results['deflection']))]
-        print(f"  Max Bending Deflection (v): {max_defl*1000:.4f} mm at x={loc_defl:.3f} m")
-        
-        # Slope
-        max_slope = np.max(np.abs(results['slope']))
-        print(f"  Max Slope (theta): {np.degrees(max_slope):.4f} deg")
-
-        # Torsion
-        if np.any(results['twist']):
-            max_twist = np.max(np.abs(results['twist']))
-            print(f"  Max Twist (phi): {np.degrees(max_twist):.4f} deg")
-        else:
-            print("  Max Twist (phi): 0.0000 deg (No Torsion Load)")
-
-        # Axial
-        if np.any(results['elongation']):
-            max_axial = np.max(np.abs(results['elongation']))
-            print(f"  Max Axial Displacement (u): {max_axial*1000:.4f} mm")
-        else:
-            print("  Max Axial Displacement (u): 0.0000 mm (No Axial Load)")
+        for line in result_lines(beam, solver, summary, args.modes):
+            print(line)
+
+        if args.stress:
+            import numpy as np
+            from deflection_tool.core.stress import StressAnalysis, critical_sections
+            sections = critical_sections(StressAnalysis(beam).from_solver(solver))
+            print("\nCritical Sections:")
+            for x, vm, n in zip(sections['x'], sections['von_mises'], sections['safety_factor']):
+                if not np.isnan(x):
+                    print(f"  x={x:.3f} m: von Mises {vm/1e6:.2f} MPa, safety factor {n:.2f}")
+
+        if args.envelope is not None:
+            from deflection_tool.core.envelope import MovingLoadEnvelope
+            from deflection_tool.core.loads import PointLoad
+            critical = MovingLoadEnvelope(beam, [PointLoad(0.0, args.envelope)]).evaluate()['critical']
+            worst = critical['deflection']
+            print("\nMoving Load Envelope:")
+            print(f"  Max Deflection: {abs(worst['value'])*1000:.4f} mm at x={worst['x']:.3f} m "
+                  f"(load at {worst['position']:.3f} m)")
 
         print("Calculation complete.")
 
+        if profiler is not None:
+            print("\nProfile:")
+            print(profiler.report())
+            if args.profile_out:
+                with open(args.profile_out, 'a') as f:
+                    f.write(json.dumps({'config': args.config, 'phases': profiler.to_dict()}) + '\n')
+
     except Exception as e:
         print(f"Error: {e}")
         import traceback
@@ -1,48 +1,149 @@
-from ..core.beam import Beam
-from ..core.loads import PointLoad, MomentLoad
+from ..core.loads import PointLoad, MomentLoad, TorsionLoad, AxialLoad
+from ..core.solver import Solver
 import numpy as np
 
+GRAVITY = 9.81
+
+# Gear table columns and their defaults (None = required)
+GEAR_COLUMNS = {
+    'position': None,        # [m] along the shaft
+    'diameter': None,        # pitch diameter d [mm]
+    'thickness': None,       # face width F [mm]
+    'pressure_angle': 20.0,  # normal pressure angle phi_n [deg]
+    'helix_angle': 0.0,      # psi [deg], signed by hand; 0 for spur gears
+    'power': 0.0,            # H [W], > 0 delivered to the shaft, < 0 taken off it
+    'speed': np.nan,         # n [rpm], needed when power is given
+    'torque': np.nan,        # T [Nm], overrides power/speed when given
+    'mesh_angle': 0.0,       # angular position of the mesh point, from +y towards +z [deg]
+    'mass': np.nan,          # [kg], default: solid disc of the shaft material
+}
+
+
 class ShaftWithGears:
     def __init__(self, beam):
         self.beam = beam
         self.loads = []
-        
-        # This scenario is specific to the project, so parameters might be hardcoded
-        # Or passed via config.
-        # For now, let's assume the JSON provides the high-level gear specs
-        # and this class translates them into forces/moments.
-        pass
+        self.gear_forces = None
+        self.gear_masses = {'position': [], 'mass': [], 'diameter': []}
 
     def calculate_gear_loads(self, gears):
         """
-        Takes a list of gear definitions and calculates the loads on the shaft.
+        Computes the loads every gear puts on the shaft and adds them to the beam.
+
+        The gear table is evaluated column-wise, as in Calculo_de_Engrane.xlsx:
+            T = H / w,  w = 2 pi n / 60       (power law)
+            W_t = 2 T / d
+            W_r = W_t tan(phi_t),  tan(phi_t) = tan(phi_n) / cos(psi)
+            W_a = W_t tan(psi)
+        W_t and W_r act at the mesh point and are resolved into the y and z planes.
+        W_a loads the shaft axially and, acting at the pitch radius, also bends it
+        with the couple W_a d / 2. The weight acts along -y.
+
+        Args:
+            gears: list of gear dicts, or a dict of equal-length columns
+                   (see GEAR_COLUMNS for the keys, units and defaults).
+
+        Returns:
+            dict: per-gear arrays 'torque', 'tangential', 'radial', 'axial', 'weight',
+                  'force_y' and 'force_z' (also kept as self.gear_forces).
+        """
+        g = _gear_table(gears)
+        r = g['diameter'] / 2000
+
+        # Torque from the power law unless given directly
+        omega = 2 * np.pi * g['speed'] / 60
+        with np.errstate(divide='ignore', invalid='ignore'):
+            torque = np.where(np.isnan(g['torque']), g['power'] / omega, g['torque'])
+        if np.any(np.isnan(torque) & (g['power'] != 0)):
+            raise ValueError("Gears with a transmitted power need a 'speed' in rpm.")
+        torque = np.where(np.isnan(torque), 0.0, torque)
+
+        psi = np.radians(g['helix_angle'])
+        tangential = np.divide(torque, r, out=np.zeros_like(r), where=r > 0)
+        radial = np.abs(tangential) * np.tan(np.radians(g['pressure_angle'])) / np.cos(psi)
+        axial = tangential * np.tan(psi)
+
+        mass = np.where(np.isnan(g['mass']), self._calculate_weight(g), g['mass'])
+        weight = mass * GRAVITY
+
+        # Radial force points at the shaft axis, tangential force along the direction
+        # that turns the shaft with the sign of the torque
+        theta = np.radians(g['mesh_angle'])
+        cos_t, sin_t = np.cos(theta), np.sin(theta)
+        force_y = -radial * cos_t - tangential * sin_t - weight
+        force_z = -radial * sin_t + tangential * cos_t
+        couple_y = axial * r * cos_t
+        couple_z = axial * r * sin_t
+
+        pos = g['position']
+        new_loads = (
+            [PointLoad(a, P, 'y') for a, P in zip(pos, force_y) if P]
+            + [PointLoad(a, P, 'z') for a, P in zip(pos, force_z) if P]
+            + [MomentLoad(a, M, 'z') for a, M in zip(pos, couple_y) if M]
+            + [MomentLoad(a, M, 'y') for a, M in zip(pos, couple_z) if M]
+            + [TorsionLoad(a, T) for a, T in zip(pos, torque) if T]
+            + [AxialLoad(a, P) for a, P in zip(pos, axial) if P]
+        )
+        self.loads.extend(new_loads)
+        for load in new_loads:
+            self.beam.add_load(load)
+
+        for key, values in (('position', pos), ('mass', mass), ('diameter', g['diameter'])):
+            self.gear_masses[key].extend(values.tolist())
+
+        self.gear_forces = {
+            'torque': torque,
+            'tangential': tangential,
+            'radial': radial,
+            'axial': axial,
+            'weight': weight,
+            'force_y': force_y,
+            'force_z': force_z,
+        }
+        return self.gear_forces
+
+    def solve(self, num_points=1000):
+        """
+        Solves both bending planes at once; 'deflection' is the resultant.
+        See Solver.solve_planes.
         """
-        for gear in gears:
-            # Extract gear properties (diameters, thickness, position)
-            pos = gear['position']
-            mass = self._calculate_weight(gear)
-            
-            # 1. Gravity Load (Weight)
-            gravity_load = PointLoad(pos, -mass * 9.81, 'y')
-            self.beam.add_load(gravity_load)
-            
-            # 2. Radial/Tangential loads if provided
-            if 'forces' in gear:
-                # Add radial/tangential loads
-                pass
-                
-            # 3. Torque/Moment if provided
-            if 'torque' in gear:
-                 pass
+        return Solver(self.beam, num_points=num_points).solve_planes()
+
+    def critical_speeds(self, k=1, num_elements=200):
+        """
+        Lowest k bending and torsional critical speeds [rpm] of the shaft carrying
+        the gears added so far. See ModalAnalysis.
+        """
+        from ..core.modal import ModalAnalysis
+        return ModalAnalysis(self.beam, num_elements, self.gear_masses).critical_speeds(k)
 
     def _calculate_weight(self, gear):
         # Specific formula from the notebook
         d_mm = gear['diameter']
         e_mm = gear['thickness']
         rho = self.beam.material.rho
-        
+
         r = d_mm / 2000
         e_m = e_mm / 1000
         volume = np.pi * r**2 * e_m
         mass = rho * volume
         return mass
+
+
+def _gear_table(gears):
+    # Normalizes a list of gear dicts or a dict of columns into float arrays
+    if isinstance(gears, dict):
+        columns = gears
+    else:
+        columns = {key: [gear[key] if default is None else gear.get(key, default) for gear in gears]
+                   for key, default in GEAR_COLUMNS.items() if any(key in gear for gear in gears)}
+    size = len(next(iter(columns.values()))) if columns else 0
+    table = {}
+    for key, default in GEAR_COLUMNS.items():
+        if key in columns:
+            table[key] = np.asarray(columns[key], dtype=float).reshape(size)
+        elif default is None:
+            raise ValueError(f"Gear table is missing the '{key}' column.")
+        else:
+            table[key] = np.full(size, default)
+    return table
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Run from a checkout: add the parent directory to sys.path so the package imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
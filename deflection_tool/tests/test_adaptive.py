@@ -0,0 +1,22 @@
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.loads import PointLoad, DistributedLoad, MomentLoad
+from deflection_tool.core.solver import Solver
+
+
+def beam():
+    beam = Beam(1.0, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}})
+    beam.loads = [PointLoad(0.31, -1500), DistributedLoad(0.42, 0.87, -2000), MomentLoad(0.73, 120)]
+    return beam
+
+
+@pytest.mark.parametrize('tol', [1e-4, 1e-6])
+def test_adaptive_grid_meets_tolerance(tol):
+    expected = Solver(beam(), engine='analytic').summary()['deflection']['max']
+    solver = Solver(beam(), grid='adaptive', tol=tol)
+    assert solver.summary()['deflection']['max'] == pytest.approx(expected, rel=10 * tol)
+    # Exact nodes at every load position and end
+    for node in (0.31, 0.42, 0.87, 0.73):
+        assert node in solver.x
+    assert solver.x.size < 100000
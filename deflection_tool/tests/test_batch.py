@@ -0,0 +1,34 @@
+import io
+import json
+import os
+
+import pytest
+
+from deflection_tool.core.solver import Solver
+from deflection_tool.interface.batch import run_batch, summarize
+from deflection_tool.interface.input_parser import InputParser
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'examples')
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_records_in_order_and_errors_inline(workers):
+    names = ['simple_demo', 'stepped_shaft', 'gear_shaft']
+    configs = []
+    for name in names:
+        with open(os.path.join(EXAMPLES, f'{name}.json')) as f:
+            configs.append(dict(json.load(f), id=name))
+    lines = [json.dumps(configs[0]), '', 'not json', json.dumps(configs[1]), json.dumps(configs[2])]
+    out = io.StringIO()
+
+    processed, failed = run_batch(io.StringIO('\n'.join(lines) + '\n'), out, workers=workers)
+
+    assert (processed, failed) == (4, 1)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [record['record'] for record in records] == [1, 3, 4, 5]
+    assert 'error' in records[1]
+    for record, name in zip(records[:1] + records[2:], names):
+        assert record['id'] == name
+        expected = summarize(Solver(InputParser.parse_json(os.path.join(EXAMPLES, f'{name}.json'))))
+        for key, value in expected.items():
+            assert record[key] == pytest.approx(value)
@@ -0,0 +1,29 @@
+import os
+import sys
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks')
+sys.path.insert(0, BENCHMARKS)
+
+from bench_solver import bench_solver, compare, meta_mismatch, synthetic_beam  # noqa: E402
+
+
+def test_compare_flags_slower_metrics_only():
+    baseline = {'cases': {'a': {'solve_s': 1.0, 'peak_bytes': 100, 'num_points': 1000},
+                          'gone': {'solve_s': 1.0}}}
+    results = {'cases': {'a': {'solve_s': 1.6, 'peak_bytes': 120, 'num_points': 9999},
+                         'new': {'solve_s': 50.0}}}
+    assert compare(results, baseline, 1.5) == [('a', 'solve_s', 1.0, 1.6)]
+
+
+def test_bench_solver_leaves_the_beam_as_it_was():
+    beam = synthetic_beam(10)
+    magnitudes = [load.magnitude for load in beam.loads]
+    result = bench_solver(beam, 1000, min_time=0.001)
+    assert result['solve_s'] > 0 and result['incremental_solve_s'] > 0
+    assert [load.magnitude for load in beam.loads] == magnitudes
+
+
+def test_meta_mismatch_names_what_differs():
+    meta = {'machine': 'x86_64', 'processor': 'x86_64', 'python': '3.11.7', 'numpy': '1.26.4', 'full': False}
+    assert meta_mismatch({'meta': meta}, {'meta': dict(meta)}) == []
+    assert meta_mismatch({'meta': meta}, {'meta': dict(meta, numpy='2.0.0', full=True)}) == ['numpy', 'full']
@@ -0,0 +1,24 @@
+import os
+
+import pytest
+
+from deflection_tool.main import uncertainty_main
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'examples')
+
+
+def test_uncertainty_error_is_reported_without_traceback(capsys):
+    config = os.path.join(EXAMPLES, 'simple_demo.json')
+    with pytest.raises(SystemExit) as exit_info:
+        uncertainty_main([config, '--dist', 'profile.bogus={"cov": 0.01}', '--samples', '10'])
+    assert exit_info.value.code == 1
+    out = capsys.readouterr()
+    assert out.out.startswith('Error: ')
+    assert 'Traceback' not in out.out + out.err
+
+
+def test_uncertainty_missing_config(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        uncertainty_main(['does_not_exist.json'])
+    assert exit_info.value.code == 1
+    assert capsys.readouterr().out.startswith('Error: ')
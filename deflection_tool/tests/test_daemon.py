@@ -0,0 +1,55 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import pytest
+
+from deflection_tool.core.solver import Solver
+from deflection_tool.interface.daemon import serve, request
+from deflection_tool.interface.input_parser import InputParser
+from deflection_tool.interface.report import beam_lines, result_lines
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'examples')
+
+
+@pytest.fixture
+def daemon():
+    # Short directory: Unix socket paths are limited to about 100 characters
+    directory = tempfile.mkdtemp(prefix='dt-')
+    path = os.path.join(directory, 'daemon.sock')
+    thread = threading.Thread(target=serve, args=(path,), daemon=True)
+    thread.start()
+    for _ in range(200):
+        try:
+            request({'command': 'ping'}, path, timeout=1)
+            break
+        except OSError:
+            time.sleep(0.01)
+    yield path
+    request({'command': 'shutdown'}, path, timeout=5)
+    thread.join(5)
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def cli_lines(path):
+    # What main.py prints for a config, minus the progress messages
+    beam = InputParser.parse_json(path)
+    solver = Solver(beam)
+    return beam_lines(beam) + result_lines(beam, solver, solver.summary(), 0)
+
+
+def test_daemon_matches_cli_after_a_cached_grid(daemon):
+    stepped = os.path.join(EXAMPLES, 'stepped_shaft.json')
+    # A uniform beam of the same length first, so the stepped shaft hits a cached grid
+    with open(stepped) as f:
+        config = json.load(f)
+    config['geometry'] = {'length': config['geometry']['length'], 'cross_section': 'circular',
+                          'dimensions': {'diameter': 0.03}}
+    assert request({'config': config}, daemon)['ok']
+
+    response = request({'config': stepped}, daemon)
+    assert response['ok'], response.get('error')
+    assert response['lines'] == cli_lines(stepped)
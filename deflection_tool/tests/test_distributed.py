@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.loads import DistributedLoad
+from deflection_tool.core.solver import Solver
+
+SUPPORTS = [{'type': 'simple', 'position': 0.0}, {'type': 'simple', 'position': 1.0}]
+
+
+def beam_with(start, end):
+    beam = Beam(1.0, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}}, supports=SUPPORTS)
+    beam.add_load(DistributedLoad(start, end, -5000))
+    return beam
+
+
+@pytest.mark.parametrize('engine', ['numerical', 'analytic', 'fem'])
+@pytest.mark.parametrize('start, end', [(0.5, 1.5), (-0.5, 0.5)])
+def test_load_past_the_span_is_clipped(engine, start, end):
+    # Reference: the same load trimmed to [0, L] by hand, closed form
+    reference = Solver(beam_with(max(start, 0.0), min(end, 1.0)), num_points=501, engine='analytic').solve()
+    results = Solver(beam_with(start, end), num_points=501, engine=engine).solve()
+    scale = np.abs(reference['deflection']).max()
+    np.testing.assert_allclose(np.interp(reference['x'], results['x'], results['deflection']),
+                               reference['deflection'], atol=1e-5 * scale)
+
+
+def test_batch_clips_like_solve():
+    solver = Solver(beam_with(0.5, 1.0), num_points=501)
+    expected = solver.solve()['deflection']
+    batch = solver.solve_batch([[DistributedLoad(0.5, 1.5, -5000)]])
+    np.testing.assert_allclose(batch['deflection'][0], expected, atol=1e-12 * np.abs(expected).max())
@@ -0,0 +1,63 @@
+import glob
+import os
+
+import numpy as np
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.loads import PointLoad, DistributedLoad, MomentLoad
+from deflection_tool.core.solver import Solver
+from deflection_tool.interface.input_parser import InputParser
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'examples')
+SUPPORTS = [{'type': 'simple', 'position': 0.0}, {'type': 'simple', 'position': 1.0}]
+
+
+def mixed_beam():
+    beam = Beam(1.0, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}}, supports=SUPPORTS)
+    beam.loads = [PointLoad(0.3, -1500), DistributedLoad(0.4, 0.9, -2000), MomentLoad(0.7, 120)]
+    return beam
+
+
+@pytest.mark.parametrize('options, tol', [({'engine': 'fem'}, 1e-7),
+                                          ({'grid': 'adaptive', 'tol': 1e-9}, 1e-6),
+                                          # The couple's jump in M falls inside a grid interval
+                                          ({}, 5e-4)],
+                         ids=['fem', 'adaptive', 'uniform'])
+def test_engines_match_closed_form(options, tol):
+    expected = Solver(mixed_beam(), num_points=2001, engine='analytic').solve()
+    results = Solver(mixed_beam(), num_points=2001, **options).solve()
+    for field in ('deflection', 'slope'):
+        values = np.interp(expected['x'], results['x'], results[field])
+        np.testing.assert_allclose(values, expected[field], rtol=0, atol=tol * np.abs(expected[field]).max())
+
+
+def test_analytic_summary_matches_profile():
+    solver = Solver(mixed_beam(), num_points=20001, engine='analytic')
+    summary = solver.summary()
+    results = solver.solve()
+    for field in ('deflection', 'slope'):
+        i = np.argmax(np.abs(results[field]))
+        assert summary[field]['max'] == pytest.approx(abs(results[field][i]), rel=1e-6)
+        assert summary[field]['x'] == pytest.approx(results['x'][i], abs=1e-3)
+
+
+@pytest.mark.parametrize('path', sorted(glob.glob(os.path.join(EXAMPLES, '*.json'))),
+                         ids=lambda path: os.path.basename(path))
+def test_examples_agree_across_engines(path):
+    beam = InputParser.parse_json(path)
+    ends = [{'type': 'simple', 'position': 0.0}, {'type': 'simple', 'position': beam.length}]
+    if beam.supports not in ([], ends):
+        pytest.skip("the numerical engine is simply supported only")
+    numerical = Solver(InputParser.parse_json(path)).summary()
+    fem = Solver(InputParser.parse_json(path), engine='fem').summary()
+    for field in ('deflection', 'slope', 'twist', 'elongation'):
+        assert fem[field]['max'] == pytest.approx(numerical[field]['max'], rel=2e-3, abs=1e-12)
+
+
+@pytest.mark.parametrize('offset', [0.0, 1e-12, 1e-6, 1e-4])
+def test_fem_load_just_off_a_grid_point(offset):
+    beam = mixed_beam()
+    beam.loads = [MomentLoad(0.7 + offset, 120)]
+    expected = Solver(beam, engine='analytic').solve()['slope'][0]
+    assert Solver(beam, engine='fem').solve()['slope'][0] == pytest.approx(expected, rel=1e-7)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.envelope import MovingLoadEnvelope
+from deflection_tool.core.loads import PointLoad
+from deflection_tool.core.solver import Solver
+
+
+def shaft():
+    beam = Beam(1.0, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}})
+    beam.loads = [PointLoad(0.3, -500)]
+    return beam
+
+
+@pytest.mark.parametrize('direction', ['y', 'z'])
+def test_envelope_matches_one_solve_per_position(direction):
+    axle = [PointLoad(0.0, -1000, direction=direction), PointLoad(0.2, -600, direction=direction)]
+    envelope = MovingLoadEnvelope(shaft(), axle, num_points=501)
+    positions = np.linspace(-0.2, 1.0, 25)
+    result = envelope.evaluate(positions)
+
+    worst = 0.0
+    for position in positions:
+        beam = shaft()
+        for load in axle:
+            a = position + load.position
+            if 0 <= a <= 1.0:
+                beam.add_load(PointLoad(a, load.magnitude, direction=direction))
+        deflection = Solver(beam, num_points=501).solve()['deflection']
+        assert np.all(deflection <= result['deflection_max'] + 1e-15)
+        assert np.all(deflection >= result['deflection_min'] - 1e-15)
+        worst = max(worst, np.abs(deflection).max())
+    assert abs(result['critical']['deflection']['value']) == pytest.approx(worst, rel=1e-12)
+
+
+def test_influence_line_is_reciprocal():
+    # Maxwell: deflection at b from a unit load at a equals deflection at a from one at b
+    beam = Beam(1.0, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}})
+    envelope = MovingLoadEnvelope(beam, [PointLoad(0.0, 1.0)], num_points=1001, include_static=False)
+    positions, at_b = envelope.influence_line(0.7, positions=[0.2])
+    _, at_a = envelope.influence_line(0.2, positions=[0.7])
+    assert at_b[0] == pytest.approx(at_a[0], rel=1e-9)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.solver import Solver
+from deflection_tool.scenarios.shaft_gears import ShaftWithGears
+
+
+def shaft():
+    return Beam(0.4, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.035}})
+
+
+def test_spur_gear_forces():
+    gears = ShaftWithGears(shaft())
+    forces = gears.calculate_gear_loads([{'position': 0.1, 'diameter': 100, 'thickness': 20,
+                                          'power': 5000, 'speed': 1500, 'mass': 0.0}])
+    torque = 5000 / (2 * np.pi * 1500 / 60)
+    assert forces['torque'][0] == pytest.approx(torque)
+    assert forces['tangential'][0] == pytest.approx(torque / 0.05)
+    assert forces['radial'][0] == pytest.approx(torque / 0.05 * np.tan(np.radians(20)))
+    # Mesh point on +y: the radial force is along -y, the tangential one along +z
+    assert forces['force_y'][0] == pytest.approx(-forces['radial'][0])
+    assert forces['force_z'][0] == pytest.approx(forces['tangential'][0])
+
+
+def test_table_and_list_inputs_agree():
+    rows = [{'position': 0.1, 'diameter': 100, 'thickness': 20, 'torque': 30, 'helix_angle': 15},
+            {'position': 0.3, 'diameter': 60, 'thickness': 15, 'torque': -30, 'mesh_angle': 90}]
+    columns = {key: [row.get(key, default) for row in rows]
+               for key, default in (('position', 0), ('diameter', 0), ('thickness', 0), ('torque', np.nan),
+                                    ('helix_angle', 0.0), ('mesh_angle', 0.0))}
+    from_rows = ShaftWithGears(shaft()).calculate_gear_loads(rows)
+    from_columns = ShaftWithGears(shaft()).calculate_gear_loads(columns)
+    for key, values in from_rows.items():
+        np.testing.assert_allclose(values, from_columns[key])
+
+
+def test_gear_shaft_solve_matches_solver():
+    gears = ShaftWithGears(shaft())
+    gears.calculate_gear_loads([{'position': 0.1, 'diameter': 100, 'thickness': 20, 'torque': 30},
+                                {'position': 0.3, 'diameter': 60, 'thickness': 15, 'torque': -30,
+                                 'mesh_angle': 90}])
+    planes = gears.solve(num_points=501)
+    results = Solver(gears.beam, num_points=501).solve()
+    np.testing.assert_allclose(planes['deflection_planes'], results['deflection_planes'],
+                               atol=1e-12 * np.abs(results['deflection']).max())
+    np.testing.assert_allclose(planes['deflection'], results['deflection'],
+                               atol=1e-12 * np.abs(results['deflection']).max())
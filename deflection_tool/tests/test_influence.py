@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.loads import PointLoad, MomentLoad, TorsionLoad, AxialLoad
+from deflection_tool.core.solver import Solver
+from deflection_tool.core.influence import influence_for, geometry_key, clear_cache
+
+STEPPED = [{'end': 0.05, 'type': 'circular', 'dimensions': {'diameter': 0.025}},
+           {'end': 0.2, 'type': 'circular', 'dimensions': {'diameter': 0.035}},
+           {'end': 0.3, 'type': 'circular', 'dimensions': {'diameter': 0.025}}]
+
+
+def loads():
+    return [PointLoad(0.12, -2000), MomentLoad(0.27, 50), TorsionLoad(0.12, 100), AxialLoad(0.25, 1000)]
+
+
+@pytest.mark.parametrize('profile', [STEPPED, {'type': 'circular', 'dimensions': {'diameter': 0.03}}],
+                         ids=['stepped', 'uniform'])
+def test_influence_matches_solver(profile):
+    clear_cache()
+    beam = Beam(0.3, 'AISI4140', profile)
+    beam.loads = loads()
+    solver = Solver(beam, num_points=301)
+    # Loads sit on grid nodes, so the influence matrices are exact
+    expected = {field: np.copy(value) for field, value in solver.solve().items()}
+    results = influence_for(solver).evaluate(beam.loads)
+    for field in ('deflection', 'slope', 'twist', 'elongation'):
+        np.testing.assert_allclose(results[field], expected[field], rtol=1e-9,
+                                   atol=1e-12 * np.abs(expected[field]).max())
+
+
+def test_geometry_key_tells_segments_apart():
+    x = np.linspace(0, 0.3, 11)
+    uniform = Beam(0.3, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.025}})
+    stepped = Beam(0.3, 'AISI4140', STEPPED)
+    assert geometry_key(uniform, x) != geometry_key(stepped, x)
+
+
+def test_cached_matrices_ignore_later_edits_of_their_beam():
+    clear_cache()
+    profile = {'type': 'circular', 'dimensions': {'diameter': 0.03}}
+    first = Beam(0.3, 'AISI4140', profile)
+    second = Beam(0.3, 'AISI4140', profile)
+    second.loads = loads()
+    first_influence = influence_for(Solver(first, num_points=301))
+
+    # Edit the beam the cache entry was created from before any matrix is built
+    first.profile = {'type': 'circular', 'dimensions': {'diameter': 0.01}}
+    first.length = 0.5
+
+    solver = Solver(second, num_points=301)
+    influence = influence_for(solver)
+    assert influence is first_influence
+    expected = solver.solve()
+    results = influence.evaluate(second.loads)
+    for field in ('deflection', 'twist'):
+        np.testing.assert_allclose(results[field], expected[field], rtol=1e-9)
+
+
+def test_influence_keeps_bending_planes_apart():
+    clear_cache()
+    beam = Beam(0.3, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}})
+    beam.loads = loads() + [PointLoad(0.18, 1500, direction='z'), MomentLoad(0.09, -40, axis='y')]
+    solver = Solver(beam, num_points=301)
+    expected = {field: np.copy(value) for field, value in solver.solve().items()}
+    influence = influence_for(solver)
+    results = influence.evaluate(beam.loads)
+    for field in ('deflection', 'slope', 'deflection_planes', 'slope_planes'):
+        np.testing.assert_allclose(results[field], expected[field], rtol=1e-9,
+                                   atol=1e-12 * np.abs(expected[field]).max())
+
+    # A y-only case next to it keeps its signed deflection
+    batch = influence.evaluate_batch([beam.loads, loads()])
+    beam.loads = loads()
+    np.testing.assert_allclose(batch['deflection'][1], Solver(beam, num_points=301).solve()['deflection'],
+                               rtol=1e-9, atol=1e-12 * np.abs(expected['deflection']).max())
+    with pytest.raises(ValueError, match='x-z'):
+        influence.compile([PointLoad(0.18, 1500, direction='z')])
@@ -0,0 +1,41 @@
+import pytest
+
+from deflection_tool.core.materials import Material, registry
+
+
+def test_registry_is_loaded_once():
+    assert registry() is registry()
+
+
+def test_material_gets_its_own_copy():
+    first = Material('AISI4140')
+    first.properties['E'] = 1.0
+    assert Material('AISI4140').E != 1.0
+
+
+def test_property_arrays_follow_names():
+    reg = registry()
+    arrays = reg.property_arrays()
+    for i, name in enumerate(reg.names):
+        assert arrays['E'][i] == Material(name).E
+
+
+def test_select_filters_and_sorts():
+    reg = registry()
+    steels = [name for name in reg.names if Material(name).properties.get('type') == 'steel']
+    assert len(steels) > 1
+    for threshold in sorted(Material(name).yield_strength for name in steels):
+        expected = [name for name in steels if Material(name).yield_strength >= threshold]
+        expected.sort(key=lambda name: Material(name).E / Material(name).rho, reverse=True)
+        selected = reg.select('steel', {'yield_strength': (threshold, None)},
+                              sort_by=lambda p: p['E'] / p['rho'], descending=True)
+        assert selected == expected
+        assert reg.select('steel', {'yield_strength': (threshold, None)}, sort_by='yield_strength') == \
+            sorted(expected, key=lambda name: Material(name).yield_strength)
+    assert reg.select('steel', {'yield_strength': (1e15, None)}) == []
+    assert reg.select('no such type') == []
+
+
+def test_unknown_material_is_an_error():
+    with pytest.raises((KeyError, ValueError)):
+        Material('Unobtainium')
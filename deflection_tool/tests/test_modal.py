@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.modal import ModalAnalysis
+
+
+def shaft(length=1.0):
+    return Beam(length, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}})
+
+
+def first_bending_rpm(beam):
+    # Simply supported uniform shaft: w1 = (pi / L)^2 sqrt(EI / rho A)
+    omega = (np.pi / beam.length)**2 * np.sqrt(beam.E * beam.I / (beam.material.rho * beam.profile.A))
+    return omega * 60 / (2 * np.pi)
+
+
+@pytest.mark.parametrize('length', [1.0, 0.1])
+def test_bending_converges_to_closed_form(length):
+    beam = shaft(length)
+    expected = first_bending_rpm(beam)
+    errors = [abs(ModalAnalysis(beam, num_elements=n).bending_modes(1)['critical_speed_rpm'][0] / expected - 1)
+              for n in (10, 20, 50, 200, 1000)]
+    assert errors[0] > errors[1] > errors[2]
+    # Round-off stays small up to the largest accepted mesh
+    assert max(errors[2:]) < 1e-5
+
+
+def test_too_fine_mesh_is_rejected():
+    with pytest.raises(ValueError, match='num_elements'):
+        ModalAnalysis(shaft(), num_elements=20000)
+
+
+def test_mass_on_a_grid_point_matches_a_nearby_mass():
+    # 0.7 lands within round-off of the uniform node 0.7000000000000001
+    speeds = [ModalAnalysis(shaft(), masses=[{'position': a, 'mass': 5.0, 'diameter': 100}]).critical_speeds(1)
+              for a in (0.7, 0.7 + 1e-6)]
+    assert speeds[0]['bending_rpm'][0] == pytest.approx(speeds[1]['bending_rpm'][0], rel=1e-4)
+    assert speeds[0]['torsional_rpm'][0] == pytest.approx(speeds[1]['torsional_rpm'][0], rel=1e-4)
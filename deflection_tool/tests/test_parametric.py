@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.expressions import compile_expression
+from deflection_tool.core.loads import DistributedLoad, ParametricLoad
+from deflection_tool.core.solver import Solver
+
+SUPPORTS = [{'type': 'simple', 'position': 0.0}, {'type': 'simple', 'position': 1.0}]
+
+
+def beam_with(load):
+    beam = Beam(1.0, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}}, supports=SUPPORTS)
+    beam.loads = [load]
+    return beam
+
+
+@pytest.mark.parametrize('engine', ['numerical', 'fem'])
+def test_constant_expression_matches_distributed_load(engine):
+    expected = Solver(beam_with(DistributedLoad(0.2, 0.7, -2000)), engine='analytic').solve()
+    results = Solver(beam_with(ParametricLoad(0.2, 0.7, '-2000')), engine=engine).solve()
+    values = np.interp(expected['x'], results['x'], results['deflection'])
+    np.testing.assert_allclose(values, expected['deflection'], atol=1e-5 * np.abs(expected['deflection']).max())
+
+
+def test_linear_expression_matches_closed_form():
+    # Triangular load q = q0 x / L over the span: v(L/2) = 5 q0 L^4 / (768 EI)
+    q0 = -3000.0
+    beam = beam_with(ParametricLoad(0.0, 1.0, f'{q0}*x'))
+    results = Solver(beam, num_points=2001).solve()
+    expected = -5 * q0 / (768 * beam.E * beam.I)
+    assert abs(results['deflection'][1000]) == pytest.approx(abs(expected), rel=1e-5)
+
+
+def test_edited_expression_is_recompiled():
+    load = ParametricLoad(0.0, 1.0, '-1000')
+    solver = Solver(beam_with(load), num_points=501)
+    first = solver.solve()['deflection'].copy()
+    load.function_string = '-2000'
+    np.testing.assert_allclose(solver.solve()['deflection'], 2 * first)
+
+
+def test_literal_powers_overflow_instead_of_hanging():
+    x = np.linspace(0, 1, 5)
+    with np.errstate(over='ignore'):
+        assert np.all(np.isinf(compile_expression('9**9**9')(x, 1.0)))
+        assert np.all(np.isinf(compile_expression('-(x + 1)*10**10**10')(x, 1.0)))
+    # Integer literals still evaluate as plain numbers
+    np.testing.assert_array_equal(compile_expression('7 // 2 + 2**3')(x, 1.0), 11.0)
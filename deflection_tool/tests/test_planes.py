@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.loads import PointLoad
+from deflection_tool.core.solver import Solver
+
+L = 1.0
+SUPPORTS = [{'type': 'simple', 'position': 0.0}, {'type': 'simple', 'position': L}]
+
+
+def orthogonal_beam():
+    beam = Beam(L, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}}, supports=SUPPORTS)
+    beam.add_load(PointLoad(L / 2, -3000, direction='y'))
+    beam.add_load(PointLoad(L / 2, 4000, direction='z'))
+    return beam
+
+
+def midspan_deflection(beam, P):
+    return P * L**3 / (48 * beam.material.E * beam.profile.I)
+
+
+@pytest.mark.parametrize('engine', ['numerical', 'analytic', 'fem'])
+def test_resultant_of_orthogonal_point_loads(engine):
+    beam = orthogonal_beam()
+    solver = Solver(beam, num_points=1001, engine=engine)
+    results = solver.solve()
+    expected = midspan_deflection(beam, 5000)
+
+    summary = solver.summary()
+    assert summary['deflection']['max'] == pytest.approx(expected, rel=1e-4)
+    assert summary['deflection']['x'] == pytest.approx(L / 2, abs=1e-3)
+
+    y, z = results['deflection_planes']
+    assert np.abs(y).max() == pytest.approx(midspan_deflection(beam, 3000), rel=1e-4)
+    assert np.abs(z).max() == pytest.approx(midspan_deflection(beam, 4000), rel=1e-4)
+    np.testing.assert_allclose(results['deflection'], np.hypot(y, z))
+
+
+def test_solve_matches_solve_planes():
+    beam = orthogonal_beam()
+    solver = Solver(beam, num_points=501)
+    results = {key: np.copy(value) for key, value in solver.solve().items()}
+    planes = solver.solve_planes()
+    for field in ('deflection', 'slope', 'deflection_planes', 'slope_planes'):
+        np.testing.assert_allclose(results[field], planes[field], rtol=1e-12, atol=1e-15)
+
+
+def test_workspace_and_incremental_keep_planes():
+    beam = orthogonal_beam()
+    solver = Solver(beam, num_points=501, workspace=True)
+    solver.solve()
+    beam.loads[1].magnitude = -4000
+    results = solver.solve()
+    fresh = Solver(beam, num_points=501).solve()
+    np.testing.assert_allclose(results['deflection'], fresh['deflection'], rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(results['deflection_planes'], fresh['deflection_planes'], rtol=1e-12, atol=1e-15)
+
+
+def test_single_plane_has_no_planes():
+    beam = orthogonal_beam()
+    del beam.loads[1]
+    beam.loads[0].magnitude = 3000
+    results = Solver(beam, num_points=101).solve()
+    assert 'deflection_planes' not in results
+    # Signed y deflection, not a resultant magnitude
+    assert results['deflection'].min() < 0
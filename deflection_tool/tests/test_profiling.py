@@ -0,0 +1,29 @@
+import json
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.loads import PointLoad, TorsionLoad
+from deflection_tool.core.profiling import ProfileStats
+from deflection_tool.core.solver import Solver
+
+
+def test_solver_phases_are_recorded():
+    beam = Beam(1.0, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}})
+    beam.loads = [PointLoad(0.3, -1000), PointLoad(0.6, 500), TorsionLoad(0.5, 20)]
+    profiler = ProfileStats(track_memory=True)
+    Solver(beam, profiler=profiler).solve()
+    phases = profiler.phases
+    for name in ('solve', 'aggregate_loads', 'solve_bending', 'solve_torsion', 'solve_axial'):
+        assert phases[name]['calls'] == 1
+    assert phases['load.point']['calls'] == 2
+    assert phases['solve']['total_s'] >= phases['solve_bending']['total_s']
+    assert phases['solve']['peak_bytes'] > 0
+
+
+def test_merge_sums_calls_and_times():
+    first, second = ProfileStats(), ProfileStats()
+    first.record('solve', 0.5)
+    second.record('solve', 0.25, calls=2)
+    merged = first.merge(json.loads(second.to_json()))
+    assert merged.phases['solve']['calls'] == 3
+    assert merged.phases['solve']['total_s'] == 0.75
+    assert merged.phases['solve']['max_s'] == 0.5
@@ -0,0 +1,46 @@
+import numpy as np
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.loads import PointLoad, DistributedLoad, MomentLoad, TorsionLoad, AxialLoad, ParametricLoad
+from deflection_tool.core.solver import Solver
+from deflection_tool.core.stress import StressAnalysis
+
+
+def test_batch_matches_one_solve_per_case():
+    beam = Beam(1.0, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}})
+    cases = [
+        [PointLoad(0.3, -1000), TorsionLoad(0.5, 50)],
+        [DistributedLoad(0.2, 0.7, -2000), MomentLoad(0.6, 80), AxialLoad(0.4, 500)],
+        [ParametricLoad(0.1, 0.9, '-1000*x'), PointLoad(0.8, 300)],
+        [],
+    ]
+    solver = Solver(beam, num_points=401)
+    batch = solver.solve_batch(cases)
+    for i, loads in enumerate(cases):
+        beam.loads = loads
+        expected = Solver(beam, num_points=401).solve()
+        for field in ('deflection', 'slope', 'twist', 'elongation'):
+            scale = max(np.abs(expected[field]).max(), 1e-30)
+            np.testing.assert_allclose(batch[field][i], expected[field], rtol=0, atol=1e-12 * scale)
+
+
+def test_batch_keeps_bending_planes_apart():
+    beam = Beam(1.0, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}})
+    cases = [
+        [PointLoad(0.3, -1000), PointLoad(0.6, 800, direction='z'), MomentLoad(0.4, 60, axis='y')],
+        [DistributedLoad(0.2, 0.7, -2000), MomentLoad(0.6, 80)],
+    ]
+    batch = Solver(beam, num_points=401).solve_batch(cases)
+    stresses = StressAnalysis(beam).from_batch(batch)
+    for i, loads in enumerate(cases):
+        beam.loads = loads
+        solver = Solver(beam, num_points=401)
+        expected = solver.solve()
+        for field in ('deflection', 'slope'):
+            scale = np.abs(expected[field]).max()
+            np.testing.assert_allclose(batch[field][i], expected[field], rtol=0, atol=1e-12 * scale)
+        if 'deflection_planes' in expected:
+            np.testing.assert_allclose(batch['deflection_planes'][:, i], expected['deflection_planes'],
+                                       rtol=0, atol=1e-12 * np.abs(expected['deflection']).max())
+        von_mises = StressAnalysis(beam).from_solver(solver)['von_mises']
+        np.testing.assert_allclose(stresses['von_mises'][i], von_mises, rtol=1e-9)
@@ -0,0 +1,68 @@
+import os
+
+import numpy as np
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.loads import PointLoad, TorsionLoad, AxialLoad
+from deflection_tool.core.solver import Solver
+from deflection_tool.core.uncertainty import MonteCarloAnalysis
+from deflection_tool.interface.input_parser import InputParser
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'examples')
+SEGMENTS = [{'end': 0.05, 'type': 'circular', 'dimensions': {'diameter': 0.025}},
+            {'end': 0.2, 'type': 'circular', 'dimensions': {'diameter': 0.035}},
+            {'end': 0.3, 'type': 'circular', 'dimensions': {'diameter': 0.025}}]
+
+
+def stepped(loads):
+    beam = Beam(0.3, 'AISI4140', SEGMENTS)
+    beam.loads = loads
+    return beam
+
+
+def test_twist_and_elongation_follow_the_segments():
+    beam = stepped([TorsionLoad(0.3, 100), AxialLoad(0.3, 1000)])
+    results = Solver(beam, num_points=301).solve()
+    compliance = sum((end - start) / section.J for start, end, section in beam.segments)
+    assert results['twist'][-1] == pytest.approx(100 * compliance / beam.G, rel=1e-9)
+    axial = sum((end - start) / section.A for start, end, section in beam.segments)
+    assert results['elongation'][-1] == pytest.approx(1000 * axial / beam.E, rel=1e-9)
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_numerical_matches_fem(dtype):
+    beam = stepped([PointLoad(0.12, -2000), PointLoad(0.27, 500)])
+    fem = Solver(beam, engine='fem').solve()
+    results = Solver(beam, num_points=2001, dtype=dtype).solve()
+    values = np.interp(fem['x'], results['x'].astype(float), results['deflection'])
+    np.testing.assert_allclose(values, fem['deflection'], atol=1e-5 * np.abs(fem['deflection']).max())
+
+
+def test_step_nodes_are_on_the_grid():
+    solver = Solver(stepped([PointLoad(0.12, -2000)]), num_points=1000)
+    for step in (0.05, 0.2):
+        i = np.searchsorted(solver.x, step)
+        assert solver.x[i] == step and solver.x[i + 1] == np.nextafter(step, 1.0)
+
+
+def test_stepped_example_parses_every_segment():
+    beam = InputParser.parse_json(os.path.join(EXAMPLES, 'stepped_shaft.json'))
+    assert beam.steps == [0.05, 0.2]
+    assert [section.dimensions['diameter'] for _, _, section in beam.segments] == [0.025, 0.035, 0.025]
+    with pytest.raises(ValueError, match='stepped'):
+        Solver(beam, engine='analytic').solve()
+    with pytest.raises(ValueError, match='stepped'):
+        MonteCarloAnalysis(beam, {'loads.0.magnitude': {'cov': 0.1}})
+
+
+@pytest.mark.parametrize('ends, message', [([0.05, 0.4, 0.5], 'increase strictly'),
+                                           ([0.2, 0.05, 0.3], 'increase strictly'),
+                                           ([0.05, 0.05, 0.3], 'increase strictly'),
+                                           ([0.0, 0.2, 0.3], 'increase strictly'),
+                                           ([0.05, 0.2, 0.25], 'last segment'),
+                                           ([0.05, 0.2, 0.35], 'last segment')])
+def test_bad_segment_ends_are_rejected(ends, message):
+    segments = [dict(segment, end=end) for segment, end in zip(SEGMENTS, ends)]
+    with pytest.raises(ValueError, match=message):
+        Beam(0.3, 'AISI4140', segments)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.loads import PointLoad
+from deflection_tool.core.solver import Solver
+from deflection_tool.interface.store import ResultsStore, STORE_FIELDS
+
+
+def results_for(diameter):
+    beam = Beam(1.0, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': diameter}})
+    beam.loads = [PointLoad(0.4, -1000)]
+    return {field: np.copy(value) for field, value in Solver(beam, num_points=101).solve().items()}
+
+
+def test_round_trip_and_resume(tmp_path):
+    path = str(tmp_path / 'sweep.store')
+    diameters = [0.02, 0.03, 0.04]
+    with ResultsStore.create(path, num_points=101, chunk_runs=2) as store:
+        for run_id, d in enumerate(diameters[:2]):
+            store.append(results_for(d), params={'diameter': d}, run_id=run_id)
+        store.append(None, run_id=99, error='failed')
+    with ResultsStore(path, mode='a') as store:
+        store.append(results_for(diameters[2]), params={'diameter': diameters[2]}, run_id=2)
+
+    store = ResultsStore(path)
+    assert len(store) == 4
+    assert store.done() == {0, 1, 2, 99}
+    for run_id, d in enumerate(diameters):
+        run = store.run(run_id)
+        assert run['entry']['params'] == {'diameter': d}
+        for field in STORE_FIELDS:
+            np.testing.assert_array_equal(run[field], results_for(d)[field])
+    np.testing.assert_array_equal(store.station('deflection', 40),
+                                  [results_for(d)['deflection'][40] for d in diameters])
+    assert store.index[2]['error'] == 'failed'
+    with pytest.raises(KeyError):
+        store.run(99)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.loads import PointLoad, TorsionLoad
+from deflection_tool.core.solver import Solver
+from deflection_tool.core.stress import StressAnalysis
+
+L = 1.0
+D = 0.03
+SUPPORTS = [{'type': 'simple', 'position': 0.0}, {'type': 'simple', 'position': L}]
+
+
+def two_plane_beam():
+    beam = Beam(L, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': D}}, supports=SUPPORTS)
+    beam.add_load(PointLoad(L / 2, -3000, direction='y'))
+    beam.add_load(PointLoad(L / 2, 4000, direction='z'))
+    beam.add_load(TorsionLoad(L, 200))
+    return beam
+
+
+@pytest.mark.parametrize('engine', ['numerical', 'analytic', 'fem'])
+def test_two_plane_bending_stress(engine):
+    solver = Solver(two_plane_beam(), num_points=1001, engine=engine)
+    stresses = StressAnalysis(solver.beam).from_solver(solver)
+    x = stresses['x']
+
+    # Resultant load 5 kN at midspan: M = P x / 2 left of the load, V = P / 2
+    P = 5000.0
+    i = np.searchsorted(x, 0.25)
+    M = P * x[i] / 2
+    assert stresses['bending'][i] == pytest.approx(32 * M / (np.pi * D**3), rel=1e-6)
+    assert stresses['transverse_shear'][i] == pytest.approx(4 / 3 * (P / 2) / (np.pi * D**2 / 4), rel=1e-6)
+
+    # Peak at midspan: M = P L / 4 = 1250 N m, T = 200 N m all along
+    sigma = 32 * (P * L / 4) / (np.pi * D**3)
+    tau = 16 * 200 / (np.pi * D**3)
+    assert stresses['von_mises'].max() == pytest.approx(np.sqrt(sigma**2 + 3 * tau**2), rel=1e-3)
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.loads import PointLoad, MomentLoad, TorsionLoad, AxialLoad
+from deflection_tool.core.results import extremum
+from deflection_tool.core.solver import Solver
+from deflection_tool.interface.batch import summarize, summary_solver
+
+SUPPORTS = [{'type': 'simple', 'position': 0.0}, {'type': 'simple', 'position': 1.0}]
+
+
+def beam():
+    beam = Beam(1.0, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}}, supports=SUPPORTS)
+    beam.loads = [PointLoad(0.3, -1500), MomentLoad(0.8, -200), TorsionLoad(0.6, 80), AxialLoad(0.5, 1000)]
+    return beam
+
+
+@pytest.mark.parametrize('engine', ['numerical', 'fem'])
+def test_summary_is_extremum_of_solve(engine):
+    summary = Solver(beam(), engine=engine).summary()
+    results = Solver(beam(), engine=engine).solve()
+    for field in ('deflection', 'slope', 'twist', 'elongation'):
+        assert summary[field] == extremum(results[field], results['x'])
+
+
+def test_analytic_extrema_match_fine_profile():
+    summary = Solver(beam(), engine='analytic').summary()
+    results = Solver(beam(), num_points=100001, engine='analytic').solve()
+    for field in ('deflection', 'slope', 'twist', 'elongation'):
+        fine = extremum(results[field], results['x'])
+        assert summary[field]['value'] == pytest.approx(fine['value'], rel=1e-8)
+        assert summary[field]['x'] == pytest.approx(fine['x'], abs=1e-4)
+
+
+def test_lazy_results_compute_only_what_is_read():
+    solver = Solver(beam())
+    lazy = solver.solve_lazy()
+    twist = lazy['twist']
+    assert lazy.computed() == ['twist']
+    np.testing.assert_allclose(twist, Solver(beam()).solve()['twist'])
+
+
+def test_summary_runs_reuse_the_grid_buffers():
+    solver = summary_solver(beam())
+    fields = ('deflection', 'slope', 'twist', 'elongation')
+    buffers = [getattr(solver, field) for field in fields]
+    first = summarize(solver)
+    assert summarize(solver) == first
+    # Integrated in place: no profile was allocated by either summary
+    assert all(getattr(solver, field) is buffer for field, buffer in zip(fields, buffers))
+    full = summarize(Solver(beam()), Solver(beam()).solve())
+    assert first == pytest.approx(full, rel=1e-12)
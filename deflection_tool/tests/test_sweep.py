@@ -0,0 +1,73 @@
+import copy
+
+import numpy as np
+import pytest
+
+from deflection_tool.core.solver import Solver
+from deflection_tool.interface.input_parser import InputParser
+from deflection_tool.interface.store import ResultsStore, STORE_FIELDS
+from deflection_tool.interface.sweep import get_path, set_path, run_sweep, StoreSink
+
+CONFIG = {
+    'material': 'AISI4140',
+    'geometry': {'length': 1.0, 'cross_section': 'circular', 'dimensions': {'diameter': 0.03}},
+    'loads': [{'type': 'point_load', 'position': 0.5, 'magnitude': -1000}],
+}
+
+
+def test_set_path_updates_existing_keys():
+    config = {'geometry': {'dimensions': {'diameter': 0.03}}, 'loads': [{'position': 0.5}]}
+    set_path(config, 'geometry.dimensions.diameter', 0.04)
+    set_path(config, 'loads.0.position', 0.2)
+    assert get_path(config, 'geometry.dimensions.diameter') == 0.04
+    assert config['loads'][0]['position'] == 0.2
+
+
+@pytest.mark.parametrize('path, key', [('geometry.dimensions.diamter', 'diamter'),
+                                       ('geomtry.length', 'geomtry'),
+                                       ('loads.3.position', '3')])
+def test_unknown_path_is_rejected_before_solving(tmp_path, path, key):
+    out = tmp_path / 'sweep.csv'
+    with pytest.raises(ValueError, match=f"no key '{key}'"):
+        run_sweep(CONFIG, {path: [1.0, 2.0]}, str(out), workers=1)
+    assert not out.exists()
+
+
+STEPPED = {
+    'material': 'AISI4140',
+    'geometry': {'length': 0.3, 'segments': [
+        {'end': 0.05, 'cross_section': 'circular', 'dimensions': {'diameter': 0.025}},
+        {'end': 0.2, 'cross_section': 'circular', 'dimensions': {'diameter': 0.035}},
+        {'end': 0.3, 'cross_section': 'circular', 'dimensions': {'diameter': 0.025}}]},
+    'loads': [{'type': 'point_load', 'position': 0.12, 'magnitude': -2000},
+              {'type': 'torsion_load', 'position': 0.12, 'magnitude': 100}],
+}
+
+
+@pytest.mark.parametrize('engine', ['numerical', 'fem'])
+def test_stepped_shaft_store_sweep(tmp_path, engine):
+    path = str(tmp_path / 'sweep.store')
+    values = [-2000, -1000]
+    options = {'num_points': 301, 'engine': engine}
+    assert run_sweep(STEPPED, {'loads.0.magnitude': values}, path, workers=1, solver_options=options) == 2
+
+    store = ResultsStore(path)
+    for run_id, magnitude in enumerate(values):
+        run = store.run(run_id)
+        assert run['entry']['error'] == ''
+        config = copy.deepcopy(STEPPED)
+        config['loads'][0]['magnitude'] = magnitude
+        results = Solver(InputParser.parse_dict(config), **options).solve()
+        np.testing.assert_array_equal(run['x'], np.linspace(0, 0.3, 301))
+        np.testing.assert_allclose(run['deflection'], np.interp(run['x'], results['x'], results['deflection']))
+
+
+def test_rejected_profiles_become_error_rows(tmp_path):
+    path = str(tmp_path / 'sweep.store')
+    sink = StoreSink(path, ['run_id', 'diameter', 'error'], False, num_points=11)
+    sink.write({'run_id': 0, 'diameter': 0.03, 'error': '',
+                'profiles': {name: np.zeros(12) for name in STORE_FIELDS}})
+    sink.close()
+    entry = ResultsStore(path).index[0]
+    assert entry['row'] is None and entry['params'] == {'diameter': 0.03}
+    assert 'Store holds 11 points' in entry['error']
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from deflection_tool.core.beam import Beam
+from deflection_tool.core.loads import PointLoad, DistributedLoad, TorsionLoad, AxialLoad
+from deflection_tool.core.solver import Solver
+
+
+def beam():
+    beam = Beam(1.0, 'AISI4140', {'type': 'circular', 'dimensions': {'diameter': 0.03}})
+    beam.loads = [PointLoad(0.3, -1500), DistributedLoad(0.4, 0.9, -2000), TorsionLoad(0.6, 80),
+                  AxialLoad(0.5, 1000)]
+    return beam
+
+
+def test_workspace_matches_default():
+    expected = Solver(beam(), num_points=1001).solve()
+    solver = Solver(beam(), num_points=1001, workspace=True)
+    first = solver.solve()
+    buffer = first['deflection']
+    results = solver.solve()
+    # Results are written into the same buffers on every solve
+    assert results['deflection'] is buffer
+    for field in ('deflection', 'slope', 'twist', 'elongation'):
+        np.testing.assert_allclose(results[field], expected[field], atol=1e-12 * np.abs(expected[field]).max())
+
+
+def test_float32_is_within_single_precision():
+    expected = Solver(beam(), num_points=1001).solve()
+    results = Solver(beam(), num_points=1001, dtype=np.float32, workspace=True).solve()
+    for field in ('deflection', 'slope', 'twist', 'elongation'):
+        assert results[field].dtype == np.float32
+        np.testing.assert_allclose(results[field], expected[field], atol=1e-5 * np.abs(expected[field]).max())
+
+
+@pytest.mark.parametrize('workspace', [False, True])
+def test_float32_error_does_not_grow_with_the_grid(workspace):
+    n = 10**6
+    expected = Solver(beam(), num_points=n).solve()
+    results = Solver(beam(), num_points=n, dtype=np.float32, workspace=workspace).solve()
+    for field in ('deflection', 'slope', 'twist', 'elongation'):
+        np.testing.assert_allclose(results[field], expected[field], atol=2e-6 * np.abs(expected[field]).max())